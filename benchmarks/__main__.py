@@ -0,0 +1,139 @@
+"""Runs the benchmark suite and compares it against a stored baseline. Run from
+the root of the repository with:
+
+    python -m benchmarks [--filter first_access] [--output results.json]
+
+The run fails with exit status 1 if any case is more than `--threshold`
+slower than in the baseline. Results are scaled by a reference case measured
+alongside them, but baselines still depend on the machine and Python they were
+recorded with, so record a new one with `--save-baseline` before comparing on
+a different machine.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+
+from benchmarks.suite import cases
+from benchmarks.suite import measure
+
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def run(pattern=None, repeat=5, min_time=0.2):
+    """Return the `Measurement` of every case whose name contains the
+    pattern.
+    """
+    measurements = {}
+    for case in cases():
+        if pattern and pattern not in case.name:
+            continue
+        measurements[case.name] = measure(case, repeat=repeat, min_time=min_time)
+        print(f'{case.name:<48}{measurements[case.name].time:>14.1f} ns', flush=True)
+    return measurements
+
+
+def report(measurements):
+    """Return the JSON report of the measurements."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': {name: measurement.time for name, measurement in measurements.items()},
+        'reference': {name: measurement.reference for name, measurement in measurements.items()},
+    }
+
+
+def compare(results, baseline, threshold, min_delta):
+    """Return the `(name, baseline, result)` of every case in a report that's
+    more than `threshold` slower than in the baseline report, and at least
+    `min_delta` nanoseconds slower so that the fastest cases don't fail on
+    noise.
+
+    Results are first scaled by how much faster or slower the reference case
+    ran with them than it did in the baseline.
+    """
+    regressions = []
+    for name, result in results['results'].items():
+        expected = baseline['results'].get(name)
+        if expected is None:
+            continue
+        reference = results['reference'].get(name)
+        expected_reference = baseline.get('reference', {}).get(name)
+        if reference and expected_reference:
+            result *= expected_reference / reference
+        if result > expected * (1 + threshold) and result - expected >= min_delta:
+            regressions.append((name, expected, result))
+    return regressions
+
+
+def _load(path):
+    with open(path) as report_file:
+        return json.load(report_file)
+
+
+def _dump(results, path):
+    with open(path, 'w') as report_file:
+        json.dump(results, report_file, indent=2, sort_keys=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.splitlines()[0])
+    parser.add_argument('--filter', help='only run the cases whose name contains this')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', default=BASELINE, help='the baseline JSON file to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the baseline')
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help='the fraction a case can be slower than its baseline (default 0.5)')
+    parser.add_argument('--min-delta', type=float, default=50.0,
+                        help='the nanoseconds a case has to be slower to fail (default 50)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='the seconds each case runs for (default 0.2)')
+    args = parser.parse_args(argv)
+
+    measurements = run(args.filter, repeat=args.repeat, min_time=args.min_time)
+
+    if args.save_baseline:
+        results = report(measurements)
+        if args.filter and os.path.exists(args.baseline):
+            baseline = _load(args.baseline)
+            baseline['results'].update(results['results'])
+            baseline['reference'].update(results['reference'])
+            results = baseline
+        _dump(results, args.baseline)
+
+    if args.output:
+        _dump(report(measurements), args.output)
+
+    if args.save_baseline:
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f'No baseline at {args.baseline}, record one with --save-baseline.')
+        return 0
+
+    baseline = _load(args.baseline)
+    regressions = compare(report(measurements), baseline, args.threshold, args.min_delta)
+    if regressions:
+        # Cases are measured again before they fail, since a single slow
+        # measurement is more likely to be noise than a regression.
+        print('Measuring the slower cases again.', flush=True)
+        slower = {name for name, _, _ in regressions}
+        for case in cases():
+            if case.name in slower:
+                measurements[case.name] = min(
+                    measurements[case.name],
+                    measure(case, repeat=args.repeat, min_time=args.min_time * 2),
+                    key=lambda measurement: measurement.time / measurement.reference)
+        regressions = compare(report(measurements), baseline, args.threshold, args.min_delta)
+
+    for name, expected, result in regressions:
+        print(f'REGRESSION {name}: {expected:.1f} ns -> {result:.1f} ns '
+              f'({result / expected - 1:+.0%})', file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Measures combining list and dict kwargs with the defaults of a property for
+every `combine_defaults` strategy. Run from the root of the repository with:
+
+    python -m benchmarks.combine
+"""
+import timeit
+
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+
+
+SIZE = 10000
+
+LIST_DEFAULT = [f'default_{index}' for index in range(SIZE)]
+# Half of the kwarg overlaps with the default.
+LIST_KWARG = [f'default_{index}' for index in range(SIZE // 2, SIZE)] + \
+             [f'kwarg_{index}' for index in range(SIZE // 2)]
+
+DICT_DEFAULT = {f'default_{index}': index for index in range(SIZE)}
+DICT_KWARG = {f'kwarg_{index}': index for index in range(SIZE)}
+
+
+class CombineBenchmark(metaclass=SDPropertyMetaclass):
+    list_append_attr      = SDProperty(default=LIST_DEFAULT)
+    list_concatenate_attr = SDProperty(default=LIST_DEFAULT, combine_defaults='concatenate')
+    list_ordered_set_attr = SDProperty(default=LIST_DEFAULT, combine_defaults='ordered_set')
+    dict_update_attr      = SDProperty(default=DICT_DEFAULT)
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+CASES = [
+    ('list_append', 'list_append_attr', LIST_KWARG),
+    ('list_concatenate', 'list_concatenate_attr', LIST_KWARG),
+    ('list_ordered_set', 'list_ordered_set_attr', LIST_KWARG),
+    ('dict_update', 'dict_update_attr', DICT_KWARG),
+]
+
+
+def measure(attr_name, kwarg, number=20, repeat=5):
+    """Return the best time in milliseconds of resolving a combined property
+    on a new instance.
+    """
+    def access():
+        getattr(CombineBenchmark(**{attr_name: kwarg}), attr_name)
+
+    return min(timeit.repeat(access, number=number, repeat=repeat)) / number * 1e3
+
+
+def main():
+    for case, attr_name, kwarg in CASES:
+        print(f'{case:<24}{measure(attr_name, kwarg):>10.3f} ms')
+    print(f'{"default length":<24}{len(LIST_DEFAULT):>10}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Measures the latency of the first access of every property shape in
+`tests/conftest.py`.
+
+Each measurement creates a new instance and reads a single property from it, so
+the cost of resolving the property is always included. Run from the root of the
+repository with:
+
+    python -m benchmarks.first_access
+"""
+import timeit
+
+from tests import conftest
+
+
+SHAPES = [
+    ('basic', conftest.BasicProperties, 'base_attr', {}),
+    ('basic_kwarg', conftest.BasicProperties, 'base_attr', {'base_attr': 'val'}),
+    ('default', conftest.DefaultedProperties, 'default_attr', {}),
+    ('default_kwarg', conftest.DefaultedProperties, 'default_attr', {'default_attr': 'val'}),
+    ('required_kwarg', conftest.RequiredProperties, 'required_attr', {'required_attr': 'val'}),
+    ('defaulted_required', conftest.RequiredProperties, 'defaulted_required_attr', {}),
+    ('dependent', conftest.DependentProperties, 'dependent_attr', {'base_attr': 'val'}),
+    ('updating_dependent', conftest.DependentProperties, 'updating_dependent_attr', {'base_attr': 'val'}),
+    ('sdproperty_superkeys', conftest.DependentProperties, 'sdproperty_dependent_attr',
+     {'base_attr': {'sdproperty_dependent_attr': 'val'}}),
+    ('nested_superkeys', conftest.DependentProperties, 'nested_dependent_attr',
+     {'parent_1': {'parent_2': {'nested_parent_attr': {'nested_dependent_attr': 'val'}}}}),
+    ('dict_combine', conftest.CombineWithDefaultsProperties, 'dict_combine_attr', {'dict_combine_attr': {'key': 'val'}}),
+    ('dict_overwrite', conftest.CombineWithDefaultsProperties, 'dict_overwrite_attr', {'dict_overwrite_attr': {'key': 'val'}}),
+    # The kwarg is already in the default so the combined list doesn't grow.
+    ('list_combine', conftest.CombineWithDefaultsProperties, 'list_combine_attr', {'list_combine_attr': ['elem1']}),
+    ('list_overwrite', conftest.CombineWithDefaultsProperties, 'list_overwrite_attr', {'list_overwrite_attr': ['elem2']}),
+    ('transform', conftest.TransformProperties, 'transform_attr', {'transform_attr': 1}),
+    ('transform_default', conftest.TransformProperties, 'transform_default_attr', {}),
+    ('callback', conftest.CallbackProperties, 'get_callback_attr', {'base_attr': 'val'}),
+    ('callback_kwarg', conftest.CallbackProperties, 'get_callback_attr', {'get_callback_attr': 'val'}),
+    ('inherited_default', conftest.InheritedDefaultedProperties, 'default_attr', {}),
+    ('inherited_dependent', conftest.InheritedDependentProperties, 'child_dependent_attr', {'base_attr': 'val'}),
+    ('inherited_callback', conftest.InheritedCallbackProperties, 'get_callback_attr', {}),
+    ('superkeys', conftest.SuperkeyProperties, 'subkey_attr', {'subkey': {'subkey_attr': 'val'}}),
+    ('multi_superkeys', conftest.SuperkeyProperties, 'multi_subkey_attr',
+     {'subkey_1': {'subkey_2': {'multi_subkey_attr': 'val'}}}),
+    ('validate_regex', conftest.ValidateProperties, 'validate_regex_attr', {'validate_regex_attr': 1}),
+    ('validate_lambda', conftest.ValidateProperties, 'validate_lambda_attr', {'validate_lambda_attr': 1}),
+    ('validate_func', conftest.ValidateProperties, 'validate_func_attr', {'validate_func_attr': 'val'}),
+]
+
+
+def measure(class_object, attr_name, kwargs, number=20000, repeat=5):
+    """Return the best time in nanoseconds of a single first access, with the
+    time it takes to create the instance taken out.
+    """
+    def create():
+        class_object(**kwargs)
+
+    def access():
+        getattr(class_object(**kwargs), attr_name)
+
+    create_time = min(timeit.repeat(create, number=number, repeat=repeat))
+    access_time = min(timeit.repeat(access, number=number, repeat=repeat))
+
+    return (access_time - create_time) / number * 1e9
+
+
+def main():
+    for shape, class_object, attr_name, kwargs in SHAPES:
+        print(f'{shape:<24}{measure(class_object, attr_name, kwargs):>10.1f} ns')
+
+
+if __name__ == '__main__':
+    main()
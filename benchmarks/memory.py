@@ -0,0 +1,119 @@
+"""Measures the memory each materialized instance keeps alive, with and without
+`slots`, `autoseal`, interned values and flyweight instances, for kwargs loaded from a
+large config document of which only a few values are properties. Every
+instance is loaded from an identical copy of the document. Run from the root
+of the repository with:
+
+    python -m benchmarks.memory
+"""
+import gc
+import json
+import tracemalloc
+
+from sdproperty.graph import materialize
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+
+
+INSTANCES = 200
+
+# Most of the document is never read by a property, like the rest of a YAML
+# or JSON file that a class only picks a few settings out of.
+DOCUMENT = json.dumps({
+    'name': 'service',
+    'server': {'host': 'localhost', 'port': 8080,
+               'routes': [{'path': f'/route/{index}', 'methods': ['GET', 'POST']} for index in range(200)]},
+    'logging': {'level': 'info', 'handlers': {f'handler_{index}': {'level': 'debug'} for index in range(100)}},
+})
+
+
+class UnsealedConfigBenchmark(metaclass=SDPropertyMetaclass):
+    name       = SDProperty()
+    host       = SDProperty(default='0.0.0.0', superkeys=['server'])
+    port       = SDProperty(default=80, superkeys=['server'])
+    level      = SDProperty(default='warning', superkeys=['logging'])
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class SlottedConfigBenchmark(metaclass=SDPropertyMetaclass, slots=True):
+    name       = SDProperty()
+    host       = SDProperty(default='0.0.0.0', superkeys=['server'])
+    port       = SDProperty(default=80, superkeys=['server'])
+    level      = SDProperty(default='warning', superkeys=['logging'])
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class SealedConfigBenchmark(metaclass=SDPropertyMetaclass, autoseal=True):
+    name       = SDProperty()
+    host       = SDProperty(default='0.0.0.0', superkeys=['server'])
+    port       = SDProperty(default=80, superkeys=['server'])
+    level      = SDProperty(default='warning', superkeys=['logging'])
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+# The interned and flyweight cases also keep a large part of the document, the
+# routes, as a property, which is what they share between instances.
+class RoutesConfigBenchmark(metaclass=SDPropertyMetaclass, autoseal=True):
+    name       = SDProperty()
+    host       = SDProperty(default='0.0.0.0', superkeys=['server'])
+    port       = SDProperty(default=80, superkeys=['server'])
+    routes     = SDProperty(default=[], superkeys=['server'])
+    level      = SDProperty(default='warning', superkeys=['logging'])
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class InternedConfigBenchmark(metaclass=SDPropertyMetaclass, autoseal=True, interned=True):
+    name       = SDProperty()
+    host       = SDProperty(default='0.0.0.0', superkeys=['server'])
+    port       = SDProperty(default=80, superkeys=['server'])
+    routes     = SDProperty(default=[], superkeys=['server'])
+    level      = SDProperty(default='warning', superkeys=['logging'])
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+CASES = [
+    ('unsealed', UnsealedConfigBenchmark),
+    ('slotted', SlottedConfigBenchmark),
+    ('sealed', SealedConfigBenchmark),
+    ('routes', RoutesConfigBenchmark),
+    ('interned', InternedConfigBenchmark),
+    ('flyweight', RoutesConfigBenchmark.flyweight),
+]
+
+
+def measure(create):
+    """Return the bytes each materialized instance keeps alive, including its
+    kwargs if it still has them.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = []
+    for _ in range(INSTANCES):
+        instance = create(**json.loads(DOCUMENT))
+        materialize(instance)
+        instances.append(instance)
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (end - start) / INSTANCES
+
+
+def main():
+    for case, create in CASES:
+        print(f'{case:<12}{measure(create):>12.0f} bytes per instance')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+"""The benchmark cases for every SDProperty code path.
+
+Every case times a single operation and reports it in nanoseconds, so results
+can be compared between runs and against a stored baseline. Cases are named
+`<group>.<case>`, and the sweeps are named after the size they were run with,
+e.g. `superkeys_depth.16`.
+"""
+import time
+from collections import namedtuple
+
+from benchmarks.first_access import SHAPES
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+from sdproperty.graph import materialize
+from tests import conftest
+
+
+# `prepare(number)` sets up `number` operations (e.g. creates the instances a
+# property is read from), and returns the function that runs them, which is
+# all that's timed. `ops` is the number of operations each of those counts as.
+Case = namedtuple('Case', ['name', 'prepare', 'ops'])
+Case.__new__.__defaults__ = (1,)
+
+SUPERKEYS_DEPTHS = [1, 4, 16]
+SECTION_SIZES = [1, 10, 100]
+KWARGS_SIZES = [10, 1000, 100000]
+COMBINE_SIZES = [10, 100, 1000]
+INHERITANCE_DEPTHS = [1, 4, 16]
+CLASS_SIZES = [1, 10, 50]
+INSTANCE_COUNTS = [100, 1000, 10000]
+
+# The resolved properties that are read again by the cached access cases.
+CACHED_SHAPES = [
+    ('literal_default', conftest.DefaultedProperties, 'default_attr', {}),
+    ('kwarg', conftest.BasicProperties, 'base_attr', {'base_attr': 'val'}),
+    ('callback', conftest.CallbackProperties, 'get_callback_attr', {'base_attr': 'val'}),
+    ('inherited', conftest.InheritedDefaultedProperties, 'default_attr', {}),
+    ('cached_class', conftest.CachedProperties, 'default_attr', {}),
+    ('slotted_class', conftest.SlottedProperties, 'default_attr', {}),
+]
+
+
+def _repeated(func):
+    def prepare(number):
+        def run():
+            for _ in range(number):
+                func()
+        return run
+    return prepare
+
+
+def _first_access(class_object, attr_name, kwargs):
+    def prepare(number):
+        instances = [class_object(**kwargs) for _ in range(number)]
+
+        def run():
+            for instance in instances:
+                getattr(instance, attr_name)
+        return run
+    return prepare
+
+
+def _cached_access(class_object, attr_name, kwargs):
+    instance = class_object(**kwargs)
+    getattr(instance, attr_name)
+    return _repeated(lambda: getattr(instance, attr_name))
+
+
+class KwargsBenchmark(metaclass=SDPropertyMetaclass):
+    base_attr = SDProperty()
+
+    # Takes the kwargs as a dict, so that large kwargs aren't copied for every
+    # instance.
+    def __init__(self, kwargs):
+        self.kwargs = kwargs
+
+
+def _kwargs_access(kwargs):
+    def prepare(number):
+        instances = [KwargsBenchmark(kwargs) for _ in range(number)]
+
+        def run():
+            for instance in instances:
+                instance.base_attr
+        return run
+    return prepare
+
+
+def _nested(keys, value):
+    for key in reversed(keys):
+        value = {key: value}
+    return value
+
+
+def _superkeys_class(depth):
+    keys = [f'key_{index}' for index in range(depth)]
+
+    class SuperkeysBenchmark(metaclass=SDPropertyMetaclass):
+        subkey_attr = SDProperty(superkeys=keys)
+
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    return SuperkeysBenchmark, _nested(keys, {'subkey_attr': 'val'})
+
+
+def _section_class(size):
+    # `size` properties under the same superkeys, as in a section of a config.
+    keys = [f'key_{index}' for index in range(4)]
+    attrs = {'__init__': conftest.BasicProperties.__init__}
+    for index in range(size):
+        attrs[f'section_{index}_attr'] = SDProperty(superkeys=keys)
+    values = {f'section_{index}_attr': index for index in range(size)}
+    return SDPropertyMetaclass('SectionBenchmark', (), attrs), _nested(keys, values)
+
+
+def _read_all(class_object, kwargs):
+    names = list(class_object.__sdproperties__)
+
+    def prepare(number):
+        instances = [class_object(**kwargs) for _ in range(number)]
+
+        def run():
+            for instance in instances:
+                for name in names:
+                    getattr(instance, name)
+        return run
+    return prepare
+
+
+def _combine_class(size):
+    list_default = [f'default_{index}' for index in range(size)]
+    dict_default = {f'default_{index}': index for index in range(size)}
+
+    class CombineBenchmark(metaclass=SDPropertyMetaclass):
+        list_append_attr      = SDProperty(default=list_default)
+        list_concatenate_attr = SDProperty(default=list_default, combine_defaults='concatenate')
+        list_ordered_set_attr = SDProperty(default=list_default, combine_defaults='ordered_set')
+        list_overwrite_attr   = SDProperty(default=list_default, combine_defaults=False)
+        dict_update_attr      = SDProperty(default=dict_default)
+        dict_overlay_attr     = SDProperty(default=dict_default, combine_defaults='overlay')
+        dict_deep_attr        = SDProperty(default=dict_default, combine_defaults='deep')
+
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    # Half of each kwarg overlaps with the default.
+    list_kwarg = list_default[size // 2:] + [f'kwarg_{index}' for index in range(size // 2)]
+    dict_kwarg = {f'default_{index}': -index for index in range(size // 2)}
+    dict_kwarg.update({f'kwarg_{index}': index for index in range(size // 2)})
+    return CombineBenchmark, list_kwarg, dict_kwarg
+
+
+def _inheritance_chain(depth):
+    class Base(metaclass=SDPropertyMetaclass):
+        base_attr    = SDProperty(default='val')
+        derived_attr = SDProperty(default=lambda self: f'{self.base_attr}_derived')
+
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    class_object = Base
+    for index in range(depth):
+        class_object = SDPropertyMetaclass(f'Child{index}', (class_object,), {
+            f'child_{index}_attr': SDProperty(default=index),
+        })
+    return class_object
+
+
+def _class_attrs(size):
+    attrs = {'__init__': conftest.BasicProperties.__init__}
+    for index in range(size):
+        attrs[f'literal_{index}_attr'] = SDProperty(default=index)
+        attrs[f'dependent_{index}_attr'] = SDProperty(
+            default=lambda self, index=index: getattr(self, f'literal_{index}_attr') + 1)
+    return attrs
+
+
+def _create_class(size):
+    # The properties are created again for every class, as they're bound to
+    # the class they're created in.
+    def prepare(number):
+        class_attrs = [_class_attrs(size) for _ in range(number)]
+
+        def run():
+            for attrs in class_attrs:
+                SDPropertyMetaclass('ClassCreationBenchmark', (), attrs)
+        return run
+    return prepare
+
+
+def _create_instances(count):
+    def run():
+        for index in range(count):
+            materialize(conftest.DependentProperties(base_attr={'sdproperty_dependent_attr': index}))
+    return _repeated(run)
+
+
+def cases():
+    """Yield every benchmark case."""
+    for shape, class_object, attr_name, kwargs in SHAPES:
+        yield Case(f'first_access.{shape}', _first_access(class_object, attr_name, kwargs))
+
+    for shape, class_object, attr_name, kwargs in CACHED_SHAPES:
+        yield Case(f'cached_access.{shape}', _cached_access(class_object, attr_name, kwargs))
+
+    for depth in SUPERKEYS_DEPTHS:
+        class_object, kwargs = _superkeys_class(depth)
+        yield Case(f'superkeys_depth.{depth}', _first_access(class_object, 'subkey_attr', kwargs))
+
+    for size in SECTION_SIZES:
+        class_object, kwargs = _section_class(size)
+        yield Case(f'superkeys_section.{size}', _read_all(class_object, kwargs), ops=size)
+
+    for size in KWARGS_SIZES:
+        kwargs = {f'kwarg_{index}': index for index in range(size)}
+        kwargs['base_attr'] = 'val'
+        yield Case(f'kwargs_size.{size}', _kwargs_access(kwargs))
+
+    for size in COMBINE_SIZES:
+        class_object, list_kwarg, dict_kwarg = _combine_class(size)
+        for attr_name in class_object.__sdproperties__:
+            kwarg = list_kwarg if attr_name.startswith('list') else dict_kwarg
+            yield Case(f'combine.{attr_name[:-len("_attr")]}.{size}',
+                       _first_access(class_object, attr_name, {attr_name: kwarg}))
+
+    for depth in INHERITANCE_DEPTHS:
+        yield Case(f'inheritance_depth.{depth}', _first_access(_inheritance_chain(depth), 'derived_attr', {}))
+
+    for size in CLASS_SIZES:
+        yield Case(f'class_creation.{size * 2}', _create_class(size))
+
+    for count in INSTANCE_COUNTS:
+        yield Case(f'materialize_instances.{count}', _create_instances(count), ops=count)
+
+
+class _Reference:
+    # Resolves a value from kwargs the way a property would, without
+    # SDProperty.
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @property
+    def value(self):
+        value = self.kwargs.get('value')
+        if value is not None:
+            self.__dict__['resolved_value'] = value
+        return value
+
+
+# Measured alongside every case, so that results can be scaled by how fast the
+# machine was running when they were measured (e.g. on a shared CI runner).
+REFERENCE = Case('reference', _first_access(_Reference, 'value', {'value': 'val'}))
+
+Measurement = namedtuple('Measurement', ['time', 'reference'])
+
+
+def _time(case, number):
+    run = case.prepare(number)
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def _batch_size(case, batch_time):
+    number = 1
+    while True:
+        elapsed = _time(case, number)
+        if elapsed >= batch_time:
+            return number
+        number = max(number * 2, int(number * batch_time / max(elapsed, 1e-9)))
+
+
+def measure(case, repeat=5, min_time=0.2, batch_time=0.01):
+    """Return the `Measurement` of the best time in nanoseconds of a single
+    operation of a case, and of the reference case measured with it.
+
+    Operations are run in batches that take about `batch_time` seconds, at
+    least `repeat` times and until they've run for `min_time` seconds. Small
+    batches keep the instances they use in the CPU caches, and the minimum of
+    many of them is much less noisy than that of a few long runs. A batch of
+    the reference case is run before every batch of the case.
+    """
+    number = _batch_size(case, batch_time)
+    reference_number = _batch_size(REFERENCE, batch_time)
+
+    best = reference_best = float('inf')
+    total = 0.0
+    runs = 0
+    while runs < repeat or total < min_time:
+        reference_best = min(reference_best, _time(REFERENCE, reference_number))
+        elapsed = _time(case, number)
+        best = min(best, elapsed)
+        total += elapsed
+        runs += 1
+    return Measurement(time=best / number / case.ops * 1e9,
+                       reference=reference_best / reference_number * 1e9)
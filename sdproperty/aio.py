@@ -0,0 +1,41 @@
+"""Resolving properties with async defaults and `@sdproperty` callbacks."""
+import asyncio
+
+
+async def _resolve_async(instance, sdproperty, dependencies):
+    # Wait for everything the property depends on before resolving it.
+    await asyncio.gather(*dependencies)
+
+    if sdproperty.resolver.resolve_async is None or \
+       (sdproperty.singleton and sdproperty.is_resolved(instance)):
+        return getattr(instance, sdproperty.name)
+    return await sdproperty.resolver.resolve_async(instance)
+
+
+async def resolve_async(instance, *names):
+    """Resolve the properties of an instance, or only the given properties and
+    what they depend on, and return their values by name.
+
+    Every property is resolved as soon as the properties it depends on have
+    been, so the async defaults of properties that don't depend on each other
+    are awaited concurrently. The results are stored like any other value, so
+    singletons can be read normally afterwards.
+    """
+    class_object = type(instance)
+    graph = class_object.__sdproperty_graph__
+    order = graph.closure(names) if names else graph.order
+
+    tasks = {}
+    for name in order:
+        dependencies = [tasks[dependency] for dependency in graph.predecessors[name]]
+        tasks[name] = asyncio.ensure_future(
+            _resolve_async(instance, class_object.__sdproperties__[name], dependencies))
+
+    try:
+        values = await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    return dict(zip(tasks, values))
@@ -0,0 +1,84 @@
+"""Creating and resolving many instances of an SDProperty class at once."""
+from collections import namedtuple
+from itertools import islice
+
+from sdproperty.exceptions import RequiredPropertyException
+from sdproperty.exceptions import InvalidPropertyException
+from sdproperty.exceptions import InvalidRecordException
+from sdproperty.exceptions import MismatchedPropertyTypesException
+
+
+RecordError = namedtuple('RecordError', ['index', 'record', 'exception'])
+
+RECORD_EXCEPTIONS = (
+    RequiredPropertyException,
+    InvalidPropertyException,
+    InvalidRecordException,
+    MismatchedPropertyTypesException,
+)
+
+
+def resolve_batch(batch, order, errors=None):
+    """Resolve the properties named in `order` on a batch of
+    `(index, record, instance)` tuples and return the instances that didn't
+    fail.
+
+    The batch is resolved one property at a time, so the same resolver,
+    default, validator and transform are run for every instance in a tight
+    loop. Failed records raise, or are added to `errors` as a `RecordError`
+    and dropped from the batch if it's a list.
+    """
+    for name in order:
+        failed = []
+        for position, (index, record, instance) in enumerate(batch):
+            try:
+                getattr(instance, name)
+            except RECORD_EXCEPTIONS as exception:
+                if errors is None:
+                    raise
+                errors.append(RecordError(index, record, exception))
+                failed.append(position)
+
+        for position in reversed(failed):
+            del batch[position]
+
+    return [instance for _, _, instance in batch]
+
+
+def iter_records(class_object, records, materialize=True, errors=None, batch_size=1000):
+    """Yield an instance of the class for each kwargs dict in `records`.
+
+    `materialize` is either True to resolve every property, an iterable of the
+    names of the properties to resolve (along with their dependencies), or
+    False to only create the instances. Records that fail to resolve raise,
+    unless an `errors` list is passed, in which case a `RecordError` is added
+    to it for each failed record and the record is skipped.
+    """
+    graph = class_object.__sdproperty_graph__
+    if materialize is True:
+        order = graph.order
+    elif materialize:
+        order = graph.closure(materialize)
+    else:
+        order = []
+
+    records = enumerate(records)
+    while True:
+        batch = [(index, record, class_object(**record))
+                 for index, record in islice(records, batch_size)]
+        if not batch:
+            return
+        yield from resolve_batch(batch, order, errors)
+
+
+def from_records(class_object, records, materialize=True, errors=None, lazy=False, batch_size=1000):
+    """Create an instance of the class for each kwargs dict in `records`.
+
+    Returns a list, or a generator if `lazy` is set. See `iter_records` for
+    the other arguments.
+    """
+    instances = iter_records(class_object, records, materialize, errors, batch_size)
+    if lazy:
+        return instances
+
+    return list(instances)
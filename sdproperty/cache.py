@@ -0,0 +1,275 @@
+"""Caches for the results of property defaults and transforms that are shared
+between instances.
+
+A cache is any object with `get(key, default)` and `set(key, value)` methods.
+Keys are tuples of the class path, the property name, 'default' or 'transform'
+and the frozen values the result was computed from (see
+`sdproperty.utils.freeze`).
+"""
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from sdproperty.utils import freeze
+
+
+# Returned by `get` when a key isn't cached.
+MISSING = object()
+
+
+class LRUCache:
+    """An in-memory cache that evicts the least recently used result once it
+    holds `maxsize` results, and counts its hits, misses and evictions.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            try:
+                value = self._results[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._results.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._results[key] = value
+            self._results.move_to_end(key)
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+    def stats(self):
+        # Taken under the lock, so the counts are from the same moment.
+        with self._lock:
+            return {
+                'size': len(self._results),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def __len__(self):
+        return len(self._results)
+
+
+def _fingerprint(value):
+    # A digest of a frozen value that's the same in every process. Sets are
+    # hashed in sorted order, since their iteration order depends on the hash
+    # seed of the process.
+    if isinstance(value, frozenset):
+        parts = sorted(_fingerprint(element) for element in value)
+        return hashlib.sha256(b'set' + b''.join(parts)).digest()
+    if isinstance(value, tuple):
+        parts = [_fingerprint(element) for element in value]
+        return hashlib.sha256(b'tuple' + b''.join(parts)).digest()
+    try:
+        return hashlib.sha256(pickle.dumps(value, protocol=4)).digest()
+    except (pickle.PicklingError, AttributeError) as error:
+        raise TypeError(f'{value!r} can\'t be pickled') from error
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    class_path  TEXT NOT NULL,
+    property    TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    inputs_hash TEXT NOT NULL,
+    version     TEXT NOT NULL,
+    value       BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    accessed    REAL NOT NULL,
+    PRIMARY KEY (class_path, property, kind, inputs_hash, version)
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+
+class SQLiteCache:
+    """A cache that persists results in an SQLite database, so that they
+    survive restarts and are shared between the processes on a host.
+
+    Results are keyed by the class, the property, a hash of the values they
+    were computed from and `version`, which should be changed whenever the
+    code computing them changes. Once the pickled results take up more than
+    `max_bytes` the least recently used are evicted.
+    """
+
+    def __init__(self, path, version='', max_bytes=64 * 1024 * 1024, timeout=30.0):
+        self.path = path
+        self.version = str(version)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._local = threading.local()
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self):
+        # Connections can't be shared between threads, or with a forked child.
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _row_key(self, key):
+        class_path, name, kind, values = key
+        return (class_path, name, kind, _fingerprint(values).hex(), self.version)
+
+    def get(self, key, default=MISSING):
+        try:
+            row_key = self._row_key(key)
+        except TypeError:
+            self.misses += 1
+            return default
+
+        connection = self._connection()
+        row = connection.execute(
+            'SELECT value FROM results WHERE class_path = ? AND property = ? AND kind = ? '
+            'AND inputs_hash = ? AND version = ?', row_key).fetchone()
+        if row is None:
+            self.misses += 1
+            return default
+
+        try:
+            connection.execute(
+                'UPDATE results SET accessed = ? WHERE class_path = ? AND property = ? '
+                'AND kind = ? AND inputs_hash = ? AND version = ?', (time.time(),) + row_key)
+        except sqlite3.OperationalError:
+            # Another process holds the lock, the result is just evicted sooner.
+            pass
+        self.hits += 1
+        return pickle.loads(row[0])
+
+    def set(self, key, value):
+        try:
+            row_key = self._row_key(key)
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (TypeError, pickle.PicklingError, AttributeError):
+            # Results that can't be pickled are just not persisted.
+            return
+
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.execute(
+                'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                row_key + (data, len(data), time.time()))
+            self._evict(connection)
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def _evict(self, connection):
+        total, = connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = connection.execute('SELECT rowid, size FROM results ORDER BY accessed').fetchall()
+        evicted = []
+        for rowid, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((rowid,))
+            total -= size
+        connection.executemany('DELETE FROM results WHERE rowid = ?', evicted)
+        self.evictions += len(evicted)
+
+    def clear(self):
+        self._connection().execute('DELETE FROM results')
+
+    def stats(self):
+        size, total = self._connection().execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results').fetchone()
+        return {
+            'size': size,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __len__(self):
+        return self.stats()['size']
+
+
+# The cache used by every property with `memoize=True`.
+DEFAULT_CACHE = LRUCache()
+
+
+def get_cache(memoize):
+    """Return the cache for the `memoize` argument of an SDProperty: True for
+    the shared default cache, a maximum size for a new LRU cache, or a cache.
+    """
+    if memoize is True:
+        return DEFAULT_CACHE
+    if isinstance(memoize, int):
+        return LRUCache(maxsize=memoize)
+    return memoize
+
+
+def _cached(cache, key, func, *args):
+    try:
+        hash(key)
+    except TypeError:
+        # Results computed from unhashable values can't be cached.
+        return func(*args)
+
+    value = cache.get(key, MISSING)
+    if value is MISSING:
+        value = func(*args)
+        cache.set(key, value)
+    return value
+
+
+def memoize_default(cache, key, default, inputs):
+    """Wrap a callable default so that its result is cached by the values of
+    the `inputs` it depends on.
+    """
+    def memoized_default(instance):
+        try:
+            values = freeze(tuple(getattr(instance, name) for name in inputs))
+        except TypeError:
+            return default(instance)
+        return _cached(cache, key + ('default', values), default, instance)
+
+    return memoized_default
+
+
+def memoize_transform(cache, key, transform):
+    """Wrap a transform so that its result is cached by the value it's
+    transforming.
+    """
+    def memoized_transform(value):
+        try:
+            frozen_value = freeze(value)
+        except TypeError:
+            return transform(value)
+        return _cached(cache, key + ('transform', frozen_value), transform, value)
+
+    return memoized_transform
@@ -0,0 +1,423 @@
+"""Code generation for SDProperty resolvers.
+
+When a class is created the SDPropertyMetaclass describes each of its
+properties with a `ResolutionPlan`, and the plan is turned into specialized
+getter and resolver functions the same way dataclasses generates `__init__`.
+Only the code for the features a property actually uses is generated, so none
+of the per-access work of figuring out what kind of default, superkeys,
+validation or transform the property has is repeated.
+"""
+import re
+import threading
+from collections import namedtuple
+
+from sdproperty.seal import mark_resolved
+from sdproperty.seal import slotted_mark_resolved
+from sdproperty.superkeys import slotted_subtree
+from sdproperty.superkeys import subtree
+from sdproperty.utils import get_subkey_from_dict
+from sdproperty.validators import as_rule
+from sdproperty.exceptions import AsyncPropertyException
+from sdproperty.exceptions import RequiredPropertyException
+from sdproperty.exceptions import MismatchedPropertyTypesException
+from sdproperty.exceptions import InvalidPropertyException
+from sdproperty.exceptions import InvalidRecordException
+
+
+# Every `*_kind` field is one of the strings listed next to it.
+ResolutionPlan = namedtuple('ResolutionPlan', [
+    'name',
+    'singleton',
+    'required',
+    'default_kind',    # 'none', 'literal', 'callable', 'async' or 'sdproperty'.
+    'superkeys_kind',  # 'none', 'list', 'routed' or 'sdproperty'.
+    'validate_kind',   # 'none', 'callable', 'regex', 'rule' or 'invalid'.
+    'transform_kind',  # 'none', 'callable' or 'invalid'.
+    'combine_types',   # The kwarg types that are combined with the default.
+    'check_type',      # Whether values are checked against the default type.
+    'value_types',     # The types values are checked against, None if they aren't.
+    'slot',            # The slot the value is stored in, None to use `__dict__`.
+    'inputs',          # The attributes a tracked property is recomputed after.
+    'threadsafe',      # Whether a singleton is only ever resolved by one thread.
+    'autoseal',        # Whether resolving the singleton can seal the instance.
+    'interned',        # The pool resolved values are interned in, None if they aren't.
+])
+
+# The functions generated for a property:
+#   get:           Returns the stored value of a singleton, or resolves it.
+#   resolve:       Evaluates the property and stores the result.
+#   resolve_async: The coroutine version of `resolve` that awaits an async
+#                  default, None unless the property has one.
+#   resolve_with:  `resolve` with the result of a callable default evaluated
+#                  elsewhere passed in, None unless the property has one.
+#   kwarg:         Returns the kwarg the property is set from, None if the
+#                  property isn't a singleton.
+#   default:       The callable default the resolvers call, memoized or timed
+#                  if the property is, None unless the property has one.
+CompiledResolver = namedtuple('CompiledResolver', [
+    'get',
+    'resolve',
+    'resolve_async',
+    'resolve_with',
+    'kwarg',
+    'default',
+])
+
+_EMPTY_KWARGS = {}
+
+# Stands in for the value of a slot that hasn't been resolved yet.
+UNRESOLVED = object()
+
+
+def _kwargs_expression(plan):
+    if plan.slot:
+        return "_getattr(instance, 'kwargs', None)"
+    return "instance.__dict__.get('kwargs')"
+
+
+def _store_lines(plan):
+    lines = ['value = _intern(value)'] if plan.interned is not None else []
+    lines.append('_store(instance, value)' if plan.slot else 'instance.__dict__[_name] = value')
+    if plan.autoseal:
+        lines.append('_mark_resolved(instance, _name)')
+    return lines
+
+
+def _raise_async(name, instance):
+    raise AsyncPropertyException(name, instance)
+
+
+def _default_expression(plan, awaited):
+    if plan.default_kind == 'literal':
+        return '_default'
+    if plan.default_kind == 'callable':
+        return '_call_default(instance)'
+    if plan.default_kind == 'async':
+        # Coroutine defaults can only be evaluated by the async resolver.
+        if awaited:
+            return '(await _default(instance))'
+        return '_raise_async(_name, instance)'
+    if plan.default_kind == 'sdproperty':
+        return 'getattr(instance, _default.name)'
+    return 'None'
+
+
+def _kwargs_lines(plan):
+    if plan.superkeys_kind == 'list':
+        return [f'kwargs = {_kwargs_expression(plan)}',
+                'kwargs = _get_subkey_from_dict(kwargs, _superkeys) if kwargs else _empty']
+    if plan.superkeys_kind == 'routed':
+        # Found by the walk of the superkey trie shared by the whole class.
+        return [f'kwargs = {_kwargs_expression(plan)}',
+                'kwargs = _subtree(instance, kwargs, _path) if kwargs else _empty']
+    if plan.superkeys_kind == 'sdproperty':
+        return [f'if {_kwargs_expression(plan)}:',
+                '    kwargs = getattr(instance, _superkeys.name) or _empty',
+                'else:',
+                '    kwargs = _empty']
+    return [f'kwargs = {_kwargs_expression(plan)} or _empty']
+
+
+def _lookup_lines(plan):
+    # Sets `value` to the kwarg of a singleton. Superkeys that lead to
+    # something other than a mapping fail the same way `validate_kwargs`
+    # reports them.
+    lines = _kwargs_lines(plan)
+    if plan.superkeys_kind == 'none':
+        return lines + ['value = kwargs.get(_name)']
+    if plan.superkeys_kind == 'sdproperty':
+        # Only the lookup is guarded, so errors from resolving the property
+        # the superkeys are read from aren't mistaken for it.
+        lines, lookup = lines + ['try:'], ['value = kwargs.get(_name)']
+    else:
+        lines, lookup = ['try:'], lines + ['value = kwargs.get(_name)']
+    return lines + _indent(lookup) + [
+        'except AttributeError:',
+        f'    raise _InvalidRecordException({_kwargs_expression(plan)}, _not_a_mapping) from None',
+    ]
+
+
+def _invalid_condition(plan, rule, namespace, inline):
+    # The expression that's true when a kwarg fails validation. Rules (and
+    # regex patterns, as `Regex` rules) are inlined unless their check is
+    # replaced, e.g. by an instrumented one.
+    if plan.validate_kind == 'callable' or (plan.validate_kind == 'rule' and not inline):
+        return 'not _validate(value)'
+    if plan.validate_kind == 'regex' and not inline:
+        return 'not _match(_validate_rule.pattern, str(value))'
+    if plan.validate_kind in ('rule', 'regex'):
+        return rule.condition(namespace)
+    if plan.validate_kind == 'invalid':
+        return 'True'
+    return None
+
+
+def _validate_lines(invalid):
+    if invalid is None:
+        return []
+    return [f'if {invalid}:',
+            '    raise _InvalidPropertyException(_name, value, _sdproperty.validate)']
+
+
+def _transform_lines(plan):
+    if plan.transform_kind == 'callable':
+        return ['value = _transform(value)']
+    if plan.transform_kind == 'invalid':
+        return ['value = _sdproperty._apply_transform(value, instance)']
+    return []
+
+
+def _check_type_lines(plan):
+    if not plan.check_type:
+        return []
+    return ['if not isinstance(value, _default_type):',
+            '    raise _MismatchedPropertyTypesException(_name, _default, value)']
+
+
+def _indent(lines, depth=1):
+    return ['    ' * depth + line for line in lines]
+
+
+def _kwarg_source(plan):
+    if not plan.singleton:
+        return 'kwarg = None'
+    lines = _lookup_lines(plan) + ['return value']
+    return '\n'.join(['def kwarg(instance):'] + _indent(lines))
+
+
+def _default_source(plan):
+    if plan.default_kind in ('callable', 'async'):
+        return 'callback'
+    return 'default'
+
+
+def _resolver_source(plan, signature, default_expression, traced=False, invalid=None):
+    lines = []
+
+    # Kwargs are only ever looked up for singleton properties.
+    if plan.singleton:
+        lines += _lookup_lines(plan)
+        # We have to check if not None in case the value is a negative bool.
+        lines.append('if value is not None:')
+        kwarg_lines = ["_on_source('kwarg')"] if traced else []
+        kwarg_lines += _validate_lines(invalid)
+        if plan.combine_types:
+            # The default is only evaluated if it's going to be combined.
+            kwarg_lines += [
+                'if isinstance(value, _combine_types):',
+                f'    value = _sdproperty.combine_with_defaults(value, {default_expression})',
+            ]
+        kwarg_lines += _transform_lines(plan)
+        kwarg_lines += _check_type_lines(plan)
+        kwarg_lines += _store_lines(plan) + ['return value']
+        lines += _indent(kwarg_lines)
+
+    if traced:
+        lines.append(f"_on_source('{_default_source(plan)}')")
+    lines.append(f'value = {default_expression}')
+    if plan.required:
+        lines += ['if value is None:',
+                  '    raise _RequiredPropertyException(_name, instance)']
+    lines += _transform_lines(plan)
+    # A literal default can't mismatch its own type unless it's transformed.
+    if plan.default_kind != 'literal' or plan.transform_kind != 'none':
+        lines += _check_type_lines(plan)
+    lines += _store_lines(plan) + ['return value']
+
+    return '\n'.join([signature] + _indent(lines))
+
+
+def _inputs_key(name):
+    return f'_sdproperty_inputs_{name}'
+
+
+def _tracked_getter_source(plan):
+    inputs = ''.join(
+        "_getattr(instance, 'kwargs', None), " if name == 'kwargs' else f'instance.{name}, '
+        for name in plan.inputs)
+    unchanged = ''.join(f' and recorded[{index}] is inputs[{index}]'
+                        for index in range(len(plan.inputs)))
+
+    if plan.slot:
+        load_recorded = '_getattr(instance, _inputs_key, None)'
+        load_value = '_getattr(instance, _slot)'
+        store_inputs = '_store_inputs(instance, inputs)'
+    else:
+        load_recorded = 'instance.__dict__.get(_inputs_key)'
+        load_value = 'instance.__dict__[_name]'
+        store_inputs = 'instance.__dict__[_inputs_key] = inputs'
+
+    # The inputs are read before the property is resolved, so that every
+    # input it depends on is up to date when it's compared. A required input
+    # that isn't set may only be read by the property some of the time, so
+    # it's recorded as unresolved instead of raising.
+    return '\n'.join([
+        'def get(instance):',
+        '    try:',
+        f'        inputs = ({inputs})',
+        '    except _RequiredPropertyException:',
+        '        inputs = _read_inputs(instance, _input_names)',
+        f'    recorded = {load_recorded}',
+        f'    if recorded is not None{unchanged}:',
+        f'        return {load_value}',
+        '    value = resolve(instance)',
+        f'    {store_inputs}',
+        '    return value',
+    ])
+
+
+def _getter_source(plan):
+    if plan.inputs is not None:
+        return _tracked_getter_source(plan)
+    if not plan.singleton:
+        return 'get = resolve'
+
+    # Slots have no value until they're resolved, rather than None.
+    if plan.slot:
+        load_value = 'value = _getattr(instance, _slot, _unresolved)'
+        unresolved = 'value is _unresolved'
+    else:
+        load_value = 'value = instance.__dict__.get(_name)'
+        unresolved = 'value is None'
+
+    if plan.threadsafe:
+        # Double-checked locking, so that a resolved value is returned without
+        # ever taking the lock.
+        return '\n'.join([
+            'def get(instance):',
+            f'    {load_value}',
+            f'    if {unresolved}:',
+            '        with _lock_for(instance, _name):',
+            f'            {load_value}',
+            f'            if {unresolved}:',
+            '                value = resolve(instance)',
+            '    return value',
+        ])
+
+    return '\n'.join([
+        'def get(instance):',
+        f'    {load_value}',
+        f'    if {unresolved}:',
+        '        value = resolve(instance)',
+        '    return value',
+    ])
+
+
+_LOCKS_ATTR = '_sdproperty_locks'
+_locks_lock = threading.Lock()
+
+
+def read_inputs(instance, names):
+    """Return the values of the inputs of a tracked property, with
+    `UNRESOLVED` for the required properties that aren't set.
+    """
+    inputs = []
+    for name in names:
+        try:
+            inputs.append(getattr(instance, 'kwargs', None) if name == 'kwargs' else getattr(instance, name))
+        except RequiredPropertyException:
+            inputs.append(UNRESOLVED)
+    return tuple(inputs)
+
+
+def lock_for(instance, name):
+    """Return the lock that guards resolving a property of an instance,
+    creating it the first time it's needed.
+    """
+    locks = getattr(instance, _LOCKS_ATTR, None)
+    if locks is None:
+        with _locks_lock:
+            locks = getattr(instance, _LOCKS_ATTR, None)
+            if locks is None:
+                locks = {}
+                object.__setattr__(instance, _LOCKS_ATTR, locks)
+
+    lock = locks.get(name)
+    if lock is None:
+        # Reentrant, so the property is still resolved by the same thread if
+        # it's read again while it's being resolved.
+        lock = locks.setdefault(name, threading.RLock())
+    return lock
+
+
+def forget_inputs(instance, name):
+    """Remove the inputs recorded for a tracked property, so that it's
+    recomputed the next time it's read.
+    """
+    try:
+        delattr(instance, _inputs_key(name))
+    except AttributeError:
+        pass
+
+
+def compile_resolver(sdproperty, plan, store, store_inputs=None, default=None, transform=None,
+                     validate=None, match=None, on_source=None):
+    """Generate the `CompiledResolver` for an SDProperty from its plan.
+
+    Values are stored with `store` if the property is slotted. Tracked
+    properties also record their inputs with `store_inputs` if they're slotted,
+    and `get` only resolves them again once one of those has changed. The
+    callable `default`, `transform` and `validate` replace the property's own
+    if given, and `match` replaces `re.match` for regex validation. Regex and
+    rule validation is inlined into the resolvers unless one of those two
+    replaces it. If `on_source` is given, it's called with 'kwarg', 'default'
+    or 'callback' when the resolvers decide where the value comes from.
+    """
+    namespace = {
+        '_sdproperty': sdproperty,
+        '_name': plan.name,
+        '_default': sdproperty.default,
+        '_default_type': plan.value_types,
+        '_superkeys': sdproperty.superkeys,
+        '_path': tuple(sdproperty.superkeys) if plan.superkeys_kind == 'routed' else None,
+        '_validate': validate or sdproperty.validate,
+        '_call_default': default or sdproperty.default,
+        '_transform': transform or sdproperty.transform,
+        '_combine_types': plan.combine_types,
+        '_empty': _EMPTY_KWARGS,
+        '_slot': plan.slot,
+        '_store': store,
+        '_inputs_key': _inputs_key(plan.name),
+        '_store_inputs': store_inputs,
+        '_input_names': plan.inputs,
+        '_read_inputs': read_inputs,
+        '_unresolved': UNRESOLVED,
+        '_getattr': getattr,
+        '_match': match or re.match,
+        '_raise_async': _raise_async,
+        '_lock_for': lock_for,
+        '_on_source': on_source,
+        '_subtree': slotted_subtree if plan.slot else subtree,
+        '_mark_resolved': slotted_mark_resolved if plan.slot else mark_resolved,
+        '_intern': plan.interned.intern if plan.interned is not None else None,
+        '_get_subkey_from_dict': get_subkey_from_dict,
+        '_RequiredPropertyException': RequiredPropertyException,
+        '_MismatchedPropertyTypesException': MismatchedPropertyTypesException,
+        '_InvalidPropertyException': InvalidPropertyException,
+        '_InvalidRecordException': InvalidRecordException,
+        '_not_a_mapping': f'the superkeys of the "{plan.name}" property don\'t lead to a mapping',
+    }
+    rule = as_rule(sdproperty.validate) if plan.validate_kind in ('rule', 'regex') else None
+    namespace['_validate_rule'] = rule
+    invalid = _invalid_condition(plan, rule, namespace, inline=validate is None and match is None)
+    traced = on_source is not None
+    sources = [
+        _resolver_source(plan, 'def resolve(instance):', _default_expression(plan, False), traced, invalid),
+        _getter_source(plan),
+        _kwarg_source(plan),
+    ]
+    if plan.default_kind == 'async':
+        sources.append(_resolver_source(
+            plan, 'async def resolve_async(instance):', _default_expression(plan, True), traced, invalid))
+    if plan.default_kind == 'callable':
+        sources.append(_resolver_source(plan, 'def resolve_with(instance, default):', 'default', traced,
+                                        invalid))
+    exec(compile('\n\n'.join(sources), f'<sdproperty {plan.name}>', 'exec'), namespace)  # pylint: disable=exec-used
+
+    return CompiledResolver(
+        get=namespace['get'],
+        resolve=namespace['resolve'],
+        resolve_async=namespace.get('resolve_async'),
+        resolve_with=namespace.get('resolve_with'),
+        kwarg=namespace['kwarg'],
+        default=namespace['_call_default'] if plan.default_kind == 'callable' else None)
@@ -70,7 +70,99 @@ class InvalidPropertyException(Exception):
     def __str__(self):
         if self.message:
             return self.message
-        if not isinstance(self.validate, str):
-            self.validate = inspect.getsource(self.validate)
+        condition = self.validate
+        if inspect.isfunction(condition) or inspect.ismethod(condition):
+            try:
+                condition = inspect.getsource(condition)
+            except (OSError, TypeError):
+                condition = condition.__qualname__
+        elif not isinstance(condition, str):
+            # Compiled patterns and rules describe themselves.
+            condition = repr(condition)
         return f"The '{self.name}' property's value '{self.value}' does not" + \
-            f" match the validation condition: \n\n{self.validate}"
+            f" match the validation condition: \n\n{condition}"
+
+
+class CyclicPropertyDependencyException(Exception):
+
+    def __init__(self, class_obj, cycle, message=None):
+        self.class_obj = class_obj
+        self.cycle = cycle
+        self.message = message
+
+    def __str__(self):
+        if self.message:
+            return self.message
+        return f'The properties of "{self.class_obj}" depend on each other ' + \
+               f'in a cycle: {" -> ".join(self.cycle)}'
+
+
+class AsyncPropertyException(Exception):
+
+    def __init__(self, name, instance=None, message=None):
+        self.name = name
+        self.instance = instance
+        self.message = message
+
+    def __str__(self):
+        if self.message:
+            return self.message
+        return f'The "{self.name}" property of "{self.instance}" has an async ' + \
+               'default, so it has to be resolved with ' + \
+               '"await sdproperty.aio.resolve_async(instance)" before it is read.'
+
+
+class InvalidRecordException(Exception):
+
+    def __init__(self, record, reason, message=None):
+        self.record = record
+        self.reason = reason
+        self.message = message
+
+    def __str__(self):
+        if self.message:
+            return self.message
+        return f'The record "{self.record}" can\'t be loaded: {self.reason}'
+
+
+class UnsealableClassException(Exception):
+
+    def __init__(self, class_obj, names, message=None):
+        self.class_obj = class_obj
+        self.names = names
+        self.message = message
+
+    def __str__(self):
+        if self.message:
+            return self.message
+        return f'The instances of "{self.class_obj}" can\'t be sealed, because the ' + \
+               f'callbacks of the non-singleton properties {", ".join(self.names)} ' + \
+               'read the kwargs every time they are resolved.'
+
+
+class UndeclaredInputsException(Exception):
+
+    def __init__(self, name, class_obj, message=None):
+        self.name = name
+        self.class_obj = class_obj
+        self.message = message
+
+    def __str__(self):
+        if self.message:
+            return self.message
+        return f'The "{self.name}" property of "{self.class_obj}" memoizes or tracks its callback, ' + \
+               'so the attributes its result is computed from have to be declared with ' + \
+               '"inputs=[...]", since a callback can read them in ways that can\'t be found.'
+
+
+class SealedKwargsException(Exception):
+
+    def __init__(self, message=None):
+        self.message = message
+
+    def __str__(self):
+        if self.message:
+            return self.message
+        return 'The kwargs of a sealed instance were released and can\'t be read anymore. ' + \
+               'Instances whose callbacks read "self.kwargs" after every singleton property ' + \
+               'has been resolved can\'t be sealed.'
@@ -0,0 +1,270 @@
+"""Columnar storage for many instances of the same SDProperty class.
+
+An `SDPropertyFrame` resolves the properties of a class for a list of kwargs
+dicts one column at a time, in dependency order, and stores each column as a
+typed array: a NumPy array if NumPy is installed, an `array.array` for
+columns of only ints or only floats otherwise, and a list for anything else.
+There's no instance, and so no instance `__dict__`, per record. Rows are read
+through `Row` views that behave like instances.
+
+Transforms and validators wrapped with `vectorized` are called once with a
+whole column instead of once per value.
+"""
+from array import array
+from types import FunctionType
+from types import MethodType
+
+from sdproperty.exceptions import AsyncPropertyException
+from sdproperty.exceptions import InvalidPropertyException
+from sdproperty.exceptions import InvalidRecordException
+from sdproperty.exceptions import MismatchedPropertyTypesException
+from sdproperty.exceptions import RequiredPropertyException
+from sdproperty.exceptions import TransformNotCallableException
+from sdproperty.utils import get_subkey_from_dict
+from sdproperty.validators import as_rule
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Vectorized:
+    """A transform or validator that takes a whole column of values.
+
+    A vectorized transform returns the transformed column, and a vectorized
+    validator returns whether each value is valid, or a single bool for the
+    whole column. Outside of a frame it's called with a column of one value.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__wrapped__ = func
+
+    def __call__(self, value):
+        result = self.func([value])
+        if isinstance(result, bool):
+            return result
+        return result[0]
+
+    def __repr__(self):
+        return f'vectorized({getattr(self.func, "__qualname__", self.func)})'
+
+
+def vectorized(func):
+    """Mark a transform or validator as taking a whole column of values."""
+    return Vectorized(func)
+
+
+_ARRAY_TYPECODES = {int: 'q', float: 'd'}
+_NUMPY_TYPES = (int, float, bool)
+
+
+def _pack(values):
+    # Store a column of values of a single int, float or bool type as a
+    # typed array, anything else as a list.
+    value_types = {type(value) for value in values}
+    if len(value_types) != 1:
+        return values
+    value_type, = value_types
+    try:
+        if numpy is not None and value_type in _NUMPY_TYPES:
+            return numpy.array(values, dtype=value_type)
+        if value_type in _ARRAY_TYPECODES:
+            return array(_ARRAY_TYPECODES[value_type], values)
+    except OverflowError:
+        # Ints too large for 64 bits.
+        pass
+    return values
+
+
+def _value(column, index):
+    # NumPy arrays hold NumPy scalars, which are turned back into the int,
+    # float or bool they were resolved as.
+    value = column[index]
+    if numpy is not None and isinstance(value, numpy.generic):
+        return value.item()
+    return value
+
+
+class Row:
+    """A view of one row of a frame, whose properties are read from the
+    columns of the frame and whose methods are those of the class.
+    """
+
+    __slots__ = ('_frame', '_index')
+
+    def __init__(self, frame, index):
+        self._frame = frame
+        self._index = index
+
+    def __getattr__(self, name):
+        column = self._frame.columns.get(name)
+        if column is not None:
+            return _value(column, self._index)
+        records = self._frame._records
+        if name == 'kwargs' and records is not None:
+            # Only while the frame is being resolved.
+            return records[self._index]
+        class_object = self._frame.class_object
+        if name in class_object.__sdproperties__:
+            raise AttributeError(f'The "{name}" property hasn\'t been resolved yet')
+        attribute = getattr(class_object, name)
+        if isinstance(attribute, FunctionType):
+            return MethodType(attribute, self)
+        return attribute
+
+    def __repr__(self):
+        return f'<{self._frame.class_object.__name__} row {self._index}>'
+
+
+class SDPropertyFrame:
+    """The properties of a class resolved for every kwargs dict in `records`,
+    stored by column. Only the properties in `names` (and the properties they
+    depend on) are resolved if it's given.
+
+    Values are resolved the same way as on an instance, except that
+    non-singleton properties are resolved once like any other, and the class
+    `__init__` isn't called: each record is used as the `kwargs` as is. Default
+    callbacks are called with the `Row` being resolved, which only has the
+    properties that have been resolved before it, and its `kwargs` while the
+    frame is being resolved.
+    """
+
+    def __init__(self, class_object, records, names=None):
+        self.class_object = class_object
+        self.columns = {}
+        self._records = list(records)
+        self._length = len(self._records)
+        sdproperties = class_object.__sdproperties__
+        graph = class_object.__sdproperty_graph__
+        for name in graph.order if names is None else graph.closure(names):
+            self.columns[name] = _pack(self._resolve_column(sdproperties[name]))
+        # The kwargs are only needed to resolve the columns.
+        self._records = None
+
+    def _kwargs_column(self, sdproperty):
+        # The kwarg of every row, None for the rows that don't have one.
+        kind = sdproperty.plan.superkeys_kind
+        name = sdproperty.name
+        if not sdproperty.singleton:
+            return [None] * self._length
+        if kind == 'sdproperty':
+            sections = self.columns[sdproperty.superkeys.name]
+            return [self._kwarg(sdproperty, record, section or {}, ())
+                    for record, section in zip(self._records, sections)]
+        if kind in ('list', 'routed'):
+            return [self._kwarg(sdproperty, record, record, sdproperty.superkeys) if record else None
+                    for record in self._records]
+        return [record.get(name) for record in self._records]
+
+    @staticmethod
+    def _kwarg(sdproperty, record, section, superkeys):
+        # Superkeys that lead to something other than a mapping fail the same
+        # way they do on an instance.
+        try:
+            return get_subkey_from_dict(section, superkeys).get(sdproperty.name)
+        except AttributeError:
+            raise InvalidRecordException(
+                record, f'the superkeys of the "{sdproperty.name}" property don\'t lead to a mapping') from None
+
+    def _defaults(self, sdproperty, positions):
+        kind = sdproperty.plan.default_kind
+        if kind == 'literal':
+            return [sdproperty.default] * len(positions)
+        if kind == 'sdproperty':
+            column = self.columns[sdproperty.default.name]
+            return [_value(column, position) for position in positions]
+        if kind == 'callable':
+            return [sdproperty.default(Row(self, position)) for position in positions]
+        if kind == 'async':
+            raise AsyncPropertyException(sdproperty.name, self.class_object)
+        return [None] * len(positions)
+
+    def _validate_column(self, sdproperty, values):
+        validate = sdproperty.validate
+        if isinstance(validate, Vectorized):
+            results = validate.func(values)
+            if isinstance(results, bool):
+                results = [results] * len(values)
+        elif sdproperty.plan.validate_kind == 'invalid':
+            results = [False] * len(values)
+        else:
+            rule = as_rule(validate)
+            results = [rule(value) for value in values]
+        for value, valid in zip(values, results):
+            if not valid:
+                raise InvalidPropertyException(sdproperty.name, value, validate)
+
+    def _transform(self, sdproperty, values):
+        transform = sdproperty.transform
+        if isinstance(transform, Vectorized):
+            return list(transform.func(values))
+        if not callable(transform):
+            raise TransformNotCallableException(sdproperty.name, self.class_object)
+        return [transform(value) for value in values]
+
+    def _resolve_column(self, sdproperty):
+        values = self._kwargs_column(sdproperty)
+        kwarg_positions = [position for position, value in enumerate(values) if value is not None]
+        default_positions = [position for position, value in enumerate(values) if value is None]
+        plan = sdproperty.plan
+
+        if kwarg_positions:
+            kwargs = [values[position] for position in kwarg_positions]
+            if sdproperty.validate is not None:
+                self._validate_column(sdproperty, kwargs)
+            if plan.combine_types:
+                defaults = self._defaults(sdproperty, kwarg_positions)
+                kwargs = [sdproperty.combine_with_defaults(value, default)
+                          if isinstance(value, plan.combine_types) else value
+                          for value, default in zip(kwargs, defaults)]
+            if sdproperty.transform:
+                kwargs = self._transform(sdproperty, kwargs)
+            self._check_types(sdproperty, plan, kwargs)
+            for position, value in zip(kwarg_positions, kwargs):
+                values[position] = value
+
+        if default_positions:
+            defaults = self._defaults(sdproperty, default_positions)
+            if sdproperty.required and any(value is None for value in defaults):
+                raise RequiredPropertyException(
+                    self.class_object,
+                    f'The "{sdproperty.name}" property is a required field on "{self.class_object}".')
+            if sdproperty.transform:
+                defaults = self._transform(sdproperty, defaults)
+            if plan.default_kind != 'literal' or sdproperty.transform:
+                self._check_types(sdproperty, plan, defaults)
+            for position, value in zip(default_positions, defaults):
+                values[position] = value
+
+        return values
+
+    @staticmethod
+    def _check_types(sdproperty, plan, values):
+        if not plan.check_type:
+            return
+        for value in values:
+            if not isinstance(value, plan.value_types):
+                raise MismatchedPropertyTypesException(sdproperty.name, sdproperty.default, value)
+
+    def column(self, name):
+        """Return the column of a property."""
+        return self.columns[name]
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return Row(self, index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield Row(self, index)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} of {self._length} {self.class_object.__name__}>'
@@ -0,0 +1,144 @@
+"""The dependency graph between the SDProperties of a class.
+
+A property depends on another when it uses it as its `default` or its
+`superkeys`, or when its `@sdproperty` callback reads it. Callbacks can't be
+declared, so the attributes they read are found from the names their code
+loads, which may include a property the callback only reads some of the time.
+Those inferred dependencies are only used to order the properties: only a
+cycle of declared dependencies is an error, since two callbacks that each
+read the other only some of the time can still resolve.
+"""
+from collections import deque
+from types import CodeType
+
+from sdproperty.exceptions import CyclicPropertyDependencyException
+
+
+def referenced_names(func):
+    """Return every name loaded by a function's code, including the code of
+    any function or lambda nested in it.
+    """
+    code_objects = [getattr(func, '__code__', None)]
+    names = set()
+
+    while code_objects:
+        code = code_objects.pop()
+        if code is None:
+            continue
+        names.update(code.co_names)
+        code_objects.extend(const for const in code.co_consts if isinstance(const, CodeType))
+
+    return names
+
+
+class DependencyGraph:
+    """The dependencies of every SDProperty of a class, checked for cycles of
+    declared dependencies and sorted so that each property comes after
+    everything it depends on.
+
+    `predecessors` has the dependencies of each property that come before it
+    in the order, which is all of them unless an inferred dependency had to
+    be ignored to break a cycle.
+    """
+
+    def __init__(self, class_obj, sdproperties):
+        def dependencies(name, found):
+            return tuple(dependency for dependency in found
+                         if dependency in sdproperties and dependency != name)
+
+        self.class_obj = class_obj
+        self.dependencies = {}
+        self.declared = {}
+        for name, sdproperty in sdproperties.items():
+            self.dependencies[name] = dependencies(name, sdproperty._dependencies())
+            self.declared[name] = dependencies(name, sdproperty._declared_dependencies())
+        self.order = self._sort(class_obj)
+        self._positions = {name: position for position, name in enumerate(self.order)}
+        self.predecessors = {
+            name: tuple(dependency for dependency in dependencies
+                        if self._positions[dependency] < self._positions[name])
+            for name, dependencies in self.dependencies.items()
+        }
+
+    def _sort(self, class_obj):
+        # Kahn's algorithm, keeping the declaration order between properties
+        # that don't depend on each other. When only properties on a cycle
+        # are left, the first one whose declared dependencies have all been
+        # sorted goes next regardless of its inferred ones.
+        dependents = {name: [] for name in self.dependencies}
+        remaining = {}
+        declared = {}
+        for name, dependencies in self.dependencies.items():
+            remaining[name] = len(dependencies)
+            declared[name] = len(self.declared[name])
+            for dependency in dependencies:
+                dependents[dependency].append(name)
+
+        ready = deque(name for name, count in remaining.items() if not count)
+        order = []
+        sorted_names = set()
+        while len(order) != len(self.dependencies):
+            if not ready:
+                name = next((name for name in self.dependencies
+                             if name not in sorted_names and not declared[name]), None)
+                if name is None:
+                    raise CyclicPropertyDependencyException(class_obj, self._find_cycle(sorted_names))
+                ready.append(name)
+            name = ready.popleft()
+            if name in sorted_names:
+                continue
+            order.append(name)
+            sorted_names.add(name)
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if name in self.declared[dependent]:
+                    declared[dependent] -= 1
+                if not remaining[dependent] and dependent not in sorted_names:
+                    ready.append(dependent)
+
+        return order
+
+    def _find_cycle(self, sorted_names):
+        # Every property left over is on, or declares a dependency on, a cycle
+        # of declared dependencies, so walking from any of them through other
+        # left over properties finds one.
+        name = next(name for name in self.declared if name not in sorted_names)
+        path = []
+        while name not in path:
+            path.append(name)
+            name = next(dependency for dependency in self.declared[name]
+                        if dependency not in sorted_names)
+
+        return path[path.index(name):] + [name]
+
+    def closure(self, names):
+        """Return the given properties and everything they depend on, in the
+        order they can be resolved in.
+        """
+        names = list(names)
+        unknown = [name for name in names if name not in self.dependencies]
+        if unknown:
+            raise ValueError(f'"{self.class_obj.__name__}" has no properties named '
+                             f'{", ".join(map(repr, unknown))}')
+        required = set()
+        while names:
+            name = names.pop()
+            if name not in required:
+                required.add(name)
+                names.extend(self.dependencies[name])
+
+        return sorted(required, key=self._positions.__getitem__)
+
+
+def materialize(instance, names=None):
+    """Resolve the properties of an instance, or only the given properties and
+    what they depend on, and return their values by name.
+
+    Properties are resolved in dependency order, so every property is resolved
+    after the properties it depends on have already been stored and none of
+    them have to be resolved recursively.
+    """
+    graph = type(instance).__sdproperty_graph__
+    order = graph.order if names is None else graph.closure(names)
+
+    return {name: getattr(instance, name) for name in order}
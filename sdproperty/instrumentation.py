@@ -0,0 +1,344 @@
+"""Opt-in instrumentation of how properties are resolved.
+
+Properties are compiled without any instrumentation, so leaving it available
+costs nothing. `enable()` compiles every property again with hooks that count
+its reads, resolutions, assignments and exceptions, time its defaults,
+validators and transforms, and count the cache hits of memoized properties.
+`disable()` compiles them without the hooks again. The hooks also record the
+spans of an active `sdproperty.tracing.trace()`.
+
+Properties that are served through plain attribute lookup once they're
+resolved (see the `cached` class option) only count the reads that reach the
+descriptor.
+"""
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from sdproperty import tracing
+from sdproperty.cache import MISSING
+
+
+# The stages of resolving a property that are timed.
+TIMED = ('resolve', 'default', 'validate', 'transform')
+
+# The upper bounds in nanoseconds of the buckets of the resolve latency
+# histogram.
+BUCKETS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000, float('inf'))
+
+_enabled = False
+_properties = weakref.WeakSet()
+_stats = {}
+_lock = threading.Lock()
+
+
+class PropertyStats:
+    """The counts and timings of a single property of a class."""
+
+    def __init__(self, class_path, name):
+        self.class_path = class_path
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        self.reads = 0
+        self.resolutions = 0
+        self.sets = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.errors = {}
+        self.calls = dict.fromkeys(TIMED, 0)
+        self.time_ns = dict.fromkeys(TIMED, 0)
+        self.histogram = [0] * len(BUCKETS)
+
+    def record(self, stage, elapsed):
+        self.calls[stage] += 1
+        self.time_ns[stage] += elapsed
+        if stage == 'resolve':
+            self.histogram[bisect_left(BUCKETS, elapsed)] += 1
+
+    def record_error(self, error):
+        name = type(error).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    def as_dict(self):
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            'reads': self.reads,
+            'resolutions': self.resolutions,
+            # Singletons only resolve on their first read, every other read
+            # returns the stored value.
+            'stored_reads': max(self.reads - self.resolutions, 0),
+            'sets': self.sets,
+            'errors': dict(self.errors),
+            'calls': dict(self.calls),
+            'time_ns': dict(self.time_ns),
+            'histogram': dict(zip(BUCKETS, self.histogram)),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'cache_hit_ratio': self.cache_hits / lookups if lookups else None,
+        }
+
+
+def _class_path(class_object):
+    if class_object is None:
+        return '<unbound>'
+    return f'{class_object.__module__}.{class_object.__qualname__}'
+
+
+def is_enabled():
+    return _enabled
+
+
+def register(sdproperty):
+    """Remember a compiled property, so it can be compiled again when
+    instrumentation is enabled or disabled.
+    """
+    _properties.add(sdproperty)
+
+
+def stats_for(class_object, name):
+    """Return the `PropertyStats` of a property, creating them the first time
+    they're needed.
+    """
+    key = (_class_path(class_object), name)
+    stats = _stats.get(key)
+    if stats is None:
+        with _lock:
+            stats = _stats.setdefault(key, PropertyStats(*key))
+    return stats
+
+
+def _recompile():
+    for sdproperty in list(_properties):
+        sdproperty.recompile()
+
+
+def enable():
+    """Compile every property with instrumentation hooks."""
+    global _enabled
+    _enabled = True
+    _recompile()
+
+
+def disable():
+    """Compile every property without instrumentation hooks."""
+    global _enabled
+    _enabled = False
+    _recompile()
+
+
+@contextmanager
+def instrumented():
+    """Enable instrumentation for the duration of the context."""
+    was_enabled = _enabled
+    if not was_enabled:
+        enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def reset():
+    """Zero the stats of every property."""
+    # The hooks hold on to the stats they record to, so they're reset in place.
+    for stats in list(_stats.values()):
+        stats.reset()
+
+
+def snapshot():
+    """Return the stats of every property that's been instrumented, by class
+    path and property name.
+    """
+    result = {}
+    for (class_path, name), stats in sorted(_stats.items()):
+        result.setdefault(class_path, {})[name] = stats.as_dict()
+    return result
+
+
+def _milliseconds(time_ns):
+    return f'{time_ns / 1e6:.3f}'
+
+
+def format_snapshot(result=None):
+    """Return a snapshot as a plain text table with a row per property."""
+    if result is None:
+        result = snapshot()
+
+    columns = ('property', 'reads', 'resolved', 'stored', 'sets', 'errors',
+               'resolve ms', 'default ms', 'validate ms', 'transform ms', 'cache hits')
+    lines = []
+    for class_path, properties in result.items():
+        rows = [columns]
+        for name, stats in properties.items():
+            ratio = stats['cache_hit_ratio']
+            rows.append((
+                name,
+                str(stats['reads']),
+                str(stats['resolutions']),
+                str(stats['stored_reads']),
+                str(stats['sets']),
+                str(sum(stats['errors'].values())),
+                *(_milliseconds(stats['time_ns'][stage]) for stage in TIMED),
+                '-' if ratio is None else f'{ratio:.0%}',
+            ))
+        widths = [max(len(row[index]) for row in rows) for index in range(len(columns))]
+        lines.append(class_path)
+        for row in rows:
+            cells = [row[0].ljust(widths[0])] + \
+                    [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])]
+            lines.append('  ' + '  '.join(cells))
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def timed(stats, stage, func):
+    """Wrap a function so that its calls are timed as a stage of resolving."""
+    def timed_func(*args):
+        start = time.perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            stats.record(stage, elapsed)
+            tracing.add_time(stage, elapsed)
+
+    return timed_func
+
+
+def _start_span(stats, tracer, resolving):
+    # Returns the span of the read, and the token to finish it with if it was
+    # started here. A resolution that's part of a read shares its span.
+    if tracer is None:
+        return None, None
+    span = tracing.current()
+    if resolving and span is not None and not span.resolved and \
+       span.class_path == stats.class_path and span.name == stats.name:
+        span.resolved = True
+        return span, None
+    span, token = tracer.start(stats.class_path, stats.name)
+    span.resolved = resolving
+    return span, token
+
+
+def _finish_span(tracer, span, token, error=None):
+    if span is None:
+        return
+    if error is not None:
+        span.error = type(error).__name__
+    if token is not None:
+        tracer.finish(span, token)
+
+
+def _counted_resolve(stats, resolve):
+    def counted_resolve(instance, *args):
+        stats.resolutions += 1
+        tracer = tracing.active()
+        span, token = _start_span(stats, tracer, True)
+        start = time.perf_counter_ns()
+        try:
+            value = resolve(instance, *args)
+        except Exception as error:
+            stats.record_error(error)
+            _finish_span(tracer, span, token, error)
+            raise
+        finally:
+            stats.record('resolve', time.perf_counter_ns() - start)
+        _finish_span(tracer, span, token)
+        return value
+
+    return counted_resolve
+
+
+def _counted_resolve_async(stats, resolve_async):
+    async def counted_resolve_async(instance):
+        stats.resolutions += 1
+        tracer = tracing.active()
+        span, token = _start_span(stats, tracer, True)
+        start = time.perf_counter_ns()
+        try:
+            value = await resolve_async(instance)
+        except Exception as error:
+            stats.record_error(error)
+            _finish_span(tracer, span, token, error)
+            raise
+        finally:
+            stats.record('resolve', time.perf_counter_ns() - start)
+        _finish_span(tracer, span, token)
+        return value
+
+    return counted_resolve_async
+
+
+def _counted_get(stats, get):
+    def counted_get(instance):
+        stats.reads += 1
+        tracer = tracing.active()
+        if tracer is None:
+            return get(instance)
+        span, token = _start_span(stats, tracer, False)
+        try:
+            value = get(instance)
+        except Exception as error:
+            _finish_span(tracer, span, token, error)
+            raise
+        _finish_span(tracer, span, token)
+        return value
+
+    return counted_get
+
+
+def instrument_resolver(stats, resolver):
+    """Return a `CompiledResolver` that records to `stats`."""
+    resolve = _counted_resolve(stats, resolver.resolve)
+    if resolver.get is resolver.resolve:
+        get = _counted_get(stats, resolve)
+    else:
+        # The getter calls the resolver it was generated with by name.
+        resolver.get.__globals__['resolve'] = resolve
+        get = _counted_get(stats, resolver.get)
+
+    return resolver._replace(
+        get=get,
+        resolve=resolve,
+        resolve_async=resolver.resolve_async and _counted_resolve_async(stats, resolver.resolve_async),
+        resolve_with=resolver.resolve_with and _counted_resolve(stats, resolver.resolve_with))
+
+
+def counted_set(stats, value_is_valid):
+    """Wrap the check every assigned value goes through so that assignments
+    are counted.
+    """
+    def counted_value_is_valid(value):
+        stats.sets += 1
+        try:
+            value_is_valid(value)
+        except Exception as error:
+            stats.record_error(error)
+            raise
+
+    return counted_value_is_valid
+
+
+class CountingCache:
+    """Wraps the cache of a memoized property to count its hits and misses."""
+
+    def __init__(self, stats, cache):
+        self.stats = stats
+        self.cache = cache
+
+    def get(self, key, default=MISSING):
+        value = self.cache.get(key, MISSING)
+        if value is MISSING:
+            self.stats.cache_misses += 1
+            return default
+        self.stats.cache_hits += 1
+        tracing.set_source('cache')
+        return value
+
+    def set(self, key, value):
+        self.cache.set(key, value)
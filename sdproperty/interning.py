@@ -0,0 +1,204 @@
+"""Sharing structurally identical values and instances.
+
+Interning a value turns every dict and list in it into an immutable
+`FrozenDict` or `FrozenList` and returns the one copy of it that's already in
+the pool, if there is one, so that any number of instances resolving to the
+same combined default, transformed list or config section all hold the same
+object. Strings are interned with `sys.intern`. The pool only holds weak
+references, so a value is dropped from it once nothing else uses it.
+
+`flyweight` does the same for whole instances, returning the instance that
+was already created from an identical kwargs dict.
+"""
+import sys
+import threading
+import weakref
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"'{type(self).__name__}' object is immutable")
+
+
+class FrozenDict(dict):
+    """A dict that can't be modified, and so can be hashed and shared."""
+
+    __slots__ = ('_hash', '__weakref__')
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def __repr__(self):
+        return f'{type(self).__name__}({dict.__repr__(self)})'
+
+
+class FrozenList(list):
+    """A list that can't be modified, and so can be hashed and shared."""
+
+    __slots__ = ('_hash', '__weakref__')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(tuple(self))
+            return self._hash
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list.__repr__(self)})'
+
+
+def _token(value):
+    # What an interned element is compared by in the key of the value it's
+    # part of. Equal values of different types (1, 1.0 and True), or with a
+    # different sign (0.0 and -0.0), mustn't be shared. Frozen values are
+    # already shared, so they're compared by identity; they're kept alive by
+    # the value they're part of for as long as its key is in the pool.
+    value_type = type(value)
+    if value_type is FrozenDict or value_type is FrozenList:
+        return (value_type, id(value))
+    if value_type is tuple:
+        return (tuple, tuple(_token(element) for element in value))
+    if value_type is frozenset:
+        return (frozenset, frozenset(_token(element) for element in value))
+    if value_type is float or value_type is complex:
+        return (value_type, repr(value))
+    return (value_type, value)
+
+
+class InternPool:
+    """A hash-consing pool of frozen values, held by weak reference, that
+    counts how often an interned value was already in it.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._values = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def intern(self, value):
+        """Return the shared copy of a value.
+
+        Dicts and lists (but not their subclasses) are frozen, and tuples
+        and sets rebuilt, with every element interned. Values that are
+        already frozen by a pool, and anything else, are returned as is.
+        """
+        value_type = type(value)
+        if value_type is str:
+            return sys.intern(value)
+        if value_type is dict:
+            items = tuple((self.intern(key), self.intern(val)) for key, val in value.items())
+            return self._shared(FrozenDict, tuple((_token(key), _token(val)) for key, val in items),
+                                FrozenDict(items))
+        if value_type is list:
+            elements = tuple(self.intern(element) for element in value)
+            return self._shared(FrozenList, tuple(_token(element) for element in elements),
+                                FrozenList(elements))
+        if value_type is tuple:
+            # Tuples can't be weakly referenced, so only their elements are
+            # shared.
+            return tuple(self.intern(element) for element in value)
+        if value_type in (set, frozenset):
+            return frozenset(self.intern(element) for element in value)
+        return value
+
+    def _shared(self, value_type, tokens, value):
+        # Keyed by the contents in order, so that only values that iterate
+        # the same way are shared.
+        key = (value_type, tokens)
+        try:
+            hash(key)
+        except TypeError:
+            # Values with unhashable parts are frozen but not shared.
+            return value
+
+        with self._lock:
+            shared = self._values.get(key)
+            if shared is None:
+                self.misses += 1
+                self._values[key] = shared = value
+            else:
+                self.hits += 1
+        return shared
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def stats(self):
+        return {
+            'size': len(self._values),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def __len__(self):
+        return len(self._values)
+
+
+# The pool used by `interned=True`.
+DEFAULT_POOL = InternPool()
+
+
+def get_pool(interned):
+    """Return the pool for the `interned` argument of an SDProperty: True for
+    the shared default pool, or a pool.
+    """
+    if interned is True:
+        return DEFAULT_POOL
+    return interned
+
+
+FLYWEIGHTS_ATTR = '__sdproperty_flyweights__'
+_flyweights_lock = threading.Lock()
+
+
+def flyweight(class_object, kwargs, pool=DEFAULT_POOL):
+    """Return the live instance of the class that was created from the same
+    kwargs, or create one from the interned kwargs.
+
+    Instances are shared, so setting a property on one sets it on every
+    caller's instance, and their kwargs are frozen. The class has to support
+    weak references, which slotted classes only do if `__weakref__` is in
+    their `__slots__`, and kwargs that can't be hashed always create a new
+    instance.
+    """
+    kwargs = pool.intern(dict(kwargs))
+    # Interned kwargs are the same object whenever they're identical, and
+    # the key keeps them alive so that their id isn't reused.
+    key = (id(kwargs), kwargs)
+    try:
+        hash(key)
+    except TypeError:
+        return class_object(**kwargs)
+
+    with _flyweights_lock:
+        instances = class_object.__dict__.get(FLYWEIGHTS_ATTR)
+        if instances is None:
+            instances = weakref.WeakValueDictionary()
+            setattr(class_object, FLYWEIGHTS_ATTR, instances)
+        instance = instances.get(key)
+    if instance is not None:
+        return instance
+
+    # Created without holding the lock, in case `__init__` creates
+    # flyweights itself, so another thread may have created one first.
+    instance = class_object(**kwargs)
+    with _flyweights_lock:
+        return instances.setdefault(key, instance)
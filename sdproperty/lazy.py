@@ -0,0 +1,195 @@
+"""Kwargs that are decoded from a JSON file only as far as they're read.
+
+`open_json` memory maps a JSON file and returns a `LazyJSONMapping` of the
+object at its root, which can be passed as the kwargs of an instance. Only the
+keys of the objects that are looked into are scanned, and only the values that
+are actually read are decoded, so a property that reads a single field of a
+huge config doesn't pay for parsing the rest of it.
+"""
+import json
+import mmap
+import re
+from collections.abc import Mapping
+
+
+_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_STRUCTURE = re.compile(rb'["{}\[\]]')
+_SCALAR = re.compile(rb'[^,:{}\[\]\s]+')
+
+
+def _skip_whitespace(buffer, position):
+    return _WHITESPACE.match(buffer, position).end()
+
+
+def _error(message, buffer, position):
+    # The same exception `json.loads` raises for a malformed document.
+    return json.JSONDecodeError(message, buffer[max(position - 20, 0):position + 20].decode(
+        'utf-8', 'replace'), min(position, 20))
+
+
+def _value_end(buffer, position):
+    # Return where the JSON value starting at `position` ends, without
+    # decoding it.
+    first = buffer[position:position + 1]
+    if first == b'"':
+        match = _STRING.match(buffer, position)
+        if match is None:
+            raise _error('Unterminated string', buffer, position)
+        return match.end()
+
+    if first in (b'{', b'['):
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(buffer, position)
+            if match is None:
+                raise _error('Unterminated object or array', buffer, position)
+            char = match.group()
+            if char == b'"':
+                position = _value_end(buffer, match.start())
+                continue
+            depth += 1 if char in (b'{', b'[') else -1
+            position = match.end()
+            if not depth:
+                return position
+
+    match = _SCALAR.match(buffer, position)
+    if match is None:
+        raise _error('Expecting value', buffer, position)
+    return match.end()
+
+
+def _decode_key(data):
+    if b'\\' not in data:
+        return data[1:-1].decode('utf-8')
+    return json.loads(data)
+
+
+class LazyJSONMapping(Mapping):
+    """A read-only mapping of a JSON object in a buffer, that scans the keys
+    of the object the first time it's looked into and decodes each value the
+    first time it's read.
+
+    Values are decoded into the same plain dicts, lists and scalars as
+    `json.loads`. `subtree` returns objects as lazy mappings instead, which is
+    how superkeys traverse the kwargs without decoding what they pass
+    through.
+    """
+
+    def __init__(self, buffer, start=0, end=None):
+        start = _skip_whitespace(buffer, start)
+        if buffer[start:start + 1] != b'{':
+            raise _error('Expecting an object', buffer, start)
+        self._buffer = buffer
+        self._start = start
+        # Only found when it's needed, since it takes a scan of the object.
+        self._end = end
+        self._index = None
+        self._values = {}
+        self._subtrees = {}
+
+    def _load_index(self):
+        # Record where the value of every key starts and ends.
+        buffer = self._buffer
+        index = {}
+        position = _skip_whitespace(buffer, self._start + 1)
+        if buffer[position:position + 1] == b'}':
+            return index
+
+        while True:
+            key_end = _value_end(buffer, position)
+            if buffer[position:position + 1] != b'"':
+                raise _error('Expecting a property name', buffer, position)
+            key = _decode_key(buffer[position:key_end])
+            position = _skip_whitespace(buffer, key_end)
+            if buffer[position:position + 1] != b':':
+                raise _error("Expecting ':' delimiter", buffer, position)
+            value_start = _skip_whitespace(buffer, position + 1)
+            value_end = _value_end(buffer, value_start)
+            index[key] = (value_start, value_end)
+
+            position = _skip_whitespace(buffer, value_end)
+            delimiter = buffer[position:position + 1]
+            if delimiter == b'}':
+                return index
+            if delimiter != b',':
+                raise _error("Expecting ',' delimiter", buffer, position)
+            position = _skip_whitespace(buffer, position + 1)
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = self._load_index()
+        return self._index
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        start, end = self.index[key]
+        value = self._values[key] = json.loads(self._buffer[start:end])
+        return value
+
+    def subtree(self, key, default=None):
+        """Return the value of a key, as a lazy mapping if it's an object."""
+        subtree = self._subtrees.get(key)
+        if subtree is not None:
+            return subtree
+        span = self.index.get(key)
+        if span is None:
+            return default
+        start, end = span
+        if key not in self._values and self._buffer[start:start + 1] == b'{':
+            subtree = self._subtrees[key] = LazyJSONMapping(self._buffer, start, end)
+            return subtree
+        return self[key]
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def end(self):
+        if self._end is None:
+            self._end = _value_end(self._buffer, self._start)
+        return self._end
+
+    def to_dict(self):
+        """Decode the whole object."""
+        return json.loads(self._buffer[self._start:self.end])
+
+    def __repr__(self):
+        return f'<{type(self).__name__} at byte {self._start}>'
+
+
+class LazyJSONFile(LazyJSONMapping):
+    """The lazy mapping of the object at the root of a memory mapped JSON
+    file, which keeps the file mapped until it's closed.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as json_file:
+            buffer = mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ)
+        super().__init__(buffer)
+
+    def close(self):
+        self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_json(path):
+    """Memory map a JSON file whose root is an object, and return it as a
+    `LazyJSONFile` mapping.
+    """
+    return LazyJSONFile(path)
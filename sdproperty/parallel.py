@@ -0,0 +1,89 @@
+"""Resolving the independent properties of an instance in parallel."""
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from types import SimpleNamespace
+
+
+def evaluate_default(class_object, name, inputs):
+    """Evaluate the callable default of a property in a worker process, with
+    a stand-in instance that only has the inputs the default reads.
+    """
+    sdproperty = class_object.__sdproperties__[name]
+    return sdproperty.resolver.default(SimpleNamespace(**inputs))
+
+
+def _submit(executor, instance, sdproperty):
+    # Only evaluate callable defaults in the executor if they're actually
+    # going to be used.
+    if sdproperty.resolver.resolve_with is None or \
+       (sdproperty.singleton and sdproperty.is_resolved(instance)) or \
+       (sdproperty.singleton and sdproperty.resolver.kwarg(instance) is not None):
+        return None
+
+    # A process can't be sent the instance, so only the values of the
+    # properties the default depends on are sent instead.
+    if isinstance(executor, ProcessPoolExecutor):
+        inputs = {name: getattr(instance, name, None)
+                  for name in sdproperty.input_names(type(instance))}
+        return executor.submit(evaluate_default, type(instance), sdproperty.name, inputs)
+    # The compiled default is the one `resolve` calls, so it's memoized and
+    # timed the same way.
+    return executor.submit(sdproperty.resolver.default, instance)
+
+
+def materialize_parallel(instance, executor, names=None):
+    """Resolve the properties of an instance, or only the given properties and
+    what they depend on, and return their values by name.
+
+    The callable defaults and `@sdproperty` callbacks of properties are
+    evaluated in the `concurrent.futures` executor as soon as the properties
+    they depend on have been resolved, and the results are stored on the
+    instance like any other value. Everything else is resolved in the calling
+    thread. With a `ProcessPoolExecutor` the class has to be importable by the
+    worker processes, and the default is called with a stand-in for the
+    instance that only has the properties it depends on (and `kwargs`), so
+    memoized defaults are cached, and instrumented ones timed, in the worker.
+    """
+    class_object = type(instance)
+    graph = class_object.__sdproperty_graph__
+    order = graph.order if names is None else graph.closure(names)
+
+    remaining = {name: len(graph.predecessors[name]) for name in order}
+    dependents = {name: [] for name in order}
+    for name in order:
+        for dependency in graph.predecessors[name]:
+            dependents[dependency].append(name)
+
+    values = {}
+    futures = {}
+    ready = deque(name for name in order if not remaining[name])
+
+    def resolved(name, value):
+        values[name] = value
+        for dependent in dependents[name]:
+            remaining[dependent] -= 1
+            if not remaining[dependent]:
+                ready.append(dependent)
+
+    try:
+        while ready or futures:
+            while ready:
+                name = ready.popleft()
+                sdproperty = class_object.__sdproperties__[name]
+                future = _submit(executor, instance, sdproperty)
+                if future is None:
+                    resolved(name, getattr(instance, name))
+                else:
+                    futures[future] = sdproperty
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                sdproperty = futures.pop(future)
+                resolved(sdproperty.name, sdproperty.resolver.resolve_with(instance, future.result()))
+    finally:
+        for future in futures:
+            future.cancel()
+
+    return {name: values[name] for name in order}
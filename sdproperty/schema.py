@@ -0,0 +1,214 @@
+"""Checking kwargs against the properties of a class without instantiating it.
+
+The schema of a class is derived from the declarations of its properties: the
+path each one is read from, whether it's required, the type of its literal
+default and its validator. Checking a kwargs dict against it finds every
+kwarg that would fail to resolve with a `RequiredPropertyException`,
+`InvalidPropertyException` or `MismatchedPropertyTypesException`, without
+running any default callback or transform.
+
+Checks that depend on the result of a callback or transform (e.g. a property
+whose superkeys are a property with a callable default) are skipped, so a
+dict that passes can still fail when it's resolved, but every violation that
+is reported is one that resolving would raise.
+"""
+from collections import namedtuple
+from collections.abc import Mapping
+
+from sdproperty.exceptions import InvalidPropertyException
+from sdproperty.exceptions import InvalidRecordException
+from sdproperty.exceptions import MismatchedPropertyTypesException
+from sdproperty.exceptions import RequiredPropertyException
+from sdproperty.utils import get_subkey_from_dict
+from sdproperty.validators import as_rule
+
+
+# A kwarg that fails a check, with the path of keys to it in the kwargs.
+Violation = namedtuple('Violation', ['path', 'exception'])
+
+PropertySchema = namedtuple('PropertySchema', [
+    'name',
+    'singleton',
+    'superkeys',   # A tuple of keys, or the name of the property the kwargs are read from.
+    'default',     # The literal default, if it has one.
+    'default_from',  # The name of the property the default is taken from, if it is.
+    'static',      # Whether the value can be found without running any code.
+    'combine_types',  # The kwarg types that are combined with the default.
+    'required',
+    'types',       # The types the kwarg has to be, None if it isn't checked.
+    'rule',        # The rule the kwarg has to pass, None if it isn't validated.
+    'invalid',     # The validator if it's of a kind that can't validate anything.
+])
+
+# Stands in for a value that can only be found by running a callback or
+# transform.
+UNKNOWN = object()
+
+SCHEMA_ATTR = '__sdproperty_schema__'
+
+
+def _property_schema(sdproperty):
+    plan = sdproperty.plan
+    default_kind = plan.default_kind
+    transformed = plan.transform_kind != 'none'
+
+    if plan.superkeys_kind == 'sdproperty':
+        superkeys = sdproperty.superkeys.name
+    elif plan.superkeys_kind in ('list', 'routed'):
+        superkeys = tuple(sdproperty.superkeys)
+    else:
+        superkeys = ()
+
+    # Kwargs are checked before they're transformed, so their type is only
+    # known if they aren't, and custom strategies can combine them into
+    # anything.
+    check_type = plan.check_type and not transformed and not callable(sdproperty.combine_defaults)
+
+    return PropertySchema(
+        name=sdproperty.name,
+        singleton=sdproperty.singleton,
+        superkeys=superkeys,
+        default=sdproperty.default if default_kind == 'literal' else None,
+        default_from=sdproperty.default.name if default_kind == 'sdproperty' else None,
+        static=default_kind in ('none', 'literal', 'sdproperty') and not transformed and
+        not callable(sdproperty.combine_defaults),
+        combine_types=plan.combine_types,
+        required=sdproperty.required,
+        types=plan.value_types if check_type else None,
+        rule=as_rule(sdproperty.validate) if plan.validate_kind in ('rule', 'regex', 'callable') else None,
+        invalid=sdproperty.validate if plan.validate_kind == 'invalid' else None)
+
+
+class Schema:
+    """The schema of an SDProperty class, with a `PropertySchema` for each of
+    its properties in dependency order.
+    """
+
+    def __init__(self, class_object):
+        self.class_object = class_object
+        sdproperties = class_object.__sdproperties__
+        self.properties = [_property_schema(sdproperties[name])
+                           for name in class_object.__sdproperty_graph__.order]
+        self._sdproperties = sdproperties
+
+    def check(self, kwargs):
+        """Return a `Violation` for every kwarg that would fail to resolve."""
+        violations = []
+        # The value each property would resolve to, UNKNOWN if it can't be
+        # found without running code, and the path it's read from.
+        values = {}
+        paths = {}
+
+        for schema in self.properties:
+            section, path = self._section(schema, kwargs, values, paths, violations)
+            paths[schema.name] = path + (schema.name,)
+            if section is UNKNOWN:
+                values[schema.name] = UNKNOWN
+                continue
+
+            value = section.get(schema.name) if schema.singleton else None
+            if value is not None:
+                violation = self._check_value(schema, value)
+                if violation is not None:
+                    violations.append(Violation(paths[schema.name], violation))
+                    values[schema.name] = UNKNOWN
+                    continue
+                values[schema.name] = self._combined(schema, value, values)
+                continue
+
+            default = self._default(schema, values)
+            if default is None and schema.required:
+                violations.append(Violation(paths[schema.name], RequiredPropertyException(
+                    self.class_object,
+                    f'The "{schema.name}" property is a required field on "{self.class_object}".')))
+                default = UNKNOWN
+            values[schema.name] = default
+
+        return violations
+
+    def _section(self, schema, kwargs, values, paths, violations):
+        # The part of the kwargs the property is read from, and its path.
+        if not schema.superkeys:
+            return kwargs, ()
+        if isinstance(schema.superkeys, str):
+            path = paths.get(schema.superkeys, (schema.superkeys,))
+            section = values.get(schema.superkeys, UNKNOWN)
+            if section is UNKNOWN:
+                return UNKNOWN, path
+            section = section or {}
+        else:
+            path = schema.superkeys
+            try:
+                section = get_subkey_from_dict(kwargs, schema.superkeys) if kwargs else {}
+            except AttributeError:
+                section = None
+
+        if not isinstance(section, Mapping):
+            # Looking the property up in anything else raises when it's
+            # resolved.
+            violations.append(Violation(path + (schema.name,), InvalidRecordException(
+                kwargs, f'the superkeys of the "{schema.name}" property don\'t lead to a mapping')))
+            return UNKNOWN, path
+        return section, path
+
+    def _check_value(self, schema, value):
+        if schema.invalid is not None:
+            return InvalidPropertyException(schema.name, value, schema.invalid)
+        if schema.rule is not None and not schema.rule(value):
+            return InvalidPropertyException(schema.name, value, self._sdproperties[schema.name].validate)
+        if schema.types is not None and not isinstance(value, schema.types):
+            return MismatchedPropertyTypesException(schema.name, schema.default, value)
+        return None
+
+    def _combined(self, schema, value, values):
+        if not schema.static:
+            return UNKNOWN
+        if not isinstance(value, schema.combine_types):
+            return value
+        default = self._default(schema, values)
+        if default is UNKNOWN:
+            return UNKNOWN
+        try:
+            return self._sdproperties[schema.name].combine_with_defaults(value, default)
+        except (AttributeError, TypeError):
+            # A default of a different type, which fails when it's resolved.
+            return UNKNOWN
+
+    @staticmethod
+    def _default(schema, values):
+        if not schema.static:
+            return UNKNOWN
+        if schema.default_from is not None:
+            # Properties the class doesn't have are never found, the same as
+            # when they're resolved.
+            return values.get(schema.default_from, UNKNOWN)
+        return schema.default
+
+
+def schema_for(class_object):
+    """Return the `Schema` of a class, deriving it the first time."""
+    schema = class_object.__dict__.get(SCHEMA_ATTR)
+    if schema is None:
+        schema = Schema(class_object)
+        setattr(class_object, SCHEMA_ATTR, schema)
+    return schema
+
+
+def validate_kwargs(class_object, kwargs):
+    """Return a `Violation` for every kwarg in `kwargs` that would fail to
+    resolve on an instance of the class, without creating one.
+    """
+    return schema_for(class_object).check(kwargs)
+
+
+def validate_records(class_object, records):
+    """Check every kwargs dict in `records`, and return the violations of each
+    one that has any by its index.
+    """
+    schema = schema_for(class_object)
+    invalid = {}
+    for index, record in enumerate(records):
+        violations = schema.check(record)
+        if violations:
+            invalid[index] = violations
+    return invalid
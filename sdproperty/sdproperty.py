@@ -1,21 +1,54 @@
+import copy
+import inspect
 import re
 from functools import wraps
 
-from sdproperty.utils import combine_dicts
-from sdproperty.utils import combine_lists
+from sdproperty import instrumentation
+from sdproperty import tracing
+
+from sdproperty.bulk import from_records
+from sdproperty.cache import get_cache
+from sdproperty.cache import memoize_default
+from sdproperty.cache import memoize_transform
+from sdproperty.compiler import ResolutionPlan
+from sdproperty.compiler import UNRESOLVED
+from sdproperty.compiler import compile_resolver
+from sdproperty.compiler import forget_inputs
+from sdproperty.graph import DependencyGraph
+from sdproperty.graph import referenced_names
+from sdproperty.interning import flyweight
+from sdproperty.interning import get_pool
+from sdproperty.schema import validate_kwargs
+from sdproperty.schema import validate_records
+from sdproperty.seal import UNRESOLVED_ATTR
+from sdproperty.seal import kwargs_readers
+from sdproperty.seal import mark_resolved
+from sdproperty.seal import slotted_mark_resolved
+from sdproperty.superkeys import SUBTREES_ATTR
+from sdproperty.superkeys import SuperkeyTrie
+from sdproperty.utils import COMBINE_STRATEGIES
 from sdproperty.utils import get_subkey_from_dict
+from sdproperty.validators import Rule
+from sdproperty.validators import as_rule
+from sdproperty.views import OverlayDict
 from sdproperty.exceptions import MetaclassNotSetException
-from sdproperty.exceptions import RequiredPropertyException
 from sdproperty.exceptions import TransformNotCallableException
 from sdproperty.exceptions import MismatchedPropertyTypesException
-from sdproperty.exceptions import InvalidPropertyException
+from sdproperty.exceptions import UndeclaredInputsException
+from sdproperty.exceptions import UnsealableClassException
 
 
-def sdproperty(func):
+def sdproperty(func=None, **options):
     """A decorator that simply adds a flag on to the function it's wrapping so
     that it can be identified later as being decorated by the sdproperty.
+
+    It can also be called with the keyword arguments of the SDProperty that
+    the function is replaced with, eg. `@sdproperty(singleton=False)`.
     """
-    func.__sdproperty__ = True
+    if func is None:
+        return lambda func: sdproperty(func, **options)
+
+    func.__sdproperty__ = options
 
     @wraps(func)
     def decorator(*args, **kwargs):
@@ -34,33 +67,44 @@ class SDProperty:
                  validate=None,
                  combine_defaults=True,
                  superkeys=None,
-                 transform=None):
+                 transform=None,
+                 cached=None,
+                 tracked=False,
+                 threadsafe=None,
+                 memoize=None,
+                 inputs=None,
+                 interned=None):
         self.name = name
         self.default = default
         self.singleton = singleton
         self.required = required
         self.validate = validate
         self.combine_defaults = combine_defaults
+        if not callable(combine_defaults) and combine_defaults and \
+           combine_defaults not in COMBINE_STRATEGIES:
+            raise ValueError(f'Unknown combine_defaults strategy: {combine_defaults!r}')
         self.superkeys = superkeys
         self.transform = transform
+        self.cached = cached
+        self.tracked = tracked
+        self.threadsafe = threadsafe
+        self.memoize = memoize
+        self.inputs = None if inputs is None else tuple(inputs)
+        self.interned = interned
 
     def _required_value_not_set(self, default):
         return default is None and self.required
 
-    def _validate(self, value):
-        if callable(self.validate):
-            return self.validate(value)
-        if isinstance(self.validate, str): # Assume Regex pattern.
-            if re.match(self.validate, str(value)):
-                return True
-        return False
-
-    def _combine_with_defaults(self, value, default):
+    def combine_with_defaults(self, value, default):
+        """Return a kwarg combined with the default of the property, the way
+        it's combined when the property is resolved.
+        """
         if self.combine_defaults and default:
-            if isinstance(value, dict):
-                return combine_dicts(default, value)
-            if isinstance(value, list):
-                return combine_lists(default, value)
+            if callable(self.combine_defaults):
+                return self.combine_defaults(default, value)
+            for value_type, combine in COMBINE_STRATEGIES[self.combine_defaults].items():
+                if isinstance(value, value_type):
+                    return combine(default, value)
 
         return value
 
@@ -76,14 +120,20 @@ class SDProperty:
         if self.default and \
            not callable(self.default) and \
            not isinstance(self.default, SDProperty) and \
-           not isinstance(value, type(self.default)):
+           not isinstance(value, self._value_types()):
             raise MismatchedPropertyTypesException(self.name, self.default, value)
 
-    def _set_property_from_kwarg(self, instance, kwargs, default):
-        # Set the attribute to the value passed into the kwarg.
-        value = self._combine_with_defaults(kwargs[self.name], default)
-        value = self._apply_transform(value, instance)
-        self.__set__(instance, value)
+    def _value_types(self):
+        # Overlay views stand in for the dict default they're layered over.
+        if self.combine_defaults == 'overlay' and isinstance(self.default, dict):
+            return (type(self.default), OverlayDict)
+        return (type(self.default),)
+
+    def is_resolved(self, instance):
+        """Return whether a value of the property is stored on an instance."""
+        if self.slot:
+            return getattr(instance, self.slot, UNRESOLVED) is not UNRESOLVED
+        return instance.__dict__.get(self.name, None) is not None
 
     @staticmethod
     def _property_unset(instance, value):
@@ -107,60 +157,339 @@ class SDProperty:
             return instance.kwargs
         return {}
 
+    def _default_kind(self):
+        if self.default is None:
+            return 'none'
+        if isinstance(self.default, SDProperty):
+            return 'sdproperty'
+        if inspect.iscoroutinefunction(self.default):
+            return 'async'
+        if callable(self.default):
+            return 'callable'
+        return 'literal'
+
+    def _superkeys_kind(self):
+        if not self.superkeys:
+            return 'none'
+        if isinstance(self.superkeys, SDProperty):
+            return 'sdproperty'
+        return 'list'
+
+    def _planned_superkeys_kind(self, class_object):
+        # List superkeys are routed through the trie of the class when it has
+        # one, which it only does if more than one property has them.
+        kind = self._superkeys_kind()
+        if kind == 'list' and getattr(class_object, '__sdproperty_superkeys__', None) is not None:
+            return 'routed'
+        return kind
+
+    def _validate_kind(self):
+        # An empty set of valid values rejects everything.
+        if self.validate is None:
+            return 'none'
+        if isinstance(self.validate, (Rule, set, frozenset)):
+            return 'rule'
+        if callable(self.validate):
+            return 'callable'
+        if isinstance(self.validate, (str, re.Pattern)): # Assume Regex pattern.
+            return 'regex'
+        return 'invalid'
+
+    def _transform_kind(self):
+        if not self.transform:
+            return 'none'
+        if callable(self.transform):
+            return 'callable'
+        return 'invalid'
+
+    def _combine_types(self, default_kind):
+        if not self.combine_defaults or default_kind == 'none':
+            return ()
+        if default_kind == 'literal' and not self.default:
+            return ()
+        # Custom strategies decide for themselves what they can combine.
+        if callable(self.combine_defaults):
+            return (object,)
+        combine_types = tuple(COMBINE_STRATEGIES[self.combine_defaults])
+        if default_kind == 'literal':
+            return tuple(value_type for value_type in combine_types
+                         if isinstance(self.default, value_type))
+        return combine_types
+
+    def input_names(self, class_object):
+        """Return the attributes the value of the property is computed from
+        on a class, as declared, or else as far as they can be found from the
+        callback.
+        """
+        if self.inputs is not None:
+            return self.inputs
+        inputs = class_object.__sdproperty_graph__.dependencies[self.name]
+        if self._default_kind() in ('callable', 'async') and 'kwargs' in referenced_names(self.default):
+            inputs += ('kwargs',)
+        return inputs
+
+    def _inputs(self, class_object):
+        # Only non-singleton properties are recomputed, so only those need to
+        # track what they're computed from.
+        if self.singleton or not self.tracked or class_object is None:
+            return None
+        if self.inputs is None and self._default_kind() in ('callable', 'async'):
+            raise UndeclaredInputsException(self.name, class_object)
+        return self.input_names(class_object)
+
+    def _callables(self, class_object, stats=None):
+        # The default and transform that are called when the property is
+        # resolved, wrapped to share their results between instances if the
+        # property is memoized.
+        default, transform = self.default, self.transform
+        # Caches may be empty, so they can't be checked for truthiness.
+        if self.memoize is not None and self.memoize is not False and class_object is not None:
+            cache = self.cache
+            if stats is not None:
+                cache = instrumentation.CountingCache(stats, cache)
+            key = (f'{class_object.__module__}.{class_object.__qualname__}', self.name)
+            if self._default_kind() == 'callable':
+                if self.inputs is None:
+                    raise UndeclaredInputsException(self.name, class_object)
+                default = memoize_default(cache, key, default, self.input_names(class_object))
+            if self._transform_kind() == 'callable':
+                transform = memoize_transform(cache, key, transform)
+        return default, transform
+
+    @property
+    def cache(self):
+        """The cache the results of the property are memoized in, created
+        the first time it's needed and kept when the property is compiled
+        again. None if the property isn't memoized.
+        """
+        if self.memoize is None or self.memoize is False:
+            return None
+        if self._cache is None:
+            self._cache = get_cache(self.memoize)
+        return self._cache
+
+    _cache = None
+
+    def _plan(self, class_object=None):
+        default_kind = self._default_kind()
+        check_type = default_kind == 'literal' and bool(self.default)
+        return ResolutionPlan(
+            name=self.name,
+            singleton=self.singleton,
+            required=self.required,
+            default_kind=default_kind,
+            superkeys_kind=self._planned_superkeys_kind(class_object),
+            validate_kind=self._validate_kind(),
+            transform_kind=self._transform_kind(),
+            combine_types=self._combine_types(default_kind),
+            check_type=check_type,
+            value_types=self._value_types() if check_type else None,
+            slot=self.slot,
+            inputs=self._inputs(class_object),
+            threadsafe=self._is_threadsafe(class_object),
+            autoseal=self.singleton and SDProperty._is_autoseal(class_object),
+            interned=self._intern_pool(class_object))
+
+    def _is_threadsafe(self, class_object):
+        if self.threadsafe is not None:
+            return self.threadsafe
+        options = getattr(class_object, '__sdproperty_options__', {})
+        return options.get('threadsafe', False)
+
+    def _intern_pool(self, class_object):
+        interned = self.interned
+        if interned is None:
+            options = getattr(class_object, '__sdproperty_options__', {})
+            interned = options.get('interned', False)
+        # Pools may be empty, so they can't be checked for truthiness.
+        if interned is None or interned is False:
+            return None
+        return get_pool(interned)
+
     @staticmethod
-    def _get_sdproperty_default(instance, default):
-        if SDProperty._property_unset(instance, default.name):
-            # If the default is another property, call it to get the value.
-            return getattr(instance, default.name)
+    def _is_autoseal(class_object):
+        options = getattr(class_object, '__sdproperty_options__', {})
+        return options.get('autoseal', False)
 
-        # If default attr has already been evaluated, set to the stored value.
-        return instance.__dict__[default.name]
+    def _declared_dependencies(self):
+        return {value.name for value in (self.default, self.superkeys) if isinstance(value, SDProperty)}
 
-    @staticmethod
-    def _get_default(instance, default):
-        # Note: We can't modify the class default attr so that it isn't cached.
-        if isinstance(default, SDProperty):
-            return SDProperty._get_sdproperty_default(instance, default)
-        if callable(default):
-            # If the default is a class method, evaluate and store the result.
-            return default(instance)
+    def _dependencies(self):
+        dependencies = self._declared_dependencies()
+        if self._default_kind() in ('callable', 'async'):
+            dependencies.update(referenced_names(self.default))
+        if self.inputs is not None:
+            dependencies.update(self.inputs)
 
-        return default
+        return dependencies
 
-    def __get__(self, instance, class_object):
-        SDProperty._verify_metaclass(class_object)
+    # The name of the slot the value is stored in, set by the metaclass when
+    # the class uses the `slots` option.
+    slot = None
+
+    def _store(self, instance, value):
+        instance.__dict__[self.name] = value
+
+    # The plan the property was last compiled from, set when the
+    # SDPropertyMetaclass creates the class the property is declared on.
+    plan = None
+
+    @property
+    def resolver(self):
+        """The `CompiledResolver` of the property, None until it's compiled."""
+        return self._resolver
+
+    _resolver = None
+
+    def _compile(self, class_object=None):
+        plan = self.plan = self._plan(class_object)
+        store_inputs = None
+        if self.slot:
+            self._store = getattr(class_object, self.slot).__set__
+        else:
+            self._store = SDProperty._store.__get__(self)
+        if plan.inputs is not None:
+            if self.slot:
+                store_inputs = getattr(class_object, f'_sdproperty_inputs_{self.name}').__set__
+            self._store = self._tracked_store(self._store)
+        if instrumentation.is_enabled():
+            self._resolver = self._compile_instrumented(class_object, plan, store_inputs)
+        else:
+            default, transform = self._callables(class_object)
+            self._resolver = compile_resolver(self, plan, self._store, store_inputs, default, transform)
+            self.__dict__.pop('_value_is_valid', None)
+        self._get = self._resolver.get
+
+        # Remembered so the property can be compiled again with or without
+        # instrumentation.
+        self._compiled_class = class_object
+        instrumentation.register(self)
+
+    def recompile(self):
+        """Compile the property again for the class it was last compiled for,
+        e.g. once instrumentation has been enabled or disabled.
+        """
+        self._compile(self._compiled_class)
+
+    def _compile_instrumented(self, class_object, plan, store_inputs):
+        stats = instrumentation.stats_for(class_object, self.name)
+        default, transform = self._callables(class_object, stats)
+        validate = match = None
+        if plan.default_kind == 'callable':
+            default = instrumentation.timed(stats, 'default', default)
+        if plan.transform_kind == 'callable':
+            transform = instrumentation.timed(stats, 'transform', transform)
+        if plan.validate_kind in ('callable', 'rule'):
+            validate = instrumentation.timed(stats, 'validate', as_rule(self.validate))
+        elif plan.validate_kind == 'regex':
+            match = instrumentation.timed(stats, 'validate', re.match)
+        self._value_is_valid = instrumentation.counted_set(
+            stats, SDProperty._value_is_valid.__get__(self))
+
+        resolver = compile_resolver(self, plan, self._store, store_inputs, default, transform,
+                                    validate, match, tracing.set_source)
+        return instrumentation.instrument_resolver(stats, resolver)
+
+    def _tracked_store(self, store):
+        # A value that's set explicitly is only kept until the property is
+        # read again, the same as any other non-singleton property.
+        def tracked_store(instance, value):
+            store(instance, value)
+            forget_inputs(instance, self.name)
+
+        return tracked_store
+
+    def _get(self, instance):
+        # Replaced by the compiled getter once the SDPropertyMetaclass has
+        # created the class the property is declared on.
+        SDProperty._verify_metaclass(type(instance))
+        self._compile()
+        return self._get(instance)
 
+    def __get__(self, instance, class_object):
         # Return if the property is called on an uninstantiated class.
         if instance is None:
+            SDProperty._verify_metaclass(class_object)
             return self
 
-        default = SDProperty._get_default(instance, self.default)
-        instance_kwargs = SDProperty._get_instance_kwargs(instance, self.superkeys)
-
-        if not self.singleton or SDProperty._property_unset(instance, self.name):
-            # We have to check if not None in case the value is a negative bool.
-            if self.singleton and instance_kwargs.get(self.name, None) is not None:
-                if self.validate and not self._validate(instance_kwargs[self.name]):
-                    raise InvalidPropertyException(
-                        self.name, instance_kwargs[self.name], self.validate)
-                self._set_property_from_kwarg(instance, instance_kwargs, default)
-            elif self._required_value_not_set(default):
-                raise RequiredPropertyException(self.name, instance)
-            else:
-                value = self._apply_transform(default, instance)
-                self.__set__(instance, value)
-
-        return instance.__dict__[self.name]
+        return self._get(instance)
 
     def __set__(self, instance, value):
         self._value_is_valid(value)
-        instance.__dict__[self.name] = value
+        self._store(instance, value)
+        if self.singleton and SDProperty._is_autoseal(type(instance)):
+            (slotted_mark_resolved if self.slot else mark_resolved)(instance, self.name)
+
+
+class CachedSDPropertyAccessor:
+    """A non-data descriptor installed in place of a cached SDProperty.
+
+    Because it doesn't define `__set__`, once the wrapped property has been
+    resolved and stored in the instance `__dict__` every following read is a
+    plain attribute lookup that never reaches the descriptor.
+    """
+
+    def __init__(self, sdproperty):
+        self.sdproperty = sdproperty
+
+    def __get__(self, instance, class_object):
+        # Return the SDProperty itself on the class so that it can still be
+        # used as a default or superkey of other properties.
+        if instance is None:
+            return self.sdproperty
+
+        return self.sdproperty.__get__(instance, class_object)
+
+
+def _make_cached_setattr(class_object):
+    def __setattr__(instance, name, value):
+        # Explicit assignment to a cached property skips the descriptor, so it
+        # has to be set through the SDProperty that the accessor stands in for.
+        sdproperty = type(instance).__sdproperty_cached__.get(name)
+        if sdproperty is not None:
+            sdproperty.__set__(instance, value)
+        else:
+            super(class_object, instance).__setattr__(name, value)
+
+    __setattr__.__sdproperty_setattr__ = True
+    return __setattr__
+
+
+# The class options that change how the properties of a class are compiled or
+# installed on it.
+_COMPILED_OPTIONS = frozenset(['cached', 'threadsafe', 'interned', 'autoseal'])
 
 
 class SDPropertyMetaclass(type):
+    """Names the SDProperties of a class and applies the class options.
+
+    Options are passed as class keywords and are inherited by subclasses. A
+    subclass that sets `cached`, `threadsafe`, `interned` or `autoseal` also
+    applies it to the properties it inherits, which it compiles its own copy
+    of:
+
+        cached: Serve resolved singleton properties through plain attribute
+                lookup instead of `SDProperty.__get__`. Can be overridden per
+                property with `SDProperty(cached=...)`.
+        slots:  Store the values of the properties declared on the class, and
+                the `kwargs`, in generated `__slots__` instead of the instance
+                `__dict__`. Has to be set on the highest class to remove the
+                `__dict__` altogether, and makes `cached` have no effect.
+        threadsafe: Only let one thread resolve a singleton property of an
+                instance, while any other thread reading it at the same time
+                waits for the result. Can be overridden per property with
+                `SDProperty(threadsafe=...)`.
+        interned: Intern resolved values in a shared pool of frozen values,
+                see `sdproperty.interning`. Can be overridden per property
+                with `SDProperty(interned=...)`, which also takes an
+                `InternPool` to use instead of the default one.
+        autoseal: Seal each instance, releasing its kwargs, as soon as every
+                singleton property has been resolved, see
+                `sdproperty.seal.seal`.
+    """
 
-    def __new__(cls, name, bases, attrs):
-        for attr_name, attr_val in attrs.items():
+    def __new__(cls, name, bases, attrs, **options):
+        for attr_name, attr_val in list(attrs.items()):
             if isinstance(attr_val, SDProperty):
                 # Apply names to SDProperty descriptors.
                 attr_val.name = attr_name
@@ -168,6 +497,138 @@ class SDPropertyMetaclass(type):
                 attr_func = attr_val.__wrapped__
                 # Replace the attribute with a SDProperty of the same name so
                 # that when it's called it will evaluate the wrapped method.
-                attrs[attr_name] = SDProperty(name=attr_name, default=attr_func)
+                attrs[attr_name] = SDProperty(name=attr_name, default=attr_func,
+                                              **attr_val.__sdproperty__)
+
+        sdproperties = {}
+        for base in reversed(bases):
+            sdproperties.update(getattr(base, '__sdproperties__', {}))
+        for attr_name, attr_val in attrs.items():
+            sdproperties.pop(attr_name, None)
+            if isinstance(attr_val, SDProperty):
+                sdproperties[attr_name] = attr_val
+        attrs['__sdproperties__'] = sdproperties
+
+        class_options = {}
+        for base in reversed(bases):
+            class_options.update(getattr(base, '__sdproperty_options__', {}))
+        class_options.update(options)
+        attrs['__sdproperty_options__'] = class_options
+
+        superkey_trie = SuperkeyTrie.for_properties(sdproperties)
+        attrs['__sdproperty_singletons__'] = None
+        if class_options.get('autoseal'):
+            attrs['__sdproperty_singletons__'] = frozenset(
+                attr_name for attr_name, attr_val in sdproperties.items() if attr_val.singleton)
+        if class_options.get('slots'):
+            SDPropertyMetaclass._add_slots(bases, attrs, class_options, superkey_trie)
+        if _COMPILED_OPTIONS.intersection(options):
+            SDPropertyMetaclass._inherit_properties(attrs, sdproperties)
+
+        cached = {}
+        for base in reversed(bases):
+            cached.update(getattr(base, '__sdproperty_cached__', {}))
+        for attr_name, attr_val in list(attrs.items()):
+            cached.pop(attr_name, None)
+            if isinstance(attr_val, SDProperty):
+                if SDPropertyMetaclass._is_cached(attr_val, class_options):
+                    cached[attr_name] = attr_val
+                    attrs[attr_name] = CachedSDPropertyAccessor(attr_val)
+        attrs['__sdproperty_cached__'] = cached
+
+        class_object = super(SDPropertyMetaclass, cls).__new__(cls, name, bases, attrs)
+        class_object.__sdproperty_graph__ = DependencyGraph(class_object, sdproperties)
+        class_object.__sdproperty_superkeys__ = superkey_trie
+
+        # Compile every property declared on this class into its resolver.
+        for attr_val in list(attrs.values()):
+            if isinstance(attr_val, CachedSDPropertyAccessor):
+                attr_val = attr_val.sdproperty
+            if isinstance(attr_val, SDProperty):
+                attr_val._compile(class_object)
+
+        if class_options.get('autoseal'):
+            readers = kwargs_readers(class_object)
+            if readers:
+                raise UnsealableClassException(class_object, readers)
+
+        # Only the highest class with cached properties needs the hook, every
+        # subclass looks up its own `__sdproperty_cached__` through it.
+        if cached and '__setattr__' not in attrs and \
+           not hasattr(class_object.__setattr__, '__sdproperty_setattr__'):
+            class_object.__setattr__ = _make_cached_setattr(class_object)
+
+        return class_object
+
+    def from_records(cls, records, materialize=True, errors=None, lazy=False, batch_size=1000):
+        """Create and resolve an instance for each kwargs dict in `records`,
+        see `sdproperty.bulk.from_records`.
+        """
+        return from_records(cls, records, materialize, errors, lazy, batch_size)
+
+    def flyweight(cls, **kwargs):
+        """Return the live instance created from identical kwargs, or create
+        one, see `sdproperty.interning.flyweight`.
+        """
+        return flyweight(cls, kwargs)
+
+    def validate_kwargs(cls, kwargs):
+        """Return every violation in a kwargs dict without creating an
+        instance, see `sdproperty.schema.validate_kwargs`.
+        """
+        return validate_kwargs(cls, kwargs)
+
+    def validate_records(cls, records):
+        """Return the violations of every kwargs dict in `records` that has
+        any by its index, see `sdproperty.schema.validate_records`.
+        """
+        return validate_records(cls, records)
 
-        return super(SDPropertyMetaclass, cls).__new__(cls, name, bases, attrs)
+    @staticmethod
+    def _inherit_properties(attrs, sdproperties):
+        # Inherited properties are compiled with the options of the class that
+        # declared them, so the class gets its own copy of each of them to
+        # compile with its options. They keep storing their values where they
+        # did, since `slots` only applies to the properties a class declares.
+        for attr_name, attr_val in sdproperties.items():
+            if attr_name not in attrs:
+                # Created first, so that the copy memoizes into the same cache.
+                attr_val.cache  # pylint: disable=pointless-statement
+                attrs[attr_name] = sdproperties[attr_name] = copy.copy(attr_val)
+
+    @staticmethod
+    def _add_slots(bases, attrs, class_options, superkey_trie):
+        slots = attrs.get('__slots__', ())
+        slots = [slots] if isinstance(slots, str) else list(slots)
+        base_slots = {slot for base in bases for class_object in base.__mro__
+                      for slot in class_object.__dict__.get('__slots__', ())}
+
+        for attr_name, attr_val in attrs.items():
+            if isinstance(attr_val, SDProperty):
+                attr_val.slot = f'_sdproperty_{attr_name}'
+                slots.append(attr_val.slot)
+                if attr_val.tracked and not attr_val.singleton:
+                    slots.append(f'_sdproperty_inputs_{attr_name}')
+        extra_slots = ['kwargs']
+        if superkey_trie is not None:
+            extra_slots.append(SUBTREES_ATTR)
+        if class_options.get('autoseal'):
+            extra_slots.append(UNRESOLVED_ATTR)
+        if class_options.get('threadsafe') or \
+           any(isinstance(attr_val, SDProperty) and attr_val.threadsafe for attr_val in attrs.values()):
+            extra_slots.append('_sdproperty_locks')
+        for slot in extra_slots:
+            if slot not in base_slots and slot not in slots:
+                slots.append(slot)
+
+        attrs['__slots__'] = tuple(slots)
+
+    @staticmethod
+    def _is_cached(sdproperty, class_options):
+        # Non-singleton properties are recalculated on every read so they have
+        # to stay data descriptors, and slots can't be shadowed.
+        if not sdproperty.singleton or sdproperty.slot:
+            return False
+        if sdproperty.cached is not None:
+            return sdproperty.cached
+        return class_options.get('cached', False)
@@ -0,0 +1,147 @@
+"""Releasing the kwargs of instances whose properties are all resolved.
+
+Once every singleton property of an instance has been resolved, the kwargs it
+was created with are never read again, but they're kept alive by the
+instance for as long as it lives. Sealing an instance replaces its `kwargs`
+with a shared empty mapping, and drops the superkey subtrees it walked, so
+that they can be freed.
+
+Instances are sealed with `seal`, or automatically as soon as their last
+singleton property is resolved if their class has the `autoseal` option.
+Reading the released kwargs from a callback raises `SealedKwargsException`,
+rather than quietly finding nothing in them.
+"""
+from collections.abc import Mapping
+
+from sdproperty.exceptions import SealedKwargsException
+from sdproperty.exceptions import UnsealableClassException
+from sdproperty.graph import referenced_names
+from sdproperty.superkeys import SUBTREES_ATTR
+
+
+class SealedKwargs(Mapping):
+    """The kwargs of a sealed instance, which raise when they're read.
+
+    They're falsy, so that the resolvers, which never look a kwarg up in
+    falsy kwargs, resolve properties that are read again (e.g. ones that
+    resolved to None) the same way as if no kwargs were passed.
+    """
+
+    def _sealed(self, *args, **kwargs):
+        raise SealedKwargsException()
+
+    __getitem__ = __iter__ = __len__ = __contains__ = get = _sealed
+
+    def __bool__(self):
+        return False
+
+    def __reduce__(self):
+        return 'SEALED_KWARGS'
+
+    def __repr__(self):
+        return '<sealed kwargs>'
+
+
+# The kwargs of every sealed instance.
+SEALED_KWARGS = SealedKwargs()
+
+UNRESOLVED_ATTR = '_sdproperty_unresolved'
+
+
+def kwargs_readers(class_object):
+    """Return the names of the non-singleton properties of a class whose
+    callbacks are found to read the `kwargs` of the instance, which would
+    raise once the instance is sealed.
+    """
+    return [name for name, sdproperty in class_object.__sdproperties__.items()
+            if not sdproperty.singleton and sdproperty.plan.default_kind in ('callable', 'async')
+            and 'kwargs' in referenced_names(sdproperty.default)]
+
+
+def is_sealed(instance):
+    """Return whether an instance has been sealed."""
+    return getattr(instance, 'kwargs', None) is SEALED_KWARGS
+
+
+def _discard(instance, attribute):
+    try:
+        delattr(instance, attribute)
+    except AttributeError:
+        pass
+
+
+def seal(instance):
+    """Resolve every singleton property of an instance, then release its
+    kwargs and the superkey subtrees walked from them.
+
+    Properties are read the same way afterwards, and a property that's set
+    or assigned new kwargs keeps working as before. Raises
+    `UnsealableClassException` if a non-singleton property's callback is
+    found to read `self.kwargs`. A callback that reads them some other way,
+    e.g. through a helper method, raises `SealedKwargsException` when it
+    does.
+
+    Returns whether the instance was sealed. It isn't, and keeps its kwargs,
+    if a singleton callback resolved to None, since it's resolved again
+    every time it's read unless the instance is slotted.
+    """
+    class_object = type(instance)
+    readers = kwargs_readers(class_object)
+    if readers:
+        raise UnsealableClassException(class_object, readers)
+    return _release(instance)
+
+
+def _release(instance):
+    if not is_sealed(instance):
+        class_object = type(instance)
+        sdproperties = class_object.__sdproperties__
+        unsealable = False
+        for name in class_object.__sdproperty_graph__.order:
+            sdproperty = sdproperties[name]
+            plan = sdproperty.plan
+            if plan.singleton and getattr(instance, name) is None and not plan.slot and \
+               plan.default_kind in ('callable', 'async'):
+                unsealable = True
+        if unsealable:
+            return False
+        object.__setattr__(instance, 'kwargs', SEALED_KWARGS)
+
+    _discard(instance, SUBTREES_ATTR)
+    _discard(instance, UNRESOLVED_ATTR)
+    return True
+
+
+def _remove(instance, unresolved, name):
+    # Only the property that was the last one left seals the instance, not
+    # the ones read again while it's being sealed. An instance that can't be
+    # sealed keeps the empty set, so it isn't tried again.
+    if name in unresolved:
+        unresolved.remove(name)
+        if not unresolved:
+            _release(instance)
+
+
+def mark_resolved(instance, name):
+    """Record that a singleton property of an instance of an `autoseal` class
+    has been resolved, and seal the instance once they all have been.
+    """
+    unresolved = instance.__dict__.get(UNRESOLVED_ATTR)
+    if unresolved is None:
+        singletons = type(instance).__sdproperty_singletons__
+        if singletons is None or instance.__dict__.get('kwargs') is SEALED_KWARGS:
+            return
+        unresolved = instance.__dict__[UNRESOLVED_ATTR] = set(singletons)
+    _remove(instance, unresolved, name)
+
+
+def slotted_mark_resolved(instance, name):
+    """`mark_resolved` for instances that keep what's unresolved in a slot."""
+    unresolved = getattr(instance, UNRESOLVED_ATTR, None)
+    if unresolved is None:
+        singletons = type(instance).__sdproperty_singletons__
+        if singletons is None or getattr(instance, 'kwargs', None) is SEALED_KWARGS:
+            return
+        unresolved = set(singletons)
+        object.__setattr__(instance, UNRESOLVED_ATTR, unresolved)
+    _remove(instance, unresolved, name)
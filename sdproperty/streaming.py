@@ -0,0 +1,248 @@
+"""Creating instances from YAML, JSON and NDJSON sources one record at a time.
+
+Only a single document (and at most a batch of instances) is held in memory
+at a time, however large the source is.
+"""
+import codecs
+import io
+import json
+import os
+from itertools import islice
+
+from sdproperty.bulk import RecordError
+from sdproperty.bulk import resolve_batch
+from sdproperty.exceptions import InvalidRecordException
+
+
+FORMATS = {
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.json': 'json',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+}
+
+_CHUNK_SIZE = 64 * 1024
+
+# The most characters of a single JSON value that are read before a value that
+# still can't be decoded is taken to be malformed rather than cut off.
+MAX_RECORD_SIZE = 64 * 1024 * 1024
+
+_decoder = json.JSONDecoder()
+
+
+def _iter_ndjson(stream):
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _iter_json(stream):
+    # Yields each of the concatenated top-level values in the stream, or each
+    # element of a top-level array, decoding only one value at a time.
+    buffer = ''
+    position = 0
+    in_array = None
+    # Inside an array, what has to come next: 'element' or the end of the
+    # array after the opening bracket, 'comma' or the end after an element,
+    # and only 'value' after a comma.
+    expecting = 'element'
+    exhausted = False
+
+    while True:
+        # Skip the whitespace between values.
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n':
+                position += 1
+            if position < len(buffer) or exhausted:
+                break
+            buffer, position = stream.read(_CHUNK_SIZE), 0
+            exhausted = not buffer
+
+        if position == len(buffer):
+            if in_array:
+                raise json.JSONDecodeError(
+                    "Expecting ',' delimiter" if expecting == 'comma' else 'Expecting value', buffer, position)
+            return
+        if in_array is None:
+            in_array = buffer[position] == '['
+            if in_array:
+                position += 1
+                continue
+        if in_array:
+            if buffer[position] == ']' and expecting != 'value':
+                return
+            if expecting == 'comma':
+                if buffer[position] != ',':
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+                position += 1
+                expecting = 'value'
+                continue
+            # An empty element, like the second one of `[1,,2]`.
+            if buffer[position] in ',]':
+                raise json.JSONDecodeError('Expecting value', buffer, position)
+
+        try:
+            value, end = _decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # The value is cut off by the end of the buffer, so read more. The
+            # reads grow with the buffer so a large value is decoded in as
+            # few attempts as a small one, up to the largest record allowed.
+            size = len(buffer) - position
+            if exhausted or size >= MAX_RECORD_SIZE:
+                raise
+            chunk = stream.read(min(max(_CHUNK_SIZE, size), MAX_RECORD_SIZE - size))
+            if not chunk:
+                raise
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+
+        # A number at the end of the buffer could continue in the next chunk.
+        if end == len(buffer) and not exhausted and isinstance(value, (int, float)):
+            chunk = stream.read(_CHUNK_SIZE)
+            if chunk:
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            exhausted = True
+
+        yield value
+        position = end
+        expecting = 'comma'
+
+
+def _iter_yaml(stream):
+    try:
+        import yaml  # pylint: disable=import-outside-toplevel
+    except ImportError as error:
+        raise ImportError('Loading YAML requires PyYAML: pip install pyyaml') from error
+
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    yield from yaml.load_all(stream, Loader=loader)
+
+
+_READERS = {
+    'yaml': _iter_yaml,
+    'json': _iter_json,
+    'ndjson': _iter_ndjson,
+}
+
+
+def _format_of(source, format):  # pylint: disable=redefined-builtin
+    if format is not None:
+        if format not in _READERS:
+            raise ValueError(f'Unknown format: {format!r}')
+        return format
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, 'name', None)
+    extension = None
+    if isinstance(name, (str, os.PathLike)):
+        extension = os.path.splitext(os.fspath(name))[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f'Can\'t tell the format of {source!r}, pass format= one of {sorted(_READERS)}')
+    return FORMATS[extension]
+
+
+def iter_documents(source, format=None):  # pylint: disable=redefined-builtin
+    """Yield each document of a YAML, JSON or NDJSON source.
+
+    `source` is a path or an open text or binary stream. The format is taken
+    from the extension of the path (or the `name` of the stream) unless it's
+    given as 'yaml', 'json' or 'ndjson'. JSON sources can be several
+    concatenated documents, or a single array whose elements are yielded one
+    at a time, none of which can be longer than `MAX_RECORD_SIZE` characters.
+    """
+    format = _format_of(source, format)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding='utf-8') as stream:
+            yield from _READERS[format](stream)
+        return
+
+    if isinstance(source, (io.RawIOBase, io.BufferedIOBase)):
+        # Unlike a TextIOWrapper, the reader doesn't close the stream it
+        # wraps once it's garbage collected.
+        source = codecs.getreader('utf-8')(source)
+    yield from _READERS[format](source)
+
+
+def _route(record, class_object, discriminator, classes):
+    if not isinstance(record, dict):
+        raise InvalidRecordException(record, 'it isn\'t a mapping')
+    if not all(isinstance(key, str) for key in record):
+        raise InvalidRecordException(record, 'not all of its keys are strings')
+    if discriminator is None:
+        return class_object
+
+    key = record.get(discriminator)
+    routed = classes.get(key, class_object)
+    if routed is None:
+        raise InvalidRecordException(record, f'there is no class for {discriminator} {key!r}')
+    return routed
+
+
+def _order(class_object, materialize, orders):
+    order = orders.get(class_object)
+    if order is None:
+        graph = class_object.__sdproperty_graph__
+        if materialize is True:
+            order = graph.order
+        elif materialize:
+            # Properties the class doesn't have are only resolved on the
+            # classes that do.
+            order = graph.closure([name for name in materialize if name in graph.dependencies])
+        else:
+            order = []
+        orders[class_object] = order
+    return order
+
+
+def stream_instances(source, class_object=None, format=None,  # pylint: disable=redefined-builtin
+                     discriminator=None, classes=None, materialize=False, errors=None,
+                     batch_size=100):
+    """Yield an instance for each record of a YAML, JSON or NDJSON source.
+
+    Every record is loaded into `class_object`, unless a `discriminator` key
+    is given, in which case each record is loaded into the class in `classes`
+    that the value of its discriminator maps to, or `class_object` if it isn't
+    in `classes`.
+
+    `materialize` is True to resolve every property of each instance, the
+    names of the properties to resolve (along with their dependencies), or
+    False to only create the instances. Records are read and resolved
+    `batch_size` at a time, so that at most one batch is in memory. Records
+    that fail raise, unless an `errors` list is passed, in which case a
+    `sdproperty.bulk.RecordError` is added to it for each and the record is
+    skipped.
+    """
+    if class_object is None and discriminator is None:
+        raise ValueError('Either a class or a discriminator has to be given')
+    classes = classes or {}
+    if isinstance(materialize, str):
+        materialize = [materialize]
+
+    orders = {}
+    records = enumerate(iter_documents(source, format))
+    while True:
+        groups = {}
+        created = 0
+        for index, record in islice(records, batch_size):
+            created += 1
+            try:
+                routed = _route(record, class_object, discriminator, classes)
+            except InvalidRecordException as exception:
+                if errors is None:
+                    raise
+                errors.append(RecordError(index, record, exception))
+                continue
+            groups.setdefault(routed, []).append((index, record, routed(**record)))
+        if not created:
+            return
+
+        resolved = []
+        for routed, batch in groups.items():
+            order = _order(routed, materialize, orders)
+            indexes = {id(instance): index for index, _, instance in batch}
+            resolved += [(indexes[id(instance)], instance)
+                         for instance in resolve_batch(batch, order, errors)]
+        resolved.sort(key=lambda item: item[0])
+        for _, instance in resolved:
+            yield instance
@@ -0,0 +1,123 @@
+"""Routing the kwargs of an instance to the properties under superkeys.
+
+When a class is created, the superkeys of all of its properties are gathered
+into a trie, and the trie is turned into a generated function that walks it.
+The first time an instance reads one of the properties, its kwargs are walked
+once and the subtree at every path is kept on the instance, so properties
+under the same section share one walk instead of each walking down from the
+root. The kwargs are walked again when the `kwargs` attribute is replaced.
+"""
+from sdproperty.utils import get_subkey
+from sdproperty.utils import get_subkey_from_dict
+
+
+SUBTREES_ATTR = '_sdproperty_subtrees'
+
+# Stands in for the subtree under a value that isn't a mapping. Looking a key
+# up in it fails again, so every path below it is unwalkable too.
+_UNWALKABLE = object()
+
+_LITERAL_TYPES = (str, int, float, bool)
+
+
+def _step(dictionary, key):
+    try:
+        return get_subkey(dictionary, key)
+    except AttributeError:
+        return _UNWALKABLE
+
+
+class SuperkeyTrie:
+    """The superkey paths of the properties of a class, with the paths that
+    share a prefix sharing the nodes of that prefix.
+    """
+
+    def __init__(self, paths):
+        self.root = {}
+        self.paths = frozenset(paths)
+        for path in self.paths:
+            node = self.root
+            for key in path:
+                node = node.setdefault(key, {})
+        self.walk = self._compile_walk()
+
+    @classmethod
+    def for_properties(cls, sdproperties):
+        """Return the trie of the list superkeys of the given properties, or
+        None if fewer than two of them have any, since a single property
+        walks its superkeys just as fast by itself.
+        """
+        # Superkeys that are another property are read from its value instead.
+        paths = [tuple(sdproperty.superkeys) for sdproperty in sdproperties.values()
+                 if sdproperty.superkeys and not isinstance(sdproperty.superkeys, type(sdproperty))]
+        return cls(paths) if len(paths) > 1 else None
+
+    def _compile_walk(self):
+        # Every node of the trie becomes a local variable holding the subtree
+        # at its path, found the same way as `get_subkey_from_dict`. Plain
+        # dicts are looked into directly, anything else through `_step`.
+        namespace = {'_step': _step}
+        lines = ['def walk(node_0):']
+        results = []
+        nodes = [((), 'node_0', self.root)]
+        while nodes:
+            path, variable, node = nodes.pop()
+            if path in self.paths:
+                namespace[f'_path_{len(results)}'] = path
+                results.append(f'_path_{len(results)}: {variable}')
+            for key, child in node.items():
+                if type(key) in _LITERAL_TYPES:
+                    key_expression = repr(key)
+                else:
+                    key_expression = f'_key_{len(namespace)}'
+                    namespace[key_expression] = key
+                child_variable = f'node_{len(lines)}'
+                lines += [
+                    f'    value = {variable}.get({key_expression}) if type({variable}) is dict '
+                    f'else _step({variable}, {key_expression})',
+                    f'    {child_variable} = value or {variable}',
+                ]
+                nodes.append((path + (key,), child_variable, child))
+        lines.append(f'    return {{{", ".join(results)}}}')
+
+        exec(compile('\n'.join(lines), '<sdproperty superkeys>', 'exec'), namespace)  # pylint: disable=exec-used
+        return namespace['walk']
+
+
+def _walk(instance, kwargs):
+    # The trie of the class of the instance, which may be a subclass of the
+    # one the property was compiled on.
+    trie = type(instance).__sdproperty_superkeys__
+    if trie is None or (type(kwargs) is not dict and hasattr(kwargs, 'subtree')):
+        # Lazy mappings index every object the walk passes through, and keep
+        # the subtrees they hand out, so each property only walks its own
+        # path through them instead.
+        return {}
+    return trie.walk(kwargs)
+
+
+def subtree(instance, kwargs, path):
+    """Return the subtree of the kwargs of an instance at a tuple of
+    superkeys, walking the trie of its class the first time.
+    """
+    routed = instance.__dict__.get(SUBTREES_ATTR)
+    if routed is None or routed[0] is not kwargs:
+        routed = instance.__dict__[SUBTREES_ATTR] = (kwargs, _walk(instance, kwargs))
+    value = routed[1].get(path, _UNWALKABLE)
+    if value is _UNWALKABLE:
+        # The path isn't in the trie of the class of the instance, or runs
+        # into a value that isn't a mapping, which fails the same way here.
+        return get_subkey_from_dict(kwargs, path)
+    return value
+
+
+def slotted_subtree(instance, kwargs, path):
+    """`subtree` for instances that keep the subtrees in a slot."""
+    routed = getattr(instance, SUBTREES_ATTR, None)
+    if routed is None or routed[0] is not kwargs:
+        routed = (kwargs, _walk(instance, kwargs))
+        object.__setattr__(instance, SUBTREES_ATTR, routed)
+    value = routed[1].get(path, _UNWALKABLE)
+    if value is _UNWALKABLE:
+        return get_subkey_from_dict(kwargs, path)
+    return value
@@ -0,0 +1,155 @@
+"""Tracing of the chains of properties a single read resolves.
+
+Within `trace()` every read of a property is recorded as a `Span`, with the
+spans of the properties it read while it was being resolved as its children.
+Tracing is built on `sdproperty.instrumentation`, which it enables for the
+duration of the trace.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class Span:
+    """A single read of a property.
+
+    `source` is where the value came from: 'kwarg', 'default', 'callback', or
+    'cache' for a value that was already stored on the instance or was found
+    in the cache of a memoized property. `times` holds the nanoseconds spent
+    in the callable default, validator and transform of the property itself.
+    """
+
+    __slots__ = ('class_path', 'name', 'parent', 'children', 'start_ns', 'duration_ns',
+                 'source', 'times', 'error', 'resolved')
+
+    def __init__(self, class_path, name, parent):
+        self.class_path = class_path
+        self.name = name
+        self.parent = parent
+        self.children = []
+        self.start_ns = time.perf_counter_ns()
+        self.duration_ns = None
+        self.source = None
+        self.times = {}
+        self.error = None
+        self.resolved = False
+
+    @property
+    def frame(self):
+        return f'{self.class_path.rpartition(".")[2]}.{self.name}'
+
+    @property
+    def self_ns(self):
+        """The nanoseconds spent in the span but not in any of its children."""
+        return self.duration_ns - sum(child.duration_ns for child in self.children)
+
+    def walk(self):
+        """Yield the span and every span below it, parents first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def as_dict(self):
+        return {
+            'property': f'{self.class_path}.{self.name}',
+            'source': self.source,
+            'duration_ns': self.duration_ns,
+            'times': dict(self.times),
+            'error': self.error,
+            'children': [child.as_dict() for child in self.children],
+        }
+
+    def __repr__(self):
+        return f'<Span {self.frame} {self.source} {self.duration_ns}ns>'
+
+
+_tracer = None
+_current = ContextVar('sdproperty_span', default=None)
+
+
+class Tracer:
+    """Collects the spans of every read while it's active, from any thread."""
+
+    def __init__(self):
+        self.roots = []
+        self._lock = threading.Lock()
+
+    def start(self, class_path, name):
+        """Open a span for a read, below the span of the read in progress if
+        there is one.
+        """
+        parent = _current.get()
+        span = Span(class_path, name, parent)
+        if parent is None:
+            with self._lock:
+                self.roots.append(span)
+        else:
+            parent.children.append(span)
+        return span, _current.set(span)
+
+    @staticmethod
+    def finish(span, token):
+        span.duration_ns = time.perf_counter_ns() - span.start_ns
+        if span.source is None:
+            span.source = 'cache'
+        _current.reset(token)
+
+    def spans(self):
+        """Return every span, parents first."""
+        return [span for root in self.roots for span in root.walk()]
+
+    def collapsed(self):
+        """Return the spans in the collapsed stack format of flame graph
+        tools: a line per chain of reads with the nanoseconds spent in the
+        last of them, e.g. `Config.templates;Config.paths 1250`.
+        """
+        totals = {}
+        for root in self.roots:
+            self._collapse(root, (), totals)
+        return '\n'.join(f'{";".join(stack)} {total}' for stack, total in totals.items())
+
+    def _collapse(self, span, stack, totals):
+        stack += (span.frame,)
+        totals[stack] = totals.get(stack, 0) + max(span.self_ns, 0)
+        for child in span.children:
+            self._collapse(child, stack, totals)
+
+
+def active():
+    """Return the `Tracer` that's recording, None if reads aren't traced."""
+    return _tracer
+
+
+def current():
+    """Return the span of the read in progress."""
+    return _current.get()
+
+
+def set_source(source):
+    span = _current.get()
+    if span is not None:
+        span.source = source
+
+
+def add_time(stage, elapsed):
+    span = _current.get()
+    if span is not None:
+        span.times[stage] = span.times.get(stage, 0) + elapsed
+
+
+@contextmanager
+def trace():
+    """Record every read of a property within the context, yielding the
+    `Tracer` the spans are collected in.
+    """
+    # Imported here, as instrumentation records to the active tracer.
+    from sdproperty import instrumentation  # pylint: disable=import-outside-toplevel
+
+    global _tracer
+    previous, _tracer = _tracer, Tracer()
+    try:
+        with instrumentation.instrumented():
+            yield _tracer
+    finally:
+        _tracer = previous
@@ -1,9 +1,18 @@
-def get_subkey_from_dict(dictionary, subkeys):
-    subkeys = list(subkeys)
+from sdproperty.views import overlay_dicts
+
+
+def get_subkey(dictionary, subkey):
+    # Lazy mappings hand out their subtrees without decoding them.
+    if type(dictionary) is not dict and hasattr(dictionary, 'subtree'):
+        return dictionary.subtree(subkey)
+    return dictionary.get(subkey)
 
+
+def get_subkey_from_dict(dictionary, subkeys):
     for subkey in subkeys:
-        if dictionary.get(subkey):
-            dictionary = dictionary.get(subkey, {})
+        value = get_subkey(dictionary, subkey)
+        if value:
+            dictionary = value
 
     return dictionary
 
@@ -16,10 +25,100 @@ def combine_dicts(dict1, dict2):
     return combined_dict
 
 
+class _ElementIndex:
+    """Membership checks for list elements, using a set for hashable elements
+    and falling back to a linear scan only for unhashable ones.
+    """
+
+    def __init__(self):
+        self.hashable = set()
+        self.unhashable = []
+
+    def add(self, element):
+        """Add the element and return whether it wasn't in the index yet."""
+        try:
+            if element in self.hashable:
+                return False
+            self.hashable.add(element)
+        except TypeError:
+            if element in self.unhashable:
+                return False
+            self.unhashable.append(element)
+
+        return True
+
+
 def combine_lists(list1, list2):
-    # Only the first occurance of a common value will be taken.
-    for element in list2:
-        if element not in list1:
-            list1.append(element)
+    # Only the first occurance of a common value will be taken. Neither list
+    # is modified since the first is usually the default shared by every
+    # instance.
+    index = _ElementIndex()
+    for element in list1:
+        index.add(element)
+
+    return list1 + [element for element in list2 if index.add(element)]
+
+
+def concatenate_lists(list1, list2):
+    return list1 + list2
+
+
+def ordered_set_lists(list1, list2):
+    # Only the first occurance of every value is kept, including values that
+    # are repeated within the default.
+    index = _ElementIndex()
+
+    return [element for elements in (list1, list2) for element in elements if index.add(element)]
+
+
+def deep_merge(default, value):
+    # Dictionaries are merged key by key and lists are combined, anything else
+    # in the kwarg replaces the default.
+    if isinstance(default, dict) and isinstance(value, dict):
+        return deep_merge_dicts(default, value)
+    if isinstance(default, list) and isinstance(value, list):
+        return combine_lists(default, value)
+    return value
+
+
+def deep_merge_dicts(dict1, dict2):
+    # Only the dictionaries on the path to a key in the kwarg are copied, every
+    # subtree of the default that the kwarg doesn't touch is shared with it.
+    merged_dict = dict1.copy()
+    for key, value in dict2.items():
+        if key in dict1:
+            value = deep_merge(dict1[key], value)
+        merged_dict[key] = value
+
+    return merged_dict
+
+
+def freeze(value):
+    # Turn a value into a hashable equivalent, so that it can be part of a
+    # cache key. Equal values of different types (1, 1.0 and True), or with a
+    # different sign (0.0 and -0.0), freeze differently, the same as they're
+    # told apart when they're interned. Raises TypeError if any part of it
+    # can't be hashed.
+    if isinstance(value, dict):
+        return (dict, frozenset((freeze(key), freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(freeze(element) for element in value))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(freeze(element) for element in value))
+    hash(value)
+    value_type = type(value)
+    if value_type is float or value_type is complex:
+        return (value_type, repr(value))
+    return (value_type, value)
+
 
-    return list1
+# The functions used to combine a kwarg with the default of its property for
+# each `combine_defaults` strategy, by the type of the kwarg.
+COMBINE_STRATEGIES = {
+    True: {dict: combine_dicts, list: combine_lists},
+    'append': {dict: combine_dicts, list: combine_lists},
+    'concatenate': {dict: combine_dicts, list: concatenate_lists},
+    'ordered_set': {dict: combine_dicts, list: ordered_set_lists},
+    'overlay': {dict: overlay_dicts, list: combine_lists},
+    'deep': {dict: deep_merge_dicts, list: combine_lists},
+}
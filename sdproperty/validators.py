@@ -0,0 +1,190 @@
+"""Declarative validation rules that are compiled into the property resolvers.
+
+A rule passed as the `validate` of an SDProperty is turned into an inline
+condition in the generated resolver, so checking it doesn't call a Python
+function. Rules can be combined with `AllOf` or `&`, and `AnyOf` or `|`, into a
+single condition that's checked in one pass.
+
+Rules can also be called with a value, which returns whether it's valid.
+"""
+import numbers
+import re
+
+
+class Rule:
+    """The base class of validation rules."""
+
+    def __call__(self, value):
+        raise NotImplementedError
+
+    def condition(self, namespace):
+        """Return a Python expression that's true when `value` is invalid,
+        adding any object it refers to to the `namespace` it's evaluated in.
+        """
+        raise NotImplementedError
+
+    def __and__(self, other):
+        return AllOf(self, other)
+
+    def __or__(self, other):
+        return AnyOf(self, other)
+
+
+def _bind(namespace, value):
+    # Add a value to the namespace of the generated code under a new name.
+    name = f'_rule_{len(namespace)}'
+    namespace[name] = value
+    return name
+
+
+class OneOf(Rule):
+    """Valid if the value is one of the given values."""
+
+    def __init__(self, *values):
+        self.values = frozenset(values)
+
+    def __call__(self, value):
+        return type(value).__hash__ is not None and value in self.values
+
+    def condition(self, namespace):
+        # Unhashable values can't be in the set, and would raise if looked up.
+        return f'(type(value).__hash__ is None or value not in {_bind(namespace, self.values)})'
+
+    def __repr__(self):
+        return f'OneOf({", ".join(sorted(map(repr, self.values)))})'
+
+
+class Range(Rule):
+    """Valid if the value is a real number between `minimum` and `maximum`,
+    inclusive. Either bound can be left out.
+    """
+
+    def __init__(self, minimum=None, maximum=None):
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def __call__(self, value):
+        return isinstance(value, numbers.Real) and \
+            (self.minimum is None or self.minimum <= value) and \
+            (self.maximum is None or value <= self.maximum)
+
+    def condition(self, namespace):
+        # Written the same way as `__call__`, so that NaN is out of range.
+        conditions = [f'not isinstance(value, {_bind(namespace, numbers.Real)})']
+        if self.minimum is not None:
+            conditions.append(f'not {_bind(namespace, self.minimum)} <= value')
+        if self.maximum is not None:
+            conditions.append(f'not value <= {_bind(namespace, self.maximum)}')
+        return f'({" or ".join(conditions)})'
+
+    def __repr__(self):
+        return f'Range(minimum={self.minimum!r}, maximum={self.maximum!r})'
+
+
+class InstanceOf(Rule):
+    """Valid if the value is an instance of any of the given types."""
+
+    def __init__(self, *types):
+        self.types = types
+
+    def __call__(self, value):
+        return isinstance(value, self.types)
+
+    def condition(self, namespace):
+        return f'not isinstance(value, {_bind(namespace, self.types)})'
+
+    def __repr__(self):
+        return f'InstanceOf({", ".join(value_type.__name__ for value_type in self.types)})'
+
+
+class Regex(Rule):
+    """Valid if the start of the value, as a string, matches a regex
+    pattern, which is compiled once when the rule is created.
+    """
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = re.compile(pattern, flags)
+
+    def __call__(self, value):
+        return self.pattern.match(value if type(value) is str else str(value)) is not None
+
+    def condition(self, namespace):
+        # Only values that aren't strings already are converted.
+        match = _bind(namespace, self.pattern.match)
+        return f'{match}(value if type(value) is str else str(value)) is None'
+
+    def __repr__(self):
+        return f'Regex({self.pattern.pattern!r})'
+
+
+class Predicate(Rule):
+    """Valid if a function returns true for the value, so that functions can
+    be combined with the other rules.
+    """
+
+    def __init__(self, function):
+        self.function = function
+
+    def __call__(self, value):
+        return bool(self.function(value))
+
+    def condition(self, namespace):
+        return f'not {_bind(namespace, self.function)}(value)'
+
+    def __repr__(self):
+        return f'Predicate({getattr(self.function, "__qualname__", self.function)!r})'
+
+
+def as_rule(validate):
+    """Return the rule for a value that can be passed as `validate`: a rule,
+    a set of valid values, a regex pattern or a function.
+    """
+    if isinstance(validate, Rule):
+        return validate
+    if isinstance(validate, (set, frozenset)):
+        return OneOf(*validate)
+    if isinstance(validate, (str, re.Pattern)):
+        return Regex(validate)
+    if callable(validate):
+        return Predicate(validate)
+    raise TypeError(f'{validate!r} is not a validation rule')
+
+
+class AllOf(Rule):
+    """Valid if the value passes every one of the given rules, which are
+    checked in order.
+    """
+
+    def __init__(self, *rules):
+        self.rules = tuple(as_rule(rule) for rule in rules)
+
+    def __call__(self, value):
+        return all(rule(value) for rule in self.rules)
+
+    def condition(self, namespace):
+        return f'({" or ".join(rule.condition(namespace) for rule in self.rules)})'
+
+    def __and__(self, other):
+        return AllOf(*self.rules, other)
+
+    def __repr__(self):
+        return f'AllOf({", ".join(map(repr, self.rules))})'
+
+
+class AnyOf(Rule):
+    """Valid if the value passes any of the given rules."""
+
+    def __init__(self, *rules):
+        self.rules = tuple(as_rule(rule) for rule in rules)
+
+    def __call__(self, value):
+        return any(rule(value) for rule in self.rules)
+
+    def condition(self, namespace):
+        return f'({" and ".join(rule.condition(namespace) for rule in self.rules)})'
+
+    def __or__(self, other):
+        return AnyOf(*self.rules, other)
+
+    def __repr__(self):
+        return f'AnyOf({", ".join(map(repr, self.rules))})'
@@ -0,0 +1,91 @@
+"""Views over property values that avoid copying large defaults."""
+from collections.abc import MutableMapping
+
+
+class OverlayDict(MutableMapping):
+    """A dict-like view of several dictionaries layered on top of each other,
+    where a key is looked up in each layer in turn, so that combining a kwarg
+    with its default doesn't copy the default.
+
+    The layers are never modified. The first time the view itself is modified
+    the layers are combined into a real dict that backs the view from then on.
+    """
+
+    def __init__(self, *layers):
+        self.layers = layers
+        self._data = None
+        self._length = None
+
+    def __getitem__(self, key):
+        if self._data is not None:
+            return self._data[key]
+        for layer in self.layers:
+            if key in layer:
+                return layer[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if self._data is not None:
+            return self._data.get(key, default)
+        for layer in self.layers:
+            if key in layer:
+                return layer[key]
+        return default
+
+    def __contains__(self, key):
+        if self._data is not None:
+            return key in self._data
+        return any(key in layer for layer in self.layers)
+
+    def __iter__(self):
+        if self._data is not None:
+            yield from self._data
+            return
+        # Keys are in the same order as `combine_dicts`, with the keys of the
+        # lowest layer first.
+        seen = set()
+        for layer in reversed(self.layers):
+            for key in layer:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self):
+        if self._data is not None:
+            return len(self._data)
+        if self._length is None:
+            self._length = sum(1 for _ in self)
+        return self._length
+
+    def __setitem__(self, key, value):
+        self.materialize()[key] = value
+
+    def __delitem__(self, key):
+        del self.materialize()[key]
+
+    def materialize(self):
+        """Combine the layers into the dict that backs the view, and return it."""
+        if self._data is None:
+            self._data = self.to_dict()
+            self.layers = ()
+        return self._data
+
+    def to_dict(self):
+        """Return a new dict with the combined contents of the view."""
+        if self._data is not None:
+            return self._data.copy()
+        combined_dict = {}
+        for layer in reversed(self.layers):
+            combined_dict.update(layer)
+        return combined_dict
+
+    def copy(self):
+        return self.to_dict()
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+
+def overlay_dicts(dict1, dict2):
+    # Values from the kwarg take precedence, like `combine_dicts`.
+    return OverlayDict(dict2, dict1)
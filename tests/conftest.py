@@ -1,3 +1,8 @@
+import asyncio
+import threading
+import time
+
+from sdproperty.cache import LRUCache
 from sdproperty.sdproperty import sdproperty
 from sdproperty.sdproperty import SDProperty
 from sdproperty.sdproperty import SDPropertyMetaclass
@@ -44,8 +49,15 @@ class DependentProperties(metaclass=SDPropertyMetaclass):
 class CombineWithDefaultsProperties(metaclass=SDPropertyMetaclass):
     dict_combine_attr   = SDProperty(default={'key1': 'val1', 'key2': 'val2'})
     dict_overwrite_attr = SDProperty(default={'key': 'val'}, combine_defaults=False)
+    dict_overlay_attr   = SDProperty(default={'key1': 'val1', 'key2': 'val2'}, combine_defaults='overlay')
+    dict_deep_attr      = SDProperty(default={'section': {'key1': 'val1', 'key2': 'val2'},
+                                              'other_section': {'key': 'val'}},
+                                     combine_defaults='deep')
     list_combine_attr   = SDProperty(default=['elem1'])
     list_overwrite_attr = SDProperty(default=['elem1'], combine_defaults=False)
+    list_concatenate_attr  = SDProperty(default=['elem1'], combine_defaults='concatenate')
+    list_ordered_set_attr  = SDProperty(default=['elem1', 'elem1'], combine_defaults='ordered_set')
+    list_custom_attr       = SDProperty(default=['elem1'], combine_defaults=lambda default, value: value + default)
 
     def __init__(self, **kwargs):
         self.kwargs = kwargs
@@ -116,3 +128,276 @@ class ValidateProperties(metaclass=SDPropertyMetaclass):
 
 class NoMetaclass():
     base_attr = SDProperty()
+
+
+class CachedProperties(metaclass=SDPropertyMetaclass, cached=True):
+    base_attr               = SDProperty()
+    default_attr            = SDProperty(default='default_attr')
+    dependent_attr          = SDProperty(default=base_attr)
+    updating_dependent_attr = SDProperty(default=base_attr, singleton=False)
+    uncached_attr           = SDProperty(default='uncached_attr', cached=False)
+    get_callback_attr       = SDProperty()
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.callback_calls = 0
+
+    @sdproperty
+    def get_callback_attr(self):
+        self.callback_calls += 1
+        return 'callback_attr'
+
+
+class InheritedCachedProperties(CachedProperties):
+    child_attr = SDProperty(default='child_attr')
+
+
+class SlottedProperties(metaclass=SDPropertyMetaclass, slots=True):
+    base_attr               = SDProperty()
+    default_attr            = SDProperty(default='default_attr')
+    dependent_attr          = SDProperty(default=base_attr)
+    updating_dependent_attr = SDProperty(default=base_attr, singleton=False)
+    subkey_attr             = SDProperty(superkeys=['subkey'])
+    get_callback_attr       = SDProperty()
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @sdproperty
+    def get_callback_attr(self):
+        return str(self.base_attr) + '_callback'
+
+
+class InheritedSlottedProperties(SlottedProperties):
+    child_attr = SDProperty(default='child_attr')
+
+
+class TrackedProperties(metaclass=SDPropertyMetaclass):
+    base_attr               = SDProperty()
+    other_attr              = SDProperty(default='other_attr')
+    tracked_dependent_attr  = SDProperty(default=base_attr, singleton=False, tracked=True)
+    tracked_transform_attr  = SDProperty(default=tracked_dependent_attr, singleton=False,
+                                         tracked=True, transform=lambda x: x + '_transformed')
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.callback_calls = 0
+
+    @sdproperty(singleton=False, tracked=True, inputs=['base_attr', 'other_attr'])
+    def tracked_callback_attr(self):
+        self.callback_calls += 1
+        return self.base_attr + '_' + self.other_attr
+
+    @sdproperty(singleton=False, tracked=True, inputs=['kwargs'])
+    def tracked_kwargs_attr(self):
+        return len(self.kwargs)
+
+
+class ConditionalTrackedProperties(metaclass=SDPropertyMetaclass):
+    base_attr     = SDProperty(default='')
+    required_attr = SDProperty(required=True)
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @sdproperty(singleton=False, tracked=True, inputs=['base_attr', 'required_attr'])
+    def conditional_attr(self):
+        return self.required_attr if self.base_attr else 'conditional_attr'
+
+
+class SlottedTrackedProperties(metaclass=SDPropertyMetaclass, slots=True):
+    base_attr              = SDProperty()
+    tracked_dependent_attr = SDProperty(default=base_attr, singleton=False, tracked=True)
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class AsyncProperties(metaclass=SDPropertyMetaclass):
+    base_attr  = SDProperty(default='base_attr')
+    async_attr = SDProperty()
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.calls = []
+        self.running = 0
+        self.most_running = 0
+
+    async def fetch_default(self):
+        await asyncio.sleep(0.05)
+        return 'fetched_default'
+
+    fetched_attr = SDProperty(default=fetch_default, transform=lambda x: x.upper())
+
+    async def run(self, name):
+        # Counts how many callbacks are awaiting at once.
+        self.calls.append(name)
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        await asyncio.sleep(0.05)
+        self.running -= 1
+
+    @sdproperty
+    async def async_attr(self):
+        await self.run('async_attr')
+        return self.base_attr + '_async'
+
+    @sdproperty
+    async def other_async_attr(self):
+        await self.run('other_async_attr')
+        return 'other_async'
+
+    @sdproperty
+    async def dependent_async_attr(self):
+        return self.async_attr + '_' + self.other_async_attr
+
+
+class ThreadsafeProperties(metaclass=SDPropertyMetaclass, threadsafe=True):
+    base_attr = SDProperty(default='base_attr')
+
+    calls = 0
+    calls_lock = threading.Lock()
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @sdproperty
+    def expensive_attr(self):
+        with ThreadsafeProperties.calls_lock:
+            ThreadsafeProperties.calls += 1
+        time.sleep(0.01)
+        return self.base_attr + '_expensive'
+
+
+class SlottedThreadsafeProperties(metaclass=SDPropertyMetaclass, threadsafe=True, slots=True):
+    base_attr = SDProperty(default='base_attr')
+
+    calls = 0
+    calls_lock = threading.Lock()
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @sdproperty
+    def expensive_attr(self):
+        with SlottedThreadsafeProperties.calls_lock:
+            SlottedThreadsafeProperties.calls += 1
+        time.sleep(0.01)
+        return self.base_attr + '_expensive'
+
+
+class InFlight:
+    """Counts how many threads are inside it at once."""
+
+    def __init__(self):
+        self.running = 0
+        self.most_running = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+
+    def __exit__(self, *exc_info):
+        with self.lock:
+            self.running -= 1
+
+
+PARALLEL_IN_FLIGHT = InFlight()
+
+
+class ParallelProperties(metaclass=SDPropertyMetaclass):
+    base_attr = SDProperty(default=2)
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @sdproperty
+    def first_heavy_attr(self):
+        with PARALLEL_IN_FLIGHT:
+            time.sleep(0.1)
+        return self.base_attr * 10
+
+    @sdproperty
+    def second_heavy_attr(self):
+        with PARALLEL_IN_FLIGHT:
+            time.sleep(0.1)
+        return self.base_attr * 100
+
+    @sdproperty
+    def third_heavy_attr(self):
+        with PARALLEL_IN_FLIGHT:
+            time.sleep(0.1)
+        return len(self.kwargs)
+
+    @sdproperty
+    def combined_attr(self):
+        return self.first_heavy_attr + self.second_heavy_attr
+
+
+MEMOIZE_CACHE = LRUCache(maxsize=2)
+
+
+class MemoizedProperties(metaclass=SDPropertyMetaclass):
+    base_attr           = SDProperty()
+    calls               = []
+    transform_attr      = SDProperty(memoize=MEMOIZE_CACHE,
+                                     transform=lambda x: MemoizedProperties.calls.append('transform') or x * 2)
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @sdproperty(memoize=MEMOIZE_CACHE, inputs=['base_attr'])
+    def memoized_attr(self):
+        MemoizedProperties.calls.append('memoized_attr')
+        return f'{self.base_attr}_memoized'
+
+
+class SealedProperties(metaclass=SDPropertyMetaclass, autoseal=True):
+    base_attr               = SDProperty()
+    default_attr            = SDProperty(default='default_attr')
+    updating_dependent_attr = SDProperty(default=base_attr, singleton=False)
+    section_attr            = SDProperty(default={'key': 'val'})
+    section_child_attr      = SDProperty(superkeys=section_attr)
+    subkey_attr             = SDProperty(superkeys=['subkey'])
+    multi_subkey_attr       = SDProperty(superkeys=['subkey', 'nested'])
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @sdproperty
+    def get_callback_attr(self):
+        return f'{self.base_attr}_callback'
+
+
+class SlottedSealedProperties(metaclass=SDPropertyMetaclass, autoseal=True, slots=True):
+    base_attr               = SDProperty()
+    default_attr            = SDProperty(default='default_attr')
+    updating_dependent_attr = SDProperty(default=base_attr, singleton=False)
+    section_attr            = SDProperty(default={'key': 'val'})
+    section_child_attr      = SDProperty(superkeys=section_attr)
+    subkey_attr             = SDProperty(superkeys=['subkey'])
+    multi_subkey_attr       = SDProperty(superkeys=['subkey', 'nested'])
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @sdproperty
+    def get_callback_attr(self):
+        return f'{self.base_attr}_callback'
+
+
+class InternedProperties(metaclass=SDPropertyMetaclass, interned=True):
+    base_attr         = SDProperty()
+    dict_combine_attr = SDProperty(default={'key1': 'val1'})
+    list_attr         = SDProperty(default=['elem1'], transform=lambda x: [elem.upper() for elem in x])
+    uninterned_attr   = SDProperty(default={'key1': 'val1'}, interned=False)
+    subkey_attr       = SDProperty(superkeys=['subkey'])
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @sdproperty(singleton=False)
+    def callback_attr(self):
+        return {'base': self.base_attr}
@@ -0,0 +1,55 @@
+import asyncio
+
+from pytest import raises
+
+from sdproperty.aio import resolve_async
+from sdproperty.exceptions import AsyncPropertyException
+from tests.conftest import AsyncProperties
+
+
+class TestAsyncProperties:
+
+    def test_unresolved_async_attr_raises_exception(self):
+        with raises(AsyncPropertyException):
+            AsyncProperties().async_attr
+
+    def test_async_attr_is_overwritten_by_kwarg(self):
+        expected = 'kwarg_attr'
+        actual = AsyncProperties(async_attr='kwarg_attr').async_attr
+
+        assert expected == actual
+
+    def test_async_attr_is_resolved(self):
+        test_class = AsyncProperties()
+        values = asyncio.run(resolve_async(test_class, 'async_attr'))
+
+        assert {'base_attr': 'base_attr', 'async_attr': 'base_attr_async'} == values
+        assert 'base_attr_async' == test_class.async_attr
+
+    def test_async_default_is_transformed(self):
+        test_class = AsyncProperties()
+        asyncio.run(resolve_async(test_class, 'fetched_attr'))
+
+        expected = 'FETCHED_DEFAULT'
+        actual = test_class.fetched_attr
+
+        assert expected == actual
+
+    def test_async_attr_is_resolved_once(self):
+        test_class = AsyncProperties()
+        asyncio.run(resolve_async(test_class, 'async_attr'))
+        asyncio.run(resolve_async(test_class, 'async_attr'))
+
+        assert ['async_attr'] == test_class.calls
+
+    def test_independent_async_attrs_are_resolved_concurrently(self):
+        test_class = AsyncProperties()
+        asyncio.run(resolve_async(test_class, 'dependent_async_attr'))
+
+        assert 'base_attr_async_other_async' == test_class.dependent_async_attr
+        assert 2 == test_class.most_running
+
+    def test_all_attrs_are_resolved(self):
+        values = asyncio.run(resolve_async(AsyncProperties()))
+
+        assert set(AsyncProperties.__sdproperties__) == set(values)
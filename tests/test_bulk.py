@@ -0,0 +1,54 @@
+from types import GeneratorType
+
+from pytest import raises
+
+from sdproperty.bulk import RecordError
+from sdproperty.exceptions import RequiredPropertyException
+from sdproperty.exceptions import InvalidPropertyException
+from tests.conftest import DependentProperties
+from tests.conftest import RequiredProperties
+from tests.conftest import ValidateProperties
+
+
+class TestFromRecords:
+
+    def test_instances_are_created_and_resolved(self):
+        records = [{'base_attr': 'base_1'}, {'base_attr': 'base_2'}]
+        instances = DependentProperties.from_records(records, materialize=['dependent_attr'])
+
+        assert [vars(instance)['dependent_attr'] for instance in instances] == ['base_1', 'base_2']
+
+    def test_instances_are_not_resolved(self):
+        instances = DependentProperties.from_records([{'base_attr': 'base_1'}], materialize=False)
+
+        assert 'base_attr' not in vars(instances[0])
+
+    def test_lazy_returns_generator(self):
+        records = ({'base_attr': str(index)} for index in range(5))
+        instances = DependentProperties.from_records(records, materialize=['base_attr'], lazy=True, batch_size=2)
+
+        assert isinstance(instances, GeneratorType)
+        assert [instance.base_attr for instance in instances] == ['0', '1', '2', '3', '4']
+
+    def test_failed_record_raises_exception(self):
+        with raises(RequiredPropertyException):
+            RequiredProperties.from_records([{'required_attr': 'val'}, {}])
+
+    def test_failed_records_are_collected(self):
+        records = [{'required_attr': 'val'}, {}, {'required_attr': 'other_val'}]
+        errors = []
+        instances = RequiredProperties.from_records(records, errors=errors)
+
+        assert [instance.required_attr for instance in instances] == ['val', 'other_val']
+        assert len(errors) == 1
+        assert isinstance(errors[0], RecordError)
+        assert errors[0].index == 1
+        assert isinstance(errors[0].exception, RequiredPropertyException)
+
+    def test_invalid_records_are_collected(self):
+        records = [{'validate_lambda_attr': 1}, {'validate_lambda_attr': 5}]
+        errors = []
+        ValidateProperties.from_records(records, materialize=['validate_lambda_attr'], errors=errors)
+
+        assert [error.index for error in errors] == [1]
+        assert isinstance(errors[0].exception, InvalidPropertyException)
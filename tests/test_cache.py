@@ -0,0 +1,238 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from sdproperty import instrumentation
+from sdproperty.cache import LRUCache
+from sdproperty.cache import SQLiteCache
+from sdproperty.cache import MISSING
+from sdproperty.cache import get_cache
+from sdproperty.cache import DEFAULT_CACHE
+from sdproperty.exceptions import UndeclaredInputsException
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+from sdproperty.sdproperty import sdproperty
+from sdproperty.utils import freeze
+from tests.conftest import MEMOIZE_CACHE
+from tests.conftest import MemoizedProperties
+
+
+class TestLRUCache(TestCase):
+
+    def test_missing_key(self):
+        cache = LRUCache()
+
+        assert cache.get('key') is MISSING
+        assert 1 == cache.misses
+
+    def test_least_recently_used_is_evicted(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('key1', 'val1')
+        cache.set('key2', 'val2')
+        cache.get('key1')
+        cache.set('key3', 'val3')
+
+        assert 'val1' == cache.get('key1')
+        assert cache.get('key2') is MISSING
+        assert {'size': 2, 'maxsize': 2, 'hits': 2, 'misses': 1, 'evictions': 1} == cache.stats()
+
+    def test_stats_are_read_under_the_lock(self):
+        cache = LRUCache()
+        stats = []
+
+        with cache._lock:
+            reader = threading.Thread(target=lambda: stats.append(cache.stats()))
+            reader.start()
+            reader.join(timeout=0.05)
+            assert reader.is_alive()
+            cache.misses = 1
+
+        reader.join()
+        assert 1 == stats[0]['misses']
+
+    def test_get_cache(self):
+        assert DEFAULT_CACHE is get_cache(True)
+        assert 10 == get_cache(10).maxsize
+        assert MEMOIZE_CACHE is get_cache(MEMOIZE_CACHE)
+
+
+def _key(values):
+    return ('tests.conftest.MemoizedProperties', 'memoized_attr', 'default', values)
+
+
+def _set_results(path, start):
+    cache = SQLiteCache(path)
+    for index in range(start, start + 20):
+        cache.set(_key((index,)), index)
+
+
+class TestSQLiteCache(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'results.db')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_results_persist_between_caches(self):
+        SQLiteCache(self.path, version='1').set(_key(('base_attr',)), {'key': ['val']})
+        cache = SQLiteCache(self.path, version='1')
+
+        assert {'key': ['val']} == cache.get(_key(('base_attr',)))
+        assert cache.get(_key(('other_attr',))) is MISSING
+        assert 1 == cache.hits and 1 == cache.misses
+
+    def test_version_is_part_of_the_key(self):
+        SQLiteCache(self.path, version='1').set(_key(('base_attr',)), 'val')
+
+        assert SQLiteCache(self.path, version='2').get(_key(('base_attr',))) is MISSING
+
+    def test_set_inputs_are_hashed_in_any_order(self):
+        cache = SQLiteCache(self.path)
+        cache.set(_key((frozenset, frozenset(['a', 'b', 'c']))), 'val')
+
+        assert 'val' == cache.get(_key((frozenset, frozenset(['c', 'b', 'a']))))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = SQLiteCache(self.path, max_bytes=200)
+        cache.set(_key((1,)), 'a' * 80)
+        cache.set(_key((2,)), 'b' * 80)
+        cache.get(_key((1,)))
+        cache.set(_key((3,)), 'c' * 80)
+
+        assert cache.get(_key((2,))) is MISSING
+        assert 'a' * 80 == cache.get(_key((1,)))
+        assert 2 == len(cache)
+        assert 1 == cache.evictions
+
+    def test_unpicklable_results_are_not_stored(self):
+        cache = SQLiteCache(self.path)
+        cache.set(_key((1,)), lambda: None)
+
+        assert cache.get(_key((1,))) is MISSING
+
+    def test_concurrent_processes(self):
+        SQLiteCache(self.path)
+        context = multiprocessing.get_context('fork')
+        processes = [context.Process(target=_set_results, args=(self.path, start))
+                     for start in range(0, 80, 10)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert all(0 == process.exitcode for process in processes)
+        assert 90 == len(SQLiteCache(self.path))
+
+    def test_memoized_property(self):
+        cache = SQLiteCache(self.path)
+
+        class PersistedProperties(MemoizedProperties):
+            persisted_attr = SDProperty(default=lambda self: self.base_attr.upper(), memoize=cache,
+                                        inputs=['base_attr'])
+
+        PersistedProperties(base_attr='base_attr').persisted_attr
+
+        assert 'BASE_ATTR' == SQLiteCache(self.path).get(
+            (f'{PersistedProperties.__module__}.{PersistedProperties.__qualname__}', 'persisted_attr', 'default', freeze(('base_attr',))))
+
+
+class TestMemoizedProperties(TestCase):
+
+    def setUp(self):
+        MEMOIZE_CACHE.clear()
+        MemoizedProperties.calls.clear()
+
+    def test_callback_is_shared_between_instances(self):
+        values = [MemoizedProperties(base_attr='base_attr').memoized_attr for _ in range(3)]
+
+        assert ['base_attr_memoized'] * 3 == values
+        assert ['memoized_attr'] == MemoizedProperties.calls
+
+    def test_callback_is_evaluated_for_different_inputs(self):
+        MemoizedProperties(base_attr='base_attr').memoized_attr
+        actual = MemoizedProperties(base_attr='other_attr').memoized_attr
+
+        assert 'other_attr_memoized' == actual
+        assert ['memoized_attr', 'memoized_attr'] == MemoizedProperties.calls
+
+    def test_transform_is_shared_between_instances(self):
+        values = [MemoizedProperties(transform_attr=[1]).transform_attr for _ in range(3)]
+
+        assert [[1, 1]] * 3 == values
+        assert ['transform'] == MemoizedProperties.calls
+
+    def test_equal_values_of_different_types_are_cached_apart(self):
+        values = [1, True, 1.0, 0.0, -0.0]
+
+        defaults = [MemoizedProperties(base_attr=value).memoized_attr for value in values]
+        transforms = [MemoizedProperties(transform_attr=value).transform_attr for value in values]
+
+        assert ['1_memoized', 'True_memoized', '1.0_memoized', '0.0_memoized', '-0.0_memoized'] == defaults
+        assert ['2', '2', '2.0', '0.0', '-0.0'] == [repr(value) for value in transforms]
+        assert [int, int, float, float, float] == [type(value) for value in transforms]
+        assert ['memoized_attr'] * 5 + ['transform'] * 5 == MemoizedProperties.calls
+
+    def test_unhashable_inputs_are_not_cached(self):
+        MemoizedProperties(base_attr=object).memoized_attr
+        MemoizedProperties(base_attr={'key': object()}).memoized_attr
+        MemoizedProperties(base_attr={'key': object()}).memoized_attr
+
+        assert 3 == len(MemoizedProperties.calls)
+
+    def test_sized_caches_are_kept_when_recompiled(self):
+        class SizedProperties(metaclass=SDPropertyMetaclass):
+            sized_attr = SDProperty(default=lambda self: [], memoize=10, inputs=[])
+
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+
+        cache = SizedProperties.sized_attr.cache
+        first = SizedProperties().sized_attr
+        with instrumentation.instrumented():
+            assert first is SizedProperties().sized_attr
+
+        assert cache is SizedProperties.sized_attr.cache
+        assert first is SizedProperties().sized_attr
+        assert {'size': 1, 'maxsize': 10, 'hits': 2, 'misses': 1, 'evictions': 0} == cache.stats()
+        assert MemoizedProperties.transform_attr.cache is MEMOIZE_CACHE
+        assert SDProperty().cache is None
+
+    def test_callbacks_have_to_declare_their_inputs(self):
+        with self.assertRaises(UndeclaredInputsException):
+            class HelperProperties(metaclass=SDPropertyMetaclass):
+                region_attr = SDProperty()
+
+                def _host(self):
+                    return f'{self.region_attr}.example.com'
+
+                @sdproperty(memoize=LRUCache())
+                def url_attr(self):
+                    return f'https://{self._host()}'
+
+    def test_declared_inputs_read_through_helpers(self):
+        class HelperProperties(metaclass=SDPropertyMetaclass):
+            region_attr = SDProperty()
+
+            def __init__(self, tenant, **kwargs):
+                self.tenant = tenant
+                self.kwargs = kwargs
+
+            def _host(self):
+                return f'{self.region_attr}.example.com'
+
+            @sdproperty(memoize=LRUCache(), inputs=['region_attr'])
+            def url_attr(self):
+                return f'https://{self._host()}'
+
+            @sdproperty(memoize=LRUCache(), inputs=['tenant'])
+            def label_attr(self):
+                return f'tenant-{self.tenant}'
+
+        assert 'https://eu.example.com' == HelperProperties('a', region_attr='eu').url_attr
+        assert 'https://us.example.com' == HelperProperties('a', region_attr='us').url_attr
+        assert 'tenant-a' == HelperProperties('a').label_attr
+        assert 'tenant-b' == HelperProperties('b').label_attr
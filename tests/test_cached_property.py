@@ -0,0 +1,89 @@
+from pytest import raises
+
+from sdproperty.exceptions import MismatchedPropertyTypesException
+from sdproperty.sdproperty import CachedSDPropertyAccessor
+from sdproperty.sdproperty import SDProperty
+from tests.conftest import CachedProperties
+from tests.conftest import DefaultedProperties
+from tests.conftest import InheritedCachedProperties
+
+
+class TestCachedProperties:
+
+    def test_cached_attr_is_accessor_on_class_dict(self):
+        assert isinstance(CachedProperties.__dict__['default_attr'], CachedSDPropertyAccessor)
+
+    def test_cached_attr_is_sdproperty_on_class(self):
+        assert isinstance(CachedProperties.default_attr, SDProperty)
+
+    def test_cached_attr_is_stored_on_instance(self):
+        test_class = CachedProperties()
+        test_class.default_attr
+
+        expected = 'default_attr'
+        actual = vars(test_class)['default_attr']
+
+        assert expected == actual
+
+    def test_cached_attr_is_overwritten_by_kwarg(self):
+        expected = 'new_attr'
+        actual = CachedProperties(default_attr='new_attr').default_attr
+
+        assert expected == actual
+
+    def test_callback_is_evaluated_once(self):
+        test_class = CachedProperties()
+        test_class.get_callback_attr
+        test_class.get_callback_attr
+
+        expected = 1
+        actual = test_class.callback_calls
+
+        assert expected == actual
+
+    def test_cached_attr_is_overwritten_by_assignment(self):
+        test_class = CachedProperties()
+        test_class.default_attr
+        test_class.default_attr = 'new_attr'
+
+        expected = 'new_attr'
+        actual = test_class.default_attr
+
+        assert expected == actual
+
+    def test_mismatched_assignment_raises_exception(self):
+        with raises(MismatchedPropertyTypesException):
+            CachedProperties().default_attr = 1
+
+    def test_dependent_attr_has_base_attr_value(self):
+        expected = 'base_attr'
+        actual = CachedProperties(base_attr='base_attr').dependent_attr
+
+        assert expected == actual
+
+    def test_non_singleton_attr_is_not_cached(self):
+        test_class = CachedProperties(base_attr='base_attr')
+        test_class.updating_dependent_attr
+        test_class.base_attr = 'new_attr'
+
+        expected = 'new_attr'
+        actual = test_class.updating_dependent_attr
+
+        assert expected == actual
+
+    def test_property_can_opt_out_of_cached_reads(self):
+        assert isinstance(CachedProperties.__dict__['uncached_attr'], SDProperty)
+
+    def test_cached_option_is_inherited(self):
+        assert isinstance(InheritedCachedProperties.__dict__['child_attr'], CachedSDPropertyAccessor)
+
+    def test_cached_option_applies_to_inherited_properties(self):
+        class CachedChildProperties(DefaultedProperties, cached=True):
+            pass
+
+        test_class = CachedChildProperties()
+        test_class.default_attr
+
+        assert isinstance(CachedChildProperties.__dict__['default_attr'], CachedSDPropertyAccessor)
+        assert 'default_attr' == vars(test_class)['default_attr']
+        assert isinstance(DefaultedProperties.__dict__['default_attr'], SDProperty)
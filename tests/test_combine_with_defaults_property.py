@@ -1,3 +1,7 @@
+from pytest import raises
+
+from sdproperty.sdproperty import SDProperty
+from sdproperty.views import OverlayDict
 from tests.conftest import CombineWithDefaultsProperties
 
 
@@ -62,3 +66,58 @@ class TestCombineWithDefaultsProperties:
         actual = test_class.dict_combine_attr
 
         assert expected == actual
+
+    def test_list_default_is_not_modified_by_combining(self):
+        CombineWithDefaultsProperties(list_combine_attr=['elem2']).list_combine_attr
+
+        expected = ['elem1', 'elem3']
+        actual = CombineWithDefaultsProperties(list_combine_attr=['elem3']).list_combine_attr
+
+        assert expected == actual
+
+    def test_list_attr_is_concatenated_with_defaults(self):
+        expected = ['elem1', 'elem1', 'elem2']
+        actual = CombineWithDefaultsProperties(list_concatenate_attr=['elem1', 'elem2']).list_concatenate_attr
+
+        assert expected == actual
+
+    def test_list_attr_is_combined_into_ordered_set(self):
+        expected = ['elem1', 'elem2']
+        actual = CombineWithDefaultsProperties(list_ordered_set_attr=['elem2', 'elem1']).list_ordered_set_attr
+
+        assert expected == actual
+
+    def test_list_attr_is_combined_with_custom_strategy(self):
+        expected = ['elem2', 'elem1']
+        actual = CombineWithDefaultsProperties(list_custom_attr=['elem2']).list_custom_attr
+
+        assert expected == actual
+
+    def test_unknown_strategy_raises_exception(self):
+        with raises(ValueError):
+            SDProperty(combine_defaults='unknown')
+
+    def test_dict_attr_is_overlaid_on_defaults(self):
+        kwarg = {'new_key': 'new_val', 'key2': 'updated_val'}
+        actual = CombineWithDefaultsProperties(dict_overlay_attr=kwarg).dict_overlay_attr
+
+        assert isinstance(actual, OverlayDict)
+        assert CombineWithDefaultsProperties.dict_overlay_attr.default in actual.layers
+        assert {'key1': 'val1', 'new_key': 'new_val', 'key2': 'updated_val'} == actual
+
+    def test_dict_overlay_attr_can_be_assigned_a_dict(self):
+        test_class = CombineWithDefaultsProperties()
+        test_class.dict_overlay_attr = {'key': 'val'}
+
+        assert {'key': 'val'} == test_class.dict_overlay_attr
+
+    def test_dict_attr_is_deep_merged_with_defaults(self):
+        kwarg = {'section': {'key2': 'updated_val'}, 'new_section': {'key': 'val'}}
+        actual = CombineWithDefaultsProperties(dict_deep_attr=kwarg).dict_deep_attr
+
+        expected = {'section': {'key1': 'val1', 'key2': 'updated_val'},
+                    'other_section': {'key': 'val'},
+                    'new_section': {'key': 'val'}}
+
+        assert expected == actual
+        assert CombineWithDefaultsProperties.dict_deep_attr.default['other_section'] is actual['other_section']
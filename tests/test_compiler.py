@@ -0,0 +1,75 @@
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+
+from tests.conftest import CombineWithDefaultsProperties
+from tests.conftest import DependentProperties
+from tests.conftest import TransformProperties
+from tests.conftest import ValidateProperties
+
+
+class CountingDefaultProperties(metaclass=SDPropertyMetaclass):
+    default_calls = 0
+
+    def count_default(self):
+        CountingDefaultProperties.default_calls += 1
+        return 'default_attr'
+
+    counted_attr = SDProperty(default=count_default)
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class TestCompiler:
+
+    def test_default_kinds_are_planned(self):
+        assert DependentProperties.base_attr._plan().default_kind == 'none'
+        assert DependentProperties.dependent_attr._plan().default_kind == 'sdproperty'
+        assert CountingDefaultProperties.counted_attr._plan().default_kind == 'callable'
+        assert TransformProperties.transform_default_attr._plan().default_kind == 'literal'
+
+    def test_superkeys_kinds_are_planned(self):
+        assert DependentProperties.nested_parent_attr._plan().superkeys_kind == 'list'
+        assert DependentProperties.nested_dependent_attr._plan().superkeys_kind == 'sdproperty'
+
+    def test_validate_kinds_are_planned(self):
+        assert ValidateProperties.validate_regex_attr._plan().validate_kind == 'regex'
+        assert ValidateProperties.validate_lambda_attr._plan().validate_kind == 'callable'
+
+    def test_transform_kinds_are_planned(self):
+        assert TransformProperties.transform_attr._plan().transform_kind == 'callable'
+        assert TransformProperties.invalid_transform_attr._plan().transform_kind == 'invalid'
+
+    def test_only_combined_types_are_planned(self):
+        assert CombineWithDefaultsProperties.dict_combine_attr._plan().combine_types == (dict,)
+        assert CombineWithDefaultsProperties.dict_overwrite_attr._plan().combine_types == ()
+
+    def test_compiled_plan_and_resolver(self):
+        sdproperty = CountingDefaultProperties.counted_attr
+        test_class = CountingDefaultProperties()
+
+        assert sdproperty.plan == sdproperty._plan(CountingDefaultProperties)
+        assert sdproperty.plan.value_types is None
+        assert (dict,) == CombineWithDefaultsProperties.dict_combine_attr.plan.value_types
+        assert not sdproperty.is_resolved(test_class)
+        assert 'default_attr' == sdproperty.resolver.resolve(test_class)
+        assert sdproperty.is_resolved(test_class)
+        assert SDProperty().plan is None and SDProperty().resolver is None
+
+    def test_default_is_not_evaluated_when_kwarg_is_set(self):
+        CountingDefaultProperties.default_calls = 0
+        CountingDefaultProperties(counted_attr='kwarg_attr').counted_attr
+
+        expected = 0
+        actual = CountingDefaultProperties.default_calls
+
+        assert expected == actual
+
+    def test_default_is_evaluated_when_kwarg_is_not_set(self):
+        CountingDefaultProperties.default_calls = 0
+
+        expected = 'default_attr'
+        actual = CountingDefaultProperties().counted_attr
+
+        assert expected == actual
+        assert CountingDefaultProperties.default_calls == 1
@@ -0,0 +1,143 @@
+from array import array
+from unittest import mock
+
+import pytest
+
+from sdproperty import frame
+from sdproperty.exceptions import InvalidPropertyException
+from sdproperty.exceptions import InvalidRecordException
+from sdproperty.exceptions import MismatchedPropertyTypesException
+from sdproperty.exceptions import RequiredPropertyException
+from sdproperty.frame import SDPropertyFrame
+from sdproperty.frame import vectorized
+from sdproperty.graph import materialize
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+from sdproperty.sdproperty import sdproperty
+from tests.conftest import CallbackProperties
+from tests.conftest import CombineWithDefaultsProperties
+from tests.conftest import DependentProperties
+from tests.conftest import RequiredProperties
+from tests.conftest import TransformProperties
+
+
+class MeasurementProperties(metaclass=SDPropertyMetaclass):
+    value_attr  = SDProperty(default=0.0, validate=vectorized(lambda column: [x >= 0 for x in column]))
+    scaled_attr = SDProperty(default=value_attr,
+                             transform=vectorized(lambda column: [x * 10 for x in column]))
+    count_attr  = SDProperty(default=1)
+    label_attr  = SDProperty(default='label')
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def describe(self):
+        return f'{self.label_attr}: {self.scaled_attr}'
+
+    @sdproperty
+    def total_attr(self):
+        return self.value_attr * self.count_attr
+
+
+class SectionProperties(metaclass=SDPropertyMetaclass):
+    first_attr  = SDProperty(superkeys=['section', 'subsection'])
+    second_attr = SDProperty(superkeys=['section', 'subsection'])
+    other_attr  = SDProperty(superkeys=['section', 'other'])
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+@pytest.mark.parametrize('class_object, records', [
+    (DependentProperties, [
+        {'base_attr': {'sdproperty_dependent_attr': 1}},
+        {'parent_1': {'parent_2': {'nested_parent_attr': {'nested_dependent_attr': 2}}}},
+        {},
+    ]),
+    (CallbackProperties, [{'base_attr': 'base'}, {}, {'get_callback_attr': 'kwarg'}]),
+    (CombineWithDefaultsProperties, [
+        {'dict_combine_attr': {'key3': 'val3'}, 'list_combine_attr': ['elem2']},
+        {'dict_deep_attr': {'section': {'key3': 'val3'}}, 'list_custom_attr': ['elem0']},
+    ]),
+    (TransformProperties, [{'transform_attr': 1, 'transform_func_attr': 2},
+                           {'transform_attr': 3, 'transform_func_attr': 4, 'transform_default_attr': 4}]),
+    (MeasurementProperties, [{'value_attr': 1.5, 'count_attr': 2}, {'label_attr': 'other'}]),
+    (SectionProperties, [
+        {'section': {'subsection': {'first_attr': 1, 'second_attr': 2}, 'other': {'other_attr': 3}}},
+        {'section': {'other': {}}},
+        {},
+    ]),
+])
+def test_frame_matches_instances(class_object, records):
+    names = [name for name in class_object.__sdproperties__ if name != 'invalid_transform_attr']
+    expected = [{name: getattr(class_object(**record), name) for name in names} for record in records]
+
+    result = SDPropertyFrame(class_object, records, names)
+
+    assert len(records) == len(result)
+    assert expected == [{name: getattr(row, name) for name in names} for row in result]
+
+
+class TestSDPropertyFrame:
+
+    def test_columns_are_typed(self):
+        result = SDPropertyFrame(MeasurementProperties, [{'value_attr': 1.5}, {'count_attr': 2**70}, {}])
+
+        assert [1.5, 0.0, 0.0] == list(result.column('value_attr'))
+        assert [1, 2**70, 1] == result.column('count_attr')
+        assert ['label'] * 3 == result.column('label_attr')
+
+    def test_columns_without_numpy(self):
+        with mock.patch.object(frame, 'numpy', None):
+            result = SDPropertyFrame(MeasurementProperties, [{'count_attr': 2}, {}])
+
+        assert array('q', [2, 1]) == result.column('count_attr')
+
+    def test_numpy_columns(self):
+        numpy = pytest.importorskip('numpy')
+        result = SDPropertyFrame(MeasurementProperties, [{'value_attr': 1.5, 'count_attr': 2}, {}])
+
+        assert isinstance(result.column('value_attr'), numpy.ndarray)
+        assert isinstance(result.column('count_attr'), numpy.ndarray)
+        # Defaults read from a column are the types they were resolved as.
+        assert [15.0, 0.0] == list(result.column('scaled_attr'))
+        assert (int, float, float) == tuple(type(value) for value in
+                                            (result[0].count_attr, result[0].value_attr, result[0].total_attr))
+
+    def test_vectorized_functions_are_called_once(self):
+        calls = []
+
+        class VectorizedProperties(metaclass=SDPropertyMetaclass):
+            value_attr = SDProperty(transform=vectorized(lambda column: calls.append(column) or column))
+
+        SDPropertyFrame(VectorizedProperties, [{'value_attr': index} for index in range(5)])
+
+        assert [[0, 1, 2, 3, 4]] == calls
+
+    def test_vectorized_functions_on_instances(self):
+        instance = MeasurementProperties(value_attr=2.0)
+
+        assert 20.0 == instance.scaled_attr
+        with pytest.raises(InvalidPropertyException):
+            MeasurementProperties(value_attr=-1.0).value_attr
+
+    def test_rows(self):
+        result = SDPropertyFrame(MeasurementProperties, [{'value_attr': 2.0, 'count_attr': 3}])
+        row = result[-1]
+
+        assert 'label: 20.0' == row.describe()
+        assert 6.0 == row.total_attr
+        assert materialize(MeasurementProperties(value_attr=2.0, count_attr=3)) == \
+            {name: getattr(row, name) for name in MeasurementProperties.__sdproperties__}
+        with pytest.raises(IndexError):
+            result[1]
+
+    @pytest.mark.parametrize('class_object, records, exception', [
+        (MeasurementProperties, [{}, {'value_attr': -1.0}], InvalidPropertyException),
+        (MeasurementProperties, [{'label_attr': 1}], MismatchedPropertyTypesException),
+        (RequiredProperties, [{'required_attr': 1}, {}], RequiredPropertyException),
+        (DependentProperties, [{'parent_1': {'parent_2': 'parent_2'}}], InvalidRecordException),
+    ])
+    def test_errors(self, class_object, records, exception):
+        with pytest.raises(exception):
+            SDPropertyFrame(class_object, records)
@@ -0,0 +1,121 @@
+from pytest import raises
+
+from sdproperty.exceptions import CyclicPropertyDependencyException
+from sdproperty.graph import materialize
+from sdproperty.sdproperty import sdproperty
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+from tests.conftest import CallbackProperties
+from tests.conftest import DependentProperties
+from tests.conftest import InheritedDependentProperties
+
+
+class TestDependencyGraph:
+
+    def test_default_and_superkeys_dependencies(self):
+        dependencies = DependentProperties.__sdproperty_graph__.dependencies
+
+        assert dependencies['base_attr'] == ()
+        assert dependencies['dependent_attr'] == ('base_attr',)
+        assert dependencies['sdproperty_dependent_attr'] == ('base_attr',)
+        assert dependencies['nested_dependent_attr'] == ('nested_parent_attr',)
+
+    def test_callback_dependencies(self):
+        expected = ('base_attr',)
+        actual = CallbackProperties.__sdproperty_graph__.dependencies['get_callback_attr']
+
+        assert expected == actual
+
+    def test_inherited_dependencies(self):
+        expected = ('dependent_attr',)
+        actual = InheritedDependentProperties.__sdproperty_graph__.dependencies['child_dependent_attr']
+
+        assert expected == actual
+
+    def test_order_puts_dependencies_first(self):
+        order = InheritedDependentProperties.__sdproperty_graph__.order
+
+        assert order.index('base_attr') < order.index('dependent_attr')
+        assert order.index('dependent_attr') < order.index('child_dependent_attr')
+        assert order.index('nested_parent_attr') < order.index('nested_dependent_attr')
+
+    def test_closure_only_has_dependencies(self):
+        expected = ['base_attr', 'dependent_attr', 'child_dependent_attr']
+        actual = InheritedDependentProperties.__sdproperty_graph__.closure(['child_dependent_attr'])
+
+        assert expected == actual
+
+    def test_inherited_cycle_raises_exception(self):
+        with raises(CyclicPropertyDependencyException):
+            class CyclicProperties(DependentProperties):
+                base_attr = SDProperty(default=DependentProperties.dependent_attr)
+
+    def test_declared_cycle_raises_exception(self):
+        with raises(CyclicPropertyDependencyException) as exception:
+            class CyclicDeclaredProperties(metaclass=SDPropertyMetaclass):
+                first_attr  = SDProperty()
+                second_attr = SDProperty(default=first_attr)
+                first_attr.default = second_attr
+
+        assert exception.value.cycle in (['first_attr', 'second_attr', 'first_attr'],
+                                         ['second_attr', 'first_attr', 'second_attr'])
+
+    def test_inferred_cycles_only_order_properties(self):
+        # Each callback only reads the other when its own kwarg is missing.
+        class ConditionalProperties(metaclass=SDPropertyMetaclass):
+
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+
+            @sdproperty
+            def host(self):
+                return self.url.split('/')[2]
+
+            @sdproperty
+            def url(self):
+                return f'http://{self.host}/'
+
+        graph = ConditionalProperties.__sdproperty_graph__
+
+        assert ['host', 'url'] == graph.order
+        assert {'host': (), 'url': ('host',)} == graph.predecessors
+        assert 'http://h/' == ConditionalProperties(host='h').url
+        assert 'h' == ConditionalProperties(url='http://h/').host
+        assert {'host': 'h', 'url': 'http://h/'} == materialize(ConditionalProperties(host='h'))
+
+    def test_declared_dependencies_are_kept_in_inferred_cycles(self):
+        class MixedProperties(metaclass=SDPropertyMetaclass):
+            # Declared first, but it has to come after the callback it
+            # declares as its default.
+            dependent_attr = SDProperty()
+            callback_attr  = SDProperty(default=lambda self: self.kwargs.get('base') or self.dependent_attr)
+            dependent_attr.default = callback_attr
+
+        assert ['callback_attr', 'dependent_attr'] == MixedProperties.__sdproperty_graph__.order
+
+
+class TestMaterialize:
+
+    def test_materialize_all_properties(self):
+        config = {'base_attr': {'sdproperty_dependent_attr': 'val'}}
+        test_class = DependentProperties(**config)
+        values = materialize(test_class)
+
+        assert set(values) == set(DependentProperties.__sdproperties__)
+        assert values['sdproperty_dependent_attr'] == 'val'
+        assert vars(test_class)['dependent_attr'] == {'sdproperty_dependent_attr': 'val'}
+
+    def test_materialize_some_properties(self):
+        test_class = DependentProperties(base_attr='base_attr')
+
+        expected = {'base_attr': 'base_attr', 'dependent_attr': 'base_attr'}
+        actual = materialize(test_class, ['dependent_attr'])
+
+        assert expected == actual
+        assert 'updating_dependent_attr' not in vars(test_class)
+
+    def test_materialize_unknown_property(self):
+        with raises(ValueError) as exception:
+            materialize(DependentProperties(), ['base_attr', 'missing_attr'])
+
+        assert "'missing_attr'" in str(exception.value)
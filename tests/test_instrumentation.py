@@ -0,0 +1,124 @@
+from unittest import TestCase
+
+import pytest
+
+from sdproperty import instrumentation
+from sdproperty.exceptions import InvalidPropertyException
+from sdproperty.exceptions import MismatchedPropertyTypesException
+from sdproperty.exceptions import RequiredPropertyException
+from tests.conftest import CallbackProperties
+from tests.conftest import DefaultedProperties
+from tests.conftest import MEMOIZE_CACHE
+from tests.conftest import MemoizedProperties
+from tests.conftest import RequiredProperties
+from tests.conftest import SlottedProperties
+from tests.conftest import TransformProperties
+from tests.conftest import ValidateProperties
+
+
+def stats(class_object, name):
+    return instrumentation.snapshot()[f'tests.conftest.{class_object.__qualname__}'][name]
+
+
+class TestInstrumentation(TestCase):
+
+    def setUp(self):
+        instrumentation.enable()
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+
+    def test_singleton_reads(self):
+        instance = DefaultedProperties()
+        instance.default_attr
+        instance.default_attr
+
+        actual = stats(DefaultedProperties, 'default_attr')
+
+        assert 2 == actual['reads']
+        assert 1 == actual['resolutions']
+        assert 1 == actual['stored_reads']
+        assert 1 == actual['calls']['resolve']
+        assert 1 == sum(actual['histogram'].values())
+
+    def test_slotted_reads(self):
+        instance = SlottedProperties()
+        instance.default_attr
+        instance.default_attr
+
+        assert 1 == stats(SlottedProperties, 'default_attr')['stored_reads']
+
+    def test_callback_is_timed(self):
+        CallbackProperties(base_attr='base_attr').get_callback_attr
+
+        actual = stats(CallbackProperties, 'get_callback_attr')
+
+        assert 1 == actual['calls']['default']
+        assert 0 < actual['time_ns']['default'] <= actual['time_ns']['resolve']
+
+    def test_validate_and_transform_are_timed(self):
+        ValidateProperties(validate_regex_attr=1).validate_regex_attr
+        ValidateProperties(validate_lambda_attr=1).validate_lambda_attr
+        TransformProperties(transform_attr=1).transform_attr
+
+        assert 1 == stats(ValidateProperties, 'validate_regex_attr')['calls']['validate']
+        assert 1 == stats(ValidateProperties, 'validate_lambda_attr')['calls']['validate']
+        assert 1 == stats(TransformProperties, 'transform_attr')['calls']['transform']
+
+    def test_errors_are_counted(self):
+        with pytest.raises(RequiredPropertyException):
+            RequiredProperties().required_attr
+        with pytest.raises(InvalidPropertyException):
+            ValidateProperties(validate_lambda_attr=5).validate_lambda_attr
+
+        assert {'RequiredPropertyException': 1} == stats(RequiredProperties, 'required_attr')['errors']
+        assert {'InvalidPropertyException': 1} == \
+            stats(ValidateProperties, 'validate_lambda_attr')['errors']
+
+    def test_sets_are_counted(self):
+        instance = DefaultedProperties()
+        instance.default_attr = 'val'
+        with pytest.raises(MismatchedPropertyTypesException):
+            instance.default_attr = 1
+
+        actual = stats(DefaultedProperties, 'default_attr')
+
+        assert 2 == actual['sets']
+        assert {'MismatchedPropertyTypesException': 1} == actual['errors']
+
+    def test_cache_hits_are_counted(self):
+        MEMOIZE_CACHE.clear()
+        for _ in range(4):
+            MemoizedProperties(base_attr='base_attr').memoized_attr
+
+        actual = stats(MemoizedProperties, 'memoized_attr')
+
+        assert 3 == actual['cache_hits']
+        assert 1 == actual['cache_misses']
+        assert 0.75 == actual['cache_hit_ratio']
+
+    def test_format_snapshot(self):
+        DefaultedProperties().default_attr
+
+        actual = instrumentation.format_snapshot()
+
+        assert 'tests.conftest.DefaultedProperties' in actual
+        assert 'default_attr' in actual.splitlines()[actual.splitlines().index(
+            'tests.conftest.DefaultedProperties') + 2]
+
+
+class TestDisabledInstrumentation(TestCase):
+
+    def test_disabled_properties_are_not_instrumented(self):
+        with instrumentation.instrumented():
+            DefaultedProperties().default_attr
+        instrumentation.reset()
+        DefaultedProperties().default_attr
+
+        sdproperty = DefaultedProperties.__sdproperties__['default_attr']
+
+        assert not instrumentation.is_enabled()
+        assert 0 == stats(DefaultedProperties, 'default_attr')['reads']
+        assert 'get' == sdproperty._get.__name__
+        assert '_value_is_valid' not in sdproperty.__dict__
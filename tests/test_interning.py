@@ -0,0 +1,160 @@
+import copy
+import gc
+import pickle
+from unittest import TestCase
+
+import pytest
+
+from sdproperty.graph import materialize
+from sdproperty.interning import FrozenDict
+from sdproperty.interning import FrozenList
+from sdproperty.interning import InternPool
+from sdproperty.interning import flyweight
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+from tests.conftest import BasicProperties
+from tests.conftest import InternedProperties
+from tests.conftest import SlottedProperties
+
+
+class TestInternPool(TestCase):
+
+    def setUp(self):
+        self.pool = InternPool()
+
+    def test_identical_values_are_shared(self):
+        value = {'key': ['elem', {'nested': ('a', 1)}], 'set': {1, 2}}
+
+        interned = self.pool.intern(value)
+
+        assert value == interned
+        assert interned is self.pool.intern(copy.deepcopy(value))
+        assert isinstance(interned, FrozenDict)
+        assert isinstance(interned['key'], FrozenList)
+        assert interned['key'][1] is self.pool.intern({'nested': ('a', 1)})
+        assert frozenset({1, 2}) == interned['set']
+
+    def test_equal_values_of_different_types_are_not_shared(self):
+        assert self.pool.intern([1]) is not self.pool.intern([True])
+        assert self.pool.intern([1]) is not self.pool.intern([1.0])
+        assert self.pool.intern({'a': [(1,)]}) is not self.pool.intern({'a': [(True,)]})
+        assert self.pool.intern({'a': 1, 'b': 2}) is not self.pool.intern({'b': 2, 'a': 1})
+        assert self.pool.intern([0.0]) is not self.pool.intern([-0.0])
+        assert '-0.0' == repr(self.pool.intern([(-0.0,)])[0][0])
+        assert self.pool.intern([0.5]) is self.pool.intern([0.5])
+
+    def test_values_are_held_weakly(self):
+        self.pool.intern({'key': ['elem']})
+        gc.collect()
+
+        assert 0 == len(self.pool)
+
+    def test_unhashable_values(self):
+        unhashable = {'key': bytearray(b'val')}
+
+        interned = self.pool.intern(unhashable)
+
+        assert isinstance(interned, FrozenDict)
+        assert interned is not self.pool.intern(unhashable)
+        assert BasicProperties is self.pool.intern(BasicProperties)
+
+    def test_frozen_values_are_immutable(self):
+        interned = self.pool.intern({'key': ['elem']})
+
+        with pytest.raises(TypeError):
+            interned['key'] = 'val'
+        with pytest.raises(TypeError):
+            interned.update({'other': 'val'})
+        with pytest.raises(TypeError):
+            interned['key'].append('elem')
+        with pytest.raises(TypeError):
+            interned['key'] += ['elem']
+
+        # Copies are ordinary values again.
+        assert dict is type(interned.copy())
+        assert list is type(interned['key'] + ['elem'])
+
+    def test_frozen_values_can_be_pickled(self):
+        interned = self.pool.intern({'key': ['elem']})
+
+        assert interned == pickle.loads(pickle.dumps(interned))
+        assert hash(interned) == hash(copy.deepcopy(interned))
+
+
+class TestInternedProperties:
+
+    def test_resolved_values_are_shared(self):
+        kwargs = {'base_attr': 'base', 'dict_combine_attr': {'key2': 'val2'}, 'list_attr': ['elem2'],
+                  'subkey': {'subkey_attr': {'key': 'val'}}}
+        instances = [InternedProperties(**copy.deepcopy(kwargs)) for _ in range(3)]
+
+        for name in ['dict_combine_attr', 'list_attr', 'subkey_attr']:
+            first = getattr(instances[0], name)
+            assert all(getattr(instance, name) is first for instance in instances)
+        assert {'key1': 'val1', 'key2': 'val2'} == instances[0].dict_combine_attr
+        assert ['ELEM1', 'ELEM2'] == instances[0].list_attr
+
+    def test_values_match_uninterned(self):
+        class UninternedProperties(InternedProperties, interned=False):
+            pass
+
+        kwargs = {'base_attr': 'base', 'subkey': {'subkey_attr': ['elem']}}
+
+        assert materialize(UninternedProperties(**kwargs)) == materialize(InternedProperties(**kwargs))
+
+    def test_enabled_on_a_subclass(self):
+        class InternedChildProperties(BasicProperties, interned=True):
+            pass
+
+        first, second = (InternedChildProperties(base_attr=['elem']) for _ in range(2))
+
+        assert first.base_attr is second.base_attr
+        assert type(first.base_attr) is FrozenList
+        assert type(BasicProperties(base_attr=['elem']).base_attr) is list
+
+    def test_overridden_per_property(self):
+        first, second = InternedProperties(), InternedProperties()
+
+        assert type(first.uninterned_attr) is dict
+        assert type(first.dict_combine_attr) is FrozenDict
+        assert first.callback_attr is second.callback_attr
+
+    def test_custom_pool(self):
+        pool = InternPool()
+
+        class PooledProperties(metaclass=SDPropertyMetaclass):
+            pooled_attr = SDProperty(default=['elem'], interned=pool)
+
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+
+        instance = PooledProperties()
+
+        assert instance.pooled_attr is pool.intern(['elem'])
+        assert {'size': 1, 'hits': 1, 'misses': 1} == pool.stats()
+
+
+class TestFlyweight:
+
+    def test_identical_kwargs_share_an_instance(self):
+        instance = InternedProperties.flyweight(base_attr='base', subkey={'subkey_attr': [1]})
+
+        assert instance is InternedProperties.flyweight(base_attr='base', subkey={'subkey_attr': [1]})
+        assert instance is not InternedProperties.flyweight(base_attr='other', subkey={'subkey_attr': [1]})
+        assert instance is not InternedProperties.flyweight(base_attr='base', subkey={'subkey_attr': [True]})
+        assert [1] == instance.subkey_attr
+
+    def test_instances_are_held_weakly(self):
+        flyweight(BasicProperties, {'base_attr': 'base'})
+        gc.collect()
+
+        assert 0 == len(BasicProperties.__dict__['__sdproperty_flyweights__'])
+
+    def test_unhashable_kwargs(self):
+        kwargs = {'base_attr': bytearray(b'base')}
+
+        assert flyweight(BasicProperties, kwargs) is not flyweight(BasicProperties, kwargs)
+
+    def test_slotted_classes_need_weakref(self):
+        with pytest.raises(TypeError):
+            flyweight(SlottedProperties, {'base_attr': 'base'})
@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+import pytest
+
+from sdproperty.lazy import LazyJSONMapping
+from sdproperty.lazy import open_json
+from tests.conftest import DependentProperties
+from tests.conftest import SuperkeyProperties
+
+
+CONFIG = {
+    'subkey_1': {'subkey_2': {'multi_subkey_attr': 'val', 'other': [1, {'a': '}]"\\'}]}},
+    'subkey': {'subkey_attr': {'nested': True}},
+    'escaped \\"key\\"': 'é',
+    'number': -1.5e3,
+    'empty': {},
+    'null': None,
+}
+
+
+class TestLazyJSONMapping(TestCase):
+
+    def setUp(self):
+        self.mapping = LazyJSONMapping(json.dumps(CONFIG, indent=2).encode())
+
+    def test_mapping(self):
+        assert list(CONFIG) == list(self.mapping)
+        assert len(CONFIG) == len(self.mapping)
+        assert 'number' in self.mapping
+        assert -1.5e3 == self.mapping['number']
+        assert 'é' == self.mapping['escaped \\"key\\"']
+        assert self.mapping.get('missing') is None
+        assert CONFIG == self.mapping.to_dict()
+        assert CONFIG == dict(self.mapping)
+
+    def test_values_are_decoded_as_they_are_read(self):
+        assert CONFIG['subkey'] == self.mapping['subkey']
+        assert ['subkey'] == list(self.mapping._values)
+
+    def test_subtree(self):
+        subtree = self.mapping.subtree('subkey_1').subtree('subkey_2')
+
+        assert isinstance(subtree, LazyJSONMapping)
+        assert {} == self.mapping._values
+        assert 'val' == subtree['multi_subkey_attr']
+        assert CONFIG['subkey_1']['subkey_2']['other'] == subtree.subtree('other')
+        assert {} == dict(self.mapping.subtree('empty'))
+        assert self.mapping.subtree('missing') is None
+
+    def test_malformed(self):
+        with pytest.raises(json.JSONDecodeError):
+            LazyJSONMapping(b'[1, 2]')
+        with pytest.raises(json.JSONDecodeError):
+            len(LazyJSONMapping(b'{"key" 1}'))
+        with pytest.raises(json.JSONDecodeError):
+            len(LazyJSONMapping(b'{"key": "value'))
+
+
+class TestLazyKwargs(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'config.json')
+        with open(self.path, 'w') as config:
+            json.dump(CONFIG, config)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_superkeys(self):
+        with open_json(self.path) as kwargs:
+            instance = SuperkeyProperties()
+            instance.kwargs = kwargs
+
+            assert 'val' == instance.multi_subkey_attr
+            assert {'nested': True} == instance.subkey_attr
+            # Only the values that were read were decoded.
+            assert {} == kwargs._values
+            assert ['multi_subkey_attr'] == \
+                list(kwargs.subtree('subkey_1').subtree('subkey_2')._values)
+
+    def test_only_the_path_that_is_read_is_walked(self):
+        with open_json(self.path) as kwargs:
+            instance = SuperkeyProperties()
+            instance.kwargs = kwargs
+
+            assert {'nested': True} == instance.subkey_attr
+            assert 'subkey_1' not in kwargs._subtrees
+
+    def test_sdproperty_superkeys(self):
+        with open(self.path, 'w') as config:
+            json.dump({'parent_1': {'parent_2': {'nested_parent_attr': {'nested_dependent_attr': [1, 2]}}}}, config)
+
+        with open_json(self.path) as kwargs:
+            instance = DependentProperties()
+            instance.kwargs = kwargs
+
+            assert [1, 2] == instance.nested_dependent_attr
+            assert {} == kwargs._values
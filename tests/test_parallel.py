@@ -0,0 +1,71 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+from sdproperty import instrumentation
+from sdproperty.parallel import materialize_parallel
+from tests.conftest import MEMOIZE_CACHE
+from tests.conftest import MemoizedProperties
+from tests.conftest import PARALLEL_IN_FLIGHT
+from tests.conftest import ParallelProperties
+
+
+EXPECTED = {
+    'base_attr': 2,
+    'first_heavy_attr': 20,
+    'second_heavy_attr': 200,
+    'third_heavy_attr': 1,
+    'combined_attr': 220,
+}
+
+
+class TestMaterializeParallel:
+
+    def test_properties_are_resolved_in_threads(self):
+        test_class = ParallelProperties(unrelated_kwarg=True)
+        PARALLEL_IN_FLIGHT.most_running = 0
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            values = materialize_parallel(test_class, executor)
+
+        assert EXPECTED == values
+        assert 220 == test_class.combined_attr
+        assert 3 == PARALLEL_IN_FLIGHT.most_running
+
+    def test_properties_are_resolved_in_processes(self):
+        test_class = ParallelProperties(unrelated_kwarg=True)
+
+        with ProcessPoolExecutor(max_workers=3) as executor:
+            values = materialize_parallel(test_class, executor)
+
+        assert EXPECTED == values
+        assert 20 == vars(test_class)['first_heavy_attr']
+
+    def test_kwarg_is_not_sent_to_executor(self):
+        test_class = ParallelProperties(first_heavy_attr=1)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            values = materialize_parallel(test_class, executor, ['first_heavy_attr'])
+
+        assert {'base_attr': 2, 'first_heavy_attr': 1} == values
+
+    def test_memoized_defaults_are_cached(self):
+        MEMOIZE_CACHE.clear()
+        MemoizedProperties.calls.clear()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for _ in range(2):
+                values = materialize_parallel(MemoizedProperties(base_attr='base'), executor,
+                                              ['memoized_attr'])
+
+        assert 'base_memoized' == values['memoized_attr']
+        assert ['memoized_attr'] == MemoizedProperties.calls
+
+    def test_instrumented_defaults_are_timed(self):
+        with instrumentation.instrumented():
+            instrumentation.reset()
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                materialize_parallel(ParallelProperties(), executor)
+            stats = instrumentation.snapshot()['tests.conftest.ParallelProperties']['first_heavy_attr']
+
+        assert 1 == stats['calls']['default']
+        assert 0 < stats['time_ns']['default']
@@ -0,0 +1,142 @@
+import pytest
+
+from sdproperty.exceptions import InvalidPropertyException
+from sdproperty.exceptions import InvalidRecordException
+from sdproperty.exceptions import MismatchedPropertyTypesException
+from sdproperty.exceptions import RequiredPropertyException
+from sdproperty.graph import materialize
+from sdproperty.schema import schema_for
+from sdproperty.schema import validate_kwargs
+from sdproperty.schema import validate_records
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+from sdproperty.sdproperty import sdproperty
+from sdproperty.validators import Range
+from tests.conftest import DependentProperties
+from tests.conftest import RequiredProperties
+
+
+class ConfigProperties(metaclass=SDPropertyMetaclass):
+    name_attr      = SDProperty(required=True, validate='^[a-z]+$')
+    port_attr      = SDProperty(default=8080, validate=Range(1, 65535))
+    tags_attr      = SDProperty(default=['default'])
+    section_attr   = SDProperty(default={'key': 'val'})
+    nested_attr    = SDProperty(superkeys=['server', 'options'], required=True)
+    child_attr     = SDProperty(superkeys=section_attr, validate={'a', 'b'})
+    derived_attr   = SDProperty(default=name_attr, required=True)
+    transform_attr = SDProperty(default=1, transform=str)
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @sdproperty(required=True)
+    def callback_attr(self):
+        raise AssertionError('Callbacks are never run by the schema.')
+
+
+VALID = {
+    'name_attr': 'name',
+    'server': {'options': {'nested_attr': 'nested'}},
+    'section_attr': {'child_attr': 'a'},
+    'transform_attr': 'not an int',
+}
+
+
+def _violations(class_object, kwargs):
+    return [(path, type(violation)) for path, violation in validate_kwargs(class_object, kwargs)]
+
+
+class TestValidateKwargs:
+
+    def test_valid(self):
+        assert [] == validate_kwargs(ConfigProperties, VALID)
+
+    def test_every_violation_is_reported(self):
+        kwargs = {
+            'name_attr': 'Name',
+            'port_attr': 0,
+            'tags_attr': 'tag',
+            'section_attr': {'child_attr': 'c'},
+            'server': {'options': {}},
+        }
+
+        assert sorted([
+            (('name_attr',), InvalidPropertyException),
+            (('port_attr',), InvalidPropertyException),
+            (('tags_attr',), MismatchedPropertyTypesException),
+            (('section_attr', 'child_attr'), InvalidPropertyException),
+            (('server', 'options', 'nested_attr'), RequiredPropertyException),
+        ]) == sorted(_violations(ConfigProperties, kwargs))
+
+    def test_properties_depending_on_a_violation_are_skipped(self):
+        # Resolving the derived property raises the same violation.
+        assert [(('name_attr',), RequiredPropertyException)] == \
+            _violations(ConfigProperties, dict(VALID, name_attr=None))
+
+    def test_defaults_are_combined_before_superkeys(self):
+        # The child is looked up in the section combined with its default.
+        kwargs = dict(VALID, section_attr={'other': 1})
+
+        assert [] == validate_kwargs(ConfigProperties, kwargs)
+
+    def test_superkeys_that_dont_lead_to_a_mapping(self):
+        kwargs = dict(VALID, server={'options': 'options'}, section_attr=['not', 'a', 'mapping'])
+
+        assert sorted([(('server', 'options', 'nested_attr'), InvalidRecordException),
+                       (('section_attr',), MismatchedPropertyTypesException)]) == \
+            sorted(_violations(ConfigProperties, kwargs))
+        with pytest.raises(InvalidRecordException):
+            ConfigProperties(**kwargs).nested_attr
+
+    def test_violations_match_resolving(self):
+        for kwargs in ({}, {'required_attr': 1}):
+            reported = {violation.path[-1] for violation in validate_kwargs(RequiredProperties, kwargs)}
+            raised = set()
+            for name in RequiredProperties.__sdproperties__:
+                try:
+                    getattr(RequiredProperties(**kwargs), name)
+                except RequiredPropertyException:
+                    raised.add(name)
+            assert raised == reported
+
+    def test_unknown_values_are_skipped(self):
+        kwargs = {'base_attr': {'sdproperty_dependent_attr': 1}}
+
+        assert [] == validate_kwargs(DependentProperties, kwargs)
+        materialize(DependentProperties(**kwargs))
+
+    def test_schema_is_derived_once(self):
+        assert schema_for(ConfigProperties) is schema_for(ConfigProperties)
+        assert ['name_attr', 'nested_attr', 'derived_attr'] == \
+            [schema.name for schema in schema_for(ConfigProperties).properties
+             if schema.required and schema.static]
+
+    def test_validate_records(self):
+        records = [VALID, dict(VALID, tags_attr='tag'), VALID, {'name_attr': 'Name'}]
+
+        invalid = validate_records(ConfigProperties, records)
+
+        assert [1, 3] == sorted(invalid)
+        assert [(('tags_attr',), MismatchedPropertyTypesException)] == \
+            [(path, type(violation)) for path, violation in invalid[1]]
+        assert _violations(ConfigProperties, records[3]) == \
+            [(path, type(violation)) for path, violation in invalid[3]]
+        assert {} == validate_records(ConfigProperties, [VALID] * 3)
+
+    def test_metaclass_methods(self):
+        records = [VALID, {}, dict(VALID, port_attr='80')]
+
+        invalid = ConfigProperties.validate_records(records)
+
+        assert [1, 2] == sorted(invalid)
+        assert {index: [path for path, _ in violations] for index, violations in invalid.items()} == \
+            {1: [('name_attr',), ('server', 'options', 'nested_attr')], 2: [('port_attr',)]}
+        assert [(('port_attr',), InvalidPropertyException)] == \
+            [(path, type(violation)) for path, violation in invalid[2]]
+        assert ConfigProperties.validate_kwargs(VALID) == []
+
+
+@pytest.mark.parametrize('kwargs', [VALID, {'name_attr': 'Name'}])
+def test_messages(kwargs):
+    for violation in validate_kwargs(ConfigProperties, kwargs):
+        assert str(violation.exception)
@@ -0,0 +1,212 @@
+import pickle
+
+import pytest
+
+from sdproperty.exceptions import MismatchedPropertyTypesException
+from sdproperty.exceptions import SealedKwargsException
+from sdproperty.exceptions import UnsealableClassException
+from sdproperty.graph import materialize
+from sdproperty.seal import SEALED_KWARGS
+from sdproperty.seal import UNRESOLVED_ATTR
+from sdproperty.seal import is_sealed
+from sdproperty.seal import seal
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+from sdproperty.sdproperty import sdproperty
+from sdproperty.superkeys import SUBTREES_ATTR
+from tests.conftest import CachedProperties
+from tests.conftest import DependentProperties
+from tests.conftest import SealedProperties
+from tests.conftest import SlottedSealedProperties
+from tests.conftest import SlottedProperties
+from tests.conftest import TrackedProperties
+
+
+KWARGS = {
+    'base_attr': 'base',
+    'section_attr': {'section_child_attr': 'child'},
+    'subkey': {'subkey_attr': 'sub', 'nested': {'multi_subkey_attr': 'multi'}},
+}
+
+
+@pytest.mark.parametrize('class_object', [SealedProperties, SlottedSealedProperties])
+class TestAutoseal:
+
+    def test_sealed_once_every_singleton_is_resolved(self, class_object):
+        instance = class_object(**KWARGS)
+        expected = materialize(class_object(**KWARGS))
+
+        for name in ['base_attr', 'default_attr', 'section_attr', 'section_child_attr', 'subkey_attr',
+                     'multi_subkey_attr']:
+            getattr(instance, name)
+            assert not is_sealed(instance)
+        instance.get_callback_attr
+
+        assert is_sealed(instance)
+        assert instance.kwargs is SEALED_KWARGS
+        assert not hasattr(instance, SUBTREES_ATTR)
+        assert expected == materialize(instance)
+
+    def test_non_singletons_are_still_resolved(self, class_object):
+        instance = class_object(**KWARGS)
+        materialize(instance)
+
+        instance.base_attr = 'changed'
+
+        assert is_sealed(instance)
+        assert 'changed' == instance.updating_dependent_attr
+
+    def test_assigned_properties_count_as_resolved(self, class_object):
+        instance = class_object(**KWARGS)
+        values = materialize(class_object(**KWARGS))
+
+        for name, sdproperty in class_object.__sdproperties__.items():
+            if sdproperty.singleton:
+                assert not is_sealed(instance)
+                setattr(instance, name, values[name])
+
+        assert is_sealed(instance)
+
+    def test_missing_kwargs_are_still_defaults(self, class_object):
+        instance = class_object()
+        materialize(instance)
+
+        assert is_sealed(instance)
+        assert instance.base_attr is None
+        assert 'None_callback' == instance.get_callback_attr
+        assert 'default_attr' == instance.default_attr
+
+
+class TestSeal:
+
+    @pytest.mark.parametrize('class_object, kwargs', [
+        (DependentProperties, {'base_attr': {'sdproperty_dependent_attr': 1}}),
+        (CachedProperties, {'base_attr': 'base'}),
+        (SlottedProperties, {'base_attr': 'base', 'subkey': {'subkey_attr': 'sub'}}),
+    ])
+    def test_seal(self, class_object, kwargs):
+        instance = class_object(**kwargs)
+
+        seal(instance)
+
+        assert is_sealed(instance)
+        assert materialize(class_object(**kwargs)) == materialize(instance)
+
+    def test_sealing_twice(self):
+        instance = DependentProperties(base_attr={'sdproperty_dependent_attr': 1})
+        seal(instance)
+        seal(instance)
+
+        assert 1 == instance.sdproperty_dependent_attr
+
+    def test_unsealable_classes(self):
+        with pytest.raises(UnsealableClassException):
+            seal(TrackedProperties(base_attr='base'))
+
+        with pytest.raises(UnsealableClassException) as exception:
+            class KwargsProperties(metaclass=SDPropertyMetaclass, autoseal=True):
+                @sdproperty(singleton=False)
+                def kwargs_attr(self):
+                    return len(self.kwargs)
+
+        assert 'kwargs_attr' in str(exception.value)
+
+    def test_kwargs_read_through_helpers_raise(self):
+        class HelperProperties(metaclass=SDPropertyMetaclass, autoseal=True):
+            base_attr = SDProperty()
+
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+
+            def _option(self, name):
+                return self.kwargs.get(name, 'missing')
+
+            @sdproperty(singleton=False)
+            def flag_attr(self):
+                return self._option('flag')
+
+        instance = HelperProperties(base_attr='base', flag='on')
+        assert 'on' == instance.flag_attr
+        instance.base_attr
+
+        assert is_sealed(instance)
+        with pytest.raises(SealedKwargsException):
+            instance.flag_attr
+
+    def test_callbacks_that_resolved_to_none_keep_the_kwargs(self):
+        class NoneProperties(metaclass=SDPropertyMetaclass, autoseal=True):
+            base_attr = SDProperty()
+
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+
+            @sdproperty
+            def option_attr(self):
+                return self.kwargs.get('option')
+
+        instance = NoneProperties(base_attr='base')
+        materialize(instance)
+
+        assert not is_sealed(instance)
+        assert seal(instance) is False
+        assert instance.option_attr is None
+        assert seal(NoneProperties(option='option')) is True
+
+    def test_sealed_kwargs(self):
+        assert not SEALED_KWARGS
+        assert SEALED_KWARGS is pickle.loads(pickle.dumps(SEALED_KWARGS))
+        with pytest.raises(SealedKwargsException):
+            SEALED_KWARGS.get('base_attr')
+        with pytest.raises(SealedKwargsException):
+            'base_attr' in SEALED_KWARGS
+
+    def test_assigned_values_are_still_checked(self):
+        instance = SealedProperties()
+        materialize(instance)
+
+        with pytest.raises(MismatchedPropertyTypesException):
+            instance.section_attr = 'section'
+
+
+class TestAutosealSubclasses:
+
+    def test_inherited(self):
+        class ChildProperties(SealedProperties):
+            child_attr = SDProperty(default='child_attr')
+
+        instance = ChildProperties(**KWARGS)
+        expected = materialize(SealedProperties(**KWARGS))
+
+        assert dict(expected, child_attr='child_attr') == materialize(instance)
+
+        assert is_sealed(instance)
+
+    def test_disabled(self):
+        class ChildProperties(SealedProperties, autoseal=False):
+            pass
+
+        instance = ChildProperties(**KWARGS)
+        materialize(instance)
+
+        assert not is_sealed(instance)
+
+    @pytest.mark.parametrize('slots', [False, True])
+    def test_enabled_on_a_subclass(self, slots):
+        class UnsealedProperties(metaclass=SDPropertyMetaclass, slots=slots):
+            base_attr    = SDProperty()
+            default_attr = SDProperty(default='default_attr')
+
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+
+        class ChildProperties(UnsealedProperties, autoseal=True):
+            pass
+
+        instance = ChildProperties(base_attr='base')
+        assert {'base_attr': 'base', 'default_attr': 'default_attr'} == materialize(instance)
+
+        assert is_sealed(instance)
+        assert not hasattr(instance, UNRESOLVED_ATTR)
+        unsealed = UnsealedProperties(base_attr='base')
+        materialize(unsealed)
+        assert not is_sealed(unsealed)
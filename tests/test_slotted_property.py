@@ -0,0 +1,109 @@
+import tracemalloc
+
+from pytest import raises
+
+from sdproperty.exceptions import MismatchedPropertyTypesException
+from tests.conftest import DependentProperties
+from tests.conftest import InheritedSlottedProperties
+from tests.conftest import SlottedProperties
+
+
+def bytes_per_instance(class_object, count=2000):
+    kwargs = {'base_attr': 'base_attr'}
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [class_object(**kwargs) for _ in range(count)]
+    for instance in instances:
+        instance.base_attr
+        instance.dependent_attr
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return allocated / count
+
+
+class TestSlottedProperties:
+
+    def test_instance_has_no_dict(self):
+        assert not hasattr(SlottedProperties(), '__dict__')
+
+    def test_child_instance_has_no_dict(self):
+        assert not hasattr(InheritedSlottedProperties(), '__dict__')
+
+    def test_attr_from_kwarg(self):
+        expected = 'base_attr'
+        actual = SlottedProperties(base_attr='base_attr').base_attr
+
+        assert expected == actual
+
+    def test_default_attr(self):
+        expected = 'default_attr'
+        actual = SlottedProperties().default_attr
+
+        assert expected == actual
+
+    def test_child_default_attr(self):
+        expected = 'child_attr'
+        actual = InheritedSlottedProperties().child_attr
+
+        assert expected == actual
+
+    def test_dependent_attr_has_base_attr_value(self):
+        expected = 'base_attr'
+        actual = SlottedProperties(base_attr='base_attr').dependent_attr
+
+        assert expected == actual
+
+    def test_dependent_attr_is_updated_with_depended_on_attr(self):
+        test_class = SlottedProperties(base_attr='base_attr')
+        test_class.updating_dependent_attr
+        test_class.base_attr = 'new_attr'
+
+        expected = 'new_attr'
+        actual = test_class.updating_dependent_attr
+
+        assert expected == actual
+
+    def test_attr_from_subkey(self):
+        expected = 'sub_val'
+        actual = SlottedProperties(subkey={'subkey_attr': 'sub_val'}).subkey_attr
+
+        assert expected == actual
+
+    def test_callback_is_called(self):
+        expected = 'base_attr_callback'
+        actual = SlottedProperties(base_attr='base_attr').get_callback_attr
+
+        assert expected == actual
+
+    def test_unset_attr_is_resolved_once(self):
+        test_class = SlottedProperties()
+        test_class.base_attr
+        test_class.kwargs = {'base_attr': 'base_attr'}
+
+        expected = None
+        actual = test_class.base_attr
+
+        assert expected == actual
+
+    def test_attr_is_overwritten_by_assignment(self):
+        test_class = SlottedProperties(base_attr='base_attr')
+        test_class.base_attr = 'new_attr'
+
+        expected = 'new_attr'
+        actual = test_class.base_attr
+
+        assert expected == actual
+
+    def test_mismatched_assignment_raises_exception(self):
+        with raises(MismatchedPropertyTypesException):
+            SlottedProperties().default_attr = 1
+
+    def test_slotted_instances_are_smaller(self):
+        dict_bytes = bytes_per_instance(DependentProperties)
+        slotted_bytes = bytes_per_instance(SlottedProperties)
+
+        assert slotted_bytes < dict_bytes, \
+            f'__dict__: {dict_bytes:.0f} bytes per instance, __slots__: {slotted_bytes:.0f} bytes per instance'
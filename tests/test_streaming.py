@@ -0,0 +1,156 @@
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest import mock
+
+import pytest
+
+from sdproperty import streaming
+from sdproperty.exceptions import InvalidRecordException
+from sdproperty.exceptions import RequiredPropertyException
+from sdproperty.streaming import iter_documents
+from sdproperty.streaming import stream_instances
+from tests.conftest import BasicProperties
+from tests.conftest import DefaultedProperties
+from tests.conftest import DependentProperties
+from tests.conftest import RequiredProperties
+
+
+YAML = """
+kind: basic
+base_attr: first
+---
+kind: default
+default_attr: second
+---
+kind: basic
+base_attr: third
+"""
+
+
+class TestIterDocuments(TestCase):
+
+    def test_yaml(self):
+        documents = list(iter_documents(io.StringIO(YAML), format='yaml'))
+
+        assert ['first', 'second', 'third'] == \
+            [document.get('base_attr', document.get('default_attr')) for document in documents]
+
+    def test_ndjson(self):
+        source = io.BytesIO(b'{"base_attr": 1}\n\n{"base_attr": 2}\n')
+
+        assert [{'base_attr': 1}, {'base_attr': 2}] == list(iter_documents(source, format='ndjson'))
+
+    def test_concatenated_json(self):
+        source = io.StringIO('{"base_attr": 1} {"base_attr": 2}\n[3] 4')
+
+        assert [{'base_attr': 1}, {'base_attr': 2}, [3], 4] == \
+            list(iter_documents(source, format='json'))
+
+    def test_json_array_is_read_in_chunks(self):
+        records = [{'base_attr': f'value_{index}' * index} for index in range(200)] + [12345]
+        source = io.StringIO(json.dumps(records))
+
+        with mock.patch.object(streaming, '_CHUNK_SIZE', 16):
+            assert records == list(iter_documents(source, format='json'))
+
+    def test_invalid_json(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_documents(io.StringIO('[{"base_attr": }]'), format='json'))
+
+    def test_malformed_json_arrays(self):
+        for document in ('[1,,2]', '[,1]', '[1,]', '[,]', '[1 2]', '[1, 2', '['):
+            with mock.patch.object(streaming, '_CHUNK_SIZE', 2):
+                with pytest.raises(json.JSONDecodeError):
+                    list(iter_documents(io.StringIO(document), format='json'))
+
+        assert [] == list(iter_documents(io.StringIO(' [ ] '), format='json'))
+        assert [1, 2] == list(iter_documents(io.StringIO('[ 1 ,\n 2 ]'), format='json'))
+
+    def test_invalid_json_stops_at_max_record_size(self):
+        source = io.StringIO('[{"base_attr": }' + ' ' * 1000 + ']')
+
+        with mock.patch.object(streaming, '_CHUNK_SIZE', 16), \
+                mock.patch.object(streaming, 'MAX_RECORD_SIZE', 64):
+            with pytest.raises(json.JSONDecodeError):
+                list(iter_documents(source, format='json'))
+
+        assert source.tell() == 65
+
+    def test_format_from_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'records.jsonl')
+            with open(path, 'w') as records:
+                records.write('{"base_attr": 1}\n')
+
+            assert [{'base_attr': 1}] == list(iter_documents(path))
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            list(iter_documents(io.StringIO('')))
+
+
+class TestStreamInstances(TestCase):
+
+    def test_single_class(self):
+        source = io.StringIO('{"base_attr": 1}\n{"base_attr": 2}\n')
+
+        instances = stream_instances(source, BasicProperties, format='ndjson')
+
+        assert [1, 2] == [instance.base_attr for instance in instances]
+
+    def test_discriminator(self):
+        instances = list(stream_instances(
+            io.StringIO(YAML), format='yaml', discriminator='kind',
+            classes={'basic': BasicProperties, 'default': DefaultedProperties}, batch_size=2))
+
+        assert [BasicProperties, DefaultedProperties, BasicProperties] == \
+            [type(instance) for instance in instances]
+        assert 'second' == instances[1].default_attr
+
+    def test_unknown_discriminator(self):
+        errors = []
+        instances = list(stream_instances(
+            io.StringIO(YAML), format='yaml', discriminator='kind',
+            classes={'basic': BasicProperties}, errors=errors))
+
+        assert 2 == len(instances)
+        assert [1] == [error.index for error in errors]
+        assert isinstance(errors[0].exception, InvalidRecordException)
+
+    def test_materialize(self):
+        source = io.StringIO('{"base_attr": {"sdproperty_dependent_attr": 1}}\n')
+
+        instance, = stream_instances(source, DependentProperties, format='ndjson',
+                                     materialize=['dependent_attr'])
+
+        assert {'sdproperty_dependent_attr': 1} == instance.__dict__['dependent_attr']
+        assert 'sdproperty_dependent_attr' not in instance.__dict__
+
+    def test_failed_records_are_skipped(self):
+        source = io.StringIO('{"required_attr": 1}\n{}\n{"required_attr": 3}\n[]\n')
+        errors = []
+
+        instances = stream_instances(source, RequiredProperties, format='ndjson',
+                                     materialize=True, errors=errors)
+
+        assert [1, 3] == [instance.required_attr for instance in instances]
+        assert [(1, RequiredPropertyException), (3, InvalidRecordException)] == \
+            sorted((error.index, type(error.exception)) for error in errors)
+
+    def test_records_with_keys_that_are_not_strings(self):
+        source = io.StringIO('base_attr: 1\n---\n1: one\n')
+        errors = []
+
+        instances = list(stream_instances(source, BasicProperties, format='yaml', errors=errors))
+
+        assert [1] == [instance.base_attr for instance in instances]
+        assert [(1, InvalidRecordException)] == [(error.index, type(error.exception)) for error in errors]
+
+    def test_failed_records_raise(self):
+        source = io.StringIO('{}\n')
+
+        with pytest.raises(RequiredPropertyException):
+            list(stream_instances(source, RequiredProperties, format='ndjson', materialize=True))
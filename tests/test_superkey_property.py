@@ -1,6 +1,40 @@
+import pytest
+
+from sdproperty.exceptions import InvalidRecordException
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+from sdproperty.superkeys import SUBTREES_ATTR
+from sdproperty.superkeys import SuperkeyTrie
+from tests.conftest import DependentProperties
 from tests.conftest import SuperkeyProperties
 
 
+class CountingDict(dict):
+    gets = 0
+
+    def get(self, *args):
+        CountingDict.gets += 1
+        return super().get(*args)
+
+
+class SectionProperties(metaclass=SDPropertyMetaclass):
+    first_attr  = SDProperty(superkeys=['section', 'subsection'])
+    second_attr = SDProperty(superkeys=['section', 'subsection'])
+    other_attr  = SDProperty(superkeys=['section', 'other'])
+    string_attr = SDProperty(superkeys=['string', 'subsection'])
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class SlottedSectionProperties(metaclass=SDPropertyMetaclass, slots=True):
+    first_attr  = SDProperty(superkeys=['section', 'subsection'])
+    second_attr = SDProperty(superkeys=['section', 'subsection'])
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
 class TestSuperkeyProperties:
 
     def test_attribute_from_subkey(self):
@@ -14,3 +48,57 @@ class TestSuperkeyProperties:
         actual = SuperkeyProperties(subkey_1={'subkey_2': {'multi_subkey_attr': 'multi_sub_val'}}).multi_subkey_attr
 
         assert expected == actual
+
+
+class TestSuperkeyTrie:
+
+    def test_paths_share_prefixes(self):
+        trie = SectionProperties.__sdproperty_superkeys__
+
+        assert {'section': {'subsection': {}, 'other': {}}, 'string': {'subsection': {}}} == trie.root
+        assert 'routed' == SectionProperties.first_attr._plan(SectionProperties).superkeys_kind
+
+    def test_single_property_isnt_routed(self):
+        assert SuperkeyTrie.for_properties({}) is None
+        assert DependentProperties.__sdproperty_superkeys__ is None
+        assert 'list' == DependentProperties.nested_parent_attr._plan(DependentProperties).superkeys_kind
+
+    def test_kwargs_are_walked_once(self):
+        section = CountingDict(subsection=CountingDict(first_attr=1, second_attr=2))
+        test_class = SectionProperties(section=section)
+
+        assert 1 == test_class.first_attr
+        gets = CountingDict.gets
+        assert 2 == test_class.second_attr
+        # Only the property's own key is looked up in its subtree.
+        assert gets + 1 == CountingDict.gets
+
+    def test_missing_keys_are_skipped(self):
+        # A missing superkey stays at the same level, the same as
+        # `get_subkey_from_dict`.
+        test_class = SectionProperties(subsection={'first_attr': 1}, section={'other_attr': 2})
+
+        assert test_class.first_attr is None
+        assert 2 == test_class.other_attr
+        assert 'val' == SectionProperties(string_attr='val').string_attr
+
+    def test_replaced_kwargs_are_walked_again(self):
+        test_class = SectionProperties(section={'subsection': {'first_attr': 1}})
+        test_class.first_attr
+        test_class.kwargs = {'section': {'subsection': {'second_attr': 2}}}
+
+        assert 2 == test_class.second_attr
+
+    def test_non_mapping_only_fails_its_own_properties(self):
+        test_class = SectionProperties(section={'subsection': {'first_attr': 1}}, string='string')
+
+        assert 1 == test_class.first_attr
+        with pytest.raises(InvalidRecordException):
+            test_class.string_attr
+
+    def test_slotted(self):
+        subsection = {'first_attr': 1}
+        test_class = SlottedSectionProperties(section={'subsection': subsection})
+
+        assert 1 == test_class.first_attr
+        assert subsection is getattr(test_class, SUBTREES_ATTR)[1][('section', 'subsection')]
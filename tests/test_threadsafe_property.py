@@ -0,0 +1,86 @@
+import threading
+import time
+
+from sdproperty.compiler import lock_for
+from sdproperty.sdproperty import SDPropertyMetaclass
+from sdproperty.sdproperty import sdproperty
+from tests.conftest import SlottedThreadsafeProperties
+from tests.conftest import ThreadsafeProperties
+
+
+def read_from_threads(instances, attr_name, thread_count=64):
+    barrier = threading.Barrier(thread_count)
+    values = []
+
+    def read():
+        barrier.wait()
+        for instance in instances:
+            values.append(getattr(instance, attr_name))
+
+    threads = [threading.Thread(target=read) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return values
+
+
+class TestThreadsafeProperties:
+
+    def test_callback_is_evaluated_once_across_threads(self):
+        ThreadsafeProperties.calls = 0
+        values = read_from_threads([ThreadsafeProperties()], 'expensive_attr')
+
+        assert 1 == ThreadsafeProperties.calls
+        assert ['base_attr_expensive'] * 64 == values
+
+    def test_callback_is_evaluated_once_per_instance_across_threads(self):
+        ThreadsafeProperties.calls = 0
+        instances = [ThreadsafeProperties(base_attr=str(index)) for index in range(8)]
+        read_from_threads(instances, 'expensive_attr')
+
+        assert 8 == ThreadsafeProperties.calls
+
+    def test_slotted_callback_is_evaluated_once_across_threads(self):
+        SlottedThreadsafeProperties.calls = 0
+        test_class = SlottedThreadsafeProperties()
+        read_from_threads([test_class], 'expensive_attr')
+
+        assert 1 == SlottedThreadsafeProperties.calls
+        assert not hasattr(test_class, '__dict__')
+
+    def test_lock_is_only_created_when_resolving(self):
+        test_class = ThreadsafeProperties()
+        assert '_sdproperty_locks' not in vars(test_class)
+
+        test_class.base_attr
+
+        assert '_sdproperty_locks' in vars(test_class)
+
+    def test_lock_is_reused(self):
+        test_class = ThreadsafeProperties()
+
+        assert lock_for(test_class, 'base_attr') is lock_for(test_class, 'base_attr')
+
+    def test_threadsafe_option_applies_to_inherited_properties(self):
+        class UnsafeProperties(metaclass=SDPropertyMetaclass):
+            calls = []
+
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+
+            @sdproperty
+            def expensive_attr(self):
+                UnsafeProperties.calls.append('expensive_attr')
+                time.sleep(0.01)
+                return 'expensive_attr'
+
+        class ThreadsafeChildProperties(UnsafeProperties, threadsafe=True):
+            pass
+
+        test_class = ThreadsafeChildProperties()
+        read_from_threads([test_class], 'expensive_attr')
+
+        assert ['expensive_attr'] == UnsafeProperties.calls
+        assert '_sdproperty_locks' in vars(test_class)
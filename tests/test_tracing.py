@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+import pytest
+
+from sdproperty import instrumentation
+from sdproperty.exceptions import RequiredPropertyException
+from sdproperty.tracing import trace
+from tests.conftest import CallbackProperties
+from tests.conftest import DependentProperties
+from tests.conftest import MEMOIZE_CACHE
+from tests.conftest import MemoizedProperties
+from tests.conftest import RequiredProperties
+from tests.conftest import ValidateProperties
+
+
+class TestTracing(TestCase):
+
+    def test_nested_reads_are_children(self):
+        with trace() as tracer:
+            DependentProperties(base_attr={'key': 'val'}).dependent_attr
+
+        root, = tracer.roots
+        child, = root.children
+
+        assert 'dependent_attr' == root.name
+        assert 'default' == root.source
+        assert 'base_attr' == child.name
+        assert 'kwarg' == child.source
+        assert child.parent is root
+        assert root.duration_ns >= child.duration_ns
+
+    def test_callback_source_and_stored_reads(self):
+        instance = CallbackProperties(base_attr='base_attr')
+        with trace() as tracer:
+            instance.get_callback_attr
+            instance.get_callback_attr
+
+        first, second = tracer.roots
+
+        assert 'callback' == first.source
+        assert 'default' in first.times
+        # The callback reads base_attr twice, only the first read resolves it.
+        assert [('base_attr', 'kwarg'), ('base_attr', 'cache')] == \
+            [(child.name, child.source) for child in first.children]
+        assert 'cache' == second.source
+        assert [] == second.children
+
+    def test_memoized_results_are_from_the_cache(self):
+        MEMOIZE_CACHE.clear()
+        with trace() as tracer:
+            MemoizedProperties(base_attr='base_attr').memoized_attr
+            MemoizedProperties(base_attr='base_attr').memoized_attr
+
+        assert ['callback', 'cache'] == [span.source for span in tracer.roots]
+
+    def test_validate_time_is_recorded(self):
+        with trace() as tracer:
+            ValidateProperties(validate_regex_attr=1).validate_regex_attr
+
+        assert 'validate' in tracer.roots[0].times
+
+    def test_errors_are_recorded(self):
+        with trace() as tracer:
+            with pytest.raises(RequiredPropertyException):
+                RequiredProperties().required_attr
+
+        assert 'RequiredPropertyException' == tracer.roots[0].error
+
+    def test_collapsed(self):
+        with trace() as tracer:
+            DependentProperties(base_attr={'key': 'val'}).dependent_attr
+
+        stacks = [line.rsplit(' ', 1) for line in tracer.collapsed().splitlines()]
+
+        assert ['DependentProperties.dependent_attr',
+                'DependentProperties.dependent_attr;DependentProperties.base_attr'] == \
+            [stack for stack, _ in stacks]
+        assert all(int(total) >= 0 for _, total in stacks)
+
+    def test_instrumentation_is_disabled_after_the_trace(self):
+        with trace():
+            pass
+
+        assert not instrumentation.is_enabled()
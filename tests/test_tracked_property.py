@@ -0,0 +1,134 @@
+from pytest import raises
+
+from sdproperty.exceptions import RequiredPropertyException
+from sdproperty.exceptions import UndeclaredInputsException
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+from sdproperty.sdproperty import sdproperty
+from tests.conftest import ConditionalTrackedProperties
+from tests.conftest import SlottedTrackedProperties
+from tests.conftest import TrackedProperties
+
+
+class TestTrackedProperties:
+
+    def test_inputs_are_the_dependencies(self):
+        assert ('base_attr',) == TrackedProperties.tracked_dependent_attr._plan(TrackedProperties).inputs
+        assert ('kwargs',) == TrackedProperties.tracked_kwargs_attr._plan(TrackedProperties).inputs
+
+    def test_callback_is_not_recomputed_without_changes(self):
+        test_class = TrackedProperties(base_attr='base_attr')
+        test_class.tracked_callback_attr
+        test_class.tracked_callback_attr
+
+        expected = 1
+        actual = test_class.callback_calls
+
+        assert expected == actual
+
+    def test_callback_is_recomputed_when_dependency_is_assigned(self):
+        test_class = TrackedProperties(base_attr='base_attr')
+        test_class.tracked_callback_attr
+        test_class.other_attr = 'new_attr'
+
+        expected = 'base_attr_new_attr'
+        actual = test_class.tracked_callback_attr
+
+        assert expected == actual
+        assert 2 == test_class.callback_calls
+
+    def test_dependent_attr_is_updated_with_depended_on_attr(self):
+        test_class = TrackedProperties(base_attr='base_attr')
+        test_class.tracked_dependent_attr
+        test_class.base_attr = 'new_attr'
+
+        expected = 'new_attr'
+        actual = test_class.tracked_dependent_attr
+
+        assert expected == actual
+
+    def test_changes_are_tracked_through_tracked_dependencies(self):
+        test_class = TrackedProperties(base_attr='base_attr')
+        assert 'base_attr_transformed' == test_class.tracked_transform_attr
+
+        test_class.base_attr = 'new_attr'
+
+        expected = 'new_attr_transformed'
+        actual = test_class.tracked_transform_attr
+
+        assert expected == actual
+
+    def test_kwargs_are_tracked(self):
+        test_class = TrackedProperties(base_attr='base_attr')
+        assert 1 == test_class.tracked_kwargs_attr
+
+        test_class.kwargs = {}
+
+        expected = 0
+        actual = test_class.tracked_kwargs_attr
+
+        assert expected == actual
+
+    def test_required_input_is_only_needed_when_read(self):
+        test_class = ConditionalTrackedProperties()
+        assert 'conditional_attr' == test_class.conditional_attr
+
+        test_class.base_attr = 'base_attr'
+        with raises(RequiredPropertyException):
+            test_class.conditional_attr
+
+        test_class.required_attr = 'required_attr'
+
+        expected = 'required_attr'
+        actual = test_class.conditional_attr
+
+        assert expected == actual
+
+    def test_assigned_value_is_recomputed_on_next_read(self):
+        test_class = TrackedProperties(base_attr='base_attr')
+        test_class.tracked_dependent_attr
+        test_class.tracked_dependent_attr = 'assigned_attr'
+
+        expected = 'base_attr'
+        actual = test_class.tracked_dependent_attr
+
+        assert expected == actual
+
+    def test_slotted_dependent_attr_is_updated_with_depended_on_attr(self):
+        test_class = SlottedTrackedProperties(base_attr='base_attr')
+        assert 'base_attr' == test_class.tracked_dependent_attr
+
+        test_class.base_attr = 'new_attr'
+
+        expected = 'new_attr'
+        actual = test_class.tracked_dependent_attr
+
+        assert expected == actual
+
+    def test_callbacks_have_to_declare_their_inputs(self):
+        with raises(UndeclaredInputsException):
+            class UndeclaredProperties(metaclass=SDPropertyMetaclass):
+                @sdproperty(singleton=False, tracked=True)
+                def undeclared_attr(self):
+                    return 'undeclared_attr'
+
+    def test_declared_inputs_read_through_helpers(self):
+        class HelperProperties(metaclass=SDPropertyMetaclass):
+            base_attr = SDProperty()
+
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+
+            def _base(self):
+                return self.base_attr
+
+            @sdproperty(singleton=False, tracked=True, inputs=['base_attr'])
+            def helper_attr(self):
+                return self._base() + '!'
+
+        test_class = HelperProperties(base_attr='a')
+        assert 'a!' == test_class.helper_attr
+
+        test_class.base_attr = 'b'
+
+        assert 'b!' == test_class.helper_attr
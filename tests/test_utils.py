@@ -2,6 +2,9 @@ from unittest import TestCase
 
 from sdproperty.utils import combine_dicts
 from sdproperty.utils import combine_lists
+from sdproperty.utils import concatenate_lists
+from sdproperty.utils import deep_merge_dicts
+from sdproperty.utils import ordered_set_lists
 from sdproperty.utils import get_subkey_from_dict
 
 
@@ -27,6 +30,61 @@ class TestUtils(TestCase):
 
         assert expected == actual
 
+    def test_combine_lists_does_not_modify_lists(self):
+        list1 = ['elem1']
+        list2 = ['elem2']
+        combine_lists(list1, list2)
+
+        assert ['elem1'] == list1
+        assert ['elem2'] == list2
+
+    def test_combine_lists_takes_first_occurance_from_kwarg(self):
+        expected = ['elem1', 'elem1', 'elem2']
+        actual = combine_lists(['elem1', 'elem1'], ['elem2', 'elem1', 'elem2'])
+
+        assert expected == actual
+
+    def test_combine_lists_with_unhashable_elements(self):
+        expected = [{'key': 'val'}, ['elem1'], ['elem2']]
+        actual = combine_lists([{'key': 'val'}, ['elem1']], [['elem1'], ['elem2'], {'key': 'val'}])
+
+        assert expected == actual
+
+    def test_concatenate_lists(self):
+        expected = ['elem1', 'elem1', 'elem2']
+        actual = concatenate_lists(['elem1'], ['elem1', 'elem2'])
+
+        assert expected == actual
+
+    def test_ordered_set_lists(self):
+        expected = ['elem1', {'key': 'val'}, 'elem2']
+        actual = ordered_set_lists(['elem1', {'key': 'val'}, 'elem1'], [{'key': 'val'}, 'elem2', 'elem2'])
+
+        assert expected == actual
+
+    def test_deep_merge_dicts(self):
+        expected = {'key1': {'subkey1': 'subval1', 'subkey2': 'new_subval'},
+                    'key2': ['elem1', 'elem2'],
+                    'key3': 'new_val'}
+        actual = deep_merge_dicts({
+            'key1': {'subkey1': 'subval1', 'subkey2': 'subval2'},
+            'key2': ['elem1'],
+            'key3': {'subkey3': 'subval3'}
+        }, {
+            'key1': {'subkey2': 'new_subval'},
+            'key2': ['elem2'],
+            'key3': 'new_val'
+        })
+
+        assert expected == actual
+
+    def test_deep_merge_dicts_shares_untouched_subtrees(self):
+        dict1 = {'key1': {'subkey1': 'subval1'}, 'key2': {'subkey2': 'subval2'}}
+        merged_dict = deep_merge_dicts(dict1, {'key1': {'subkey1': 'new_subval'}})
+
+        assert merged_dict['key2'] is dict1['key2']
+        assert {'subkey1': 'subval1'} == dict1['key1']
+
     def test_get_subkey_from_dict(self):
         expected = 'val1'
         actual = get_subkey_from_dict({
@@ -1,6 +1,17 @@
+import re
+from unittest import mock
+
+import pytest
 from pytest import raises
 
+from sdproperty import instrumentation
 from sdproperty.exceptions import InvalidPropertyException
+from sdproperty.sdproperty import SDProperty
+from sdproperty.sdproperty import SDPropertyMetaclass
+from sdproperty.validators import InstanceOf
+from sdproperty.validators import OneOf
+from sdproperty.validators import Range
+from sdproperty.validators import Regex
 from tests.conftest import ValidateProperties
 
 
@@ -35,3 +46,99 @@ class TestValidateProperties:
     def test_value_invalid_lamba_raises_exception(self):
         with raises(InvalidPropertyException):
             ValidateProperties(validate_func_attr=0).validate_func_attr
+
+
+class RuleProperties(metaclass=SDPropertyMetaclass):
+    one_of_attr     = SDProperty(validate=OneOf('a', 'b'))
+    set_attr        = SDProperty(validate={'a', 'b'})
+    empty_set_attr  = SDProperty(validate=set())
+    range_attr      = SDProperty(validate=Range(0, 10))
+    instance_attr   = SDProperty(validate=InstanceOf(str, bytes))
+    regex_attr      = SDProperty(validate=Regex('^[a-z]+$'))
+    pattern_attr    = SDProperty(validate=re.compile('^[0-9]+$'))
+    combined_attr   = SDProperty(validate=InstanceOf(str) & Regex('^id_') & (lambda x: len(x) < 8))
+    alternative_attr = SDProperty(validate=OneOf(None, 'auto') | Range(minimum=1))
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+VALID_RULES = [
+    ('one_of_attr', 'a'),
+    ('set_attr', 'b'),
+    ('range_attr', 0),
+    ('range_attr', 10.0),
+    ('instance_attr', b'bytes'),
+    ('regex_attr', 'abc'),
+    ('pattern_attr', 123),
+    ('combined_attr', 'id_1'),
+    ('alternative_attr', 'auto'),
+    ('alternative_attr', 5),
+]
+
+INVALID_RULES = [
+    ('one_of_attr', 'c'),
+    ('one_of_attr', ['a']),
+    ('set_attr', 'c'),
+    ('empty_set_attr', 'a'),
+    ('range_attr', -1),
+    ('range_attr', '5'),
+    ('range_attr', float('nan')),
+    ('instance_attr', 1),
+    ('regex_attr', 'ABC'),
+    ('pattern_attr', 'abc'),
+    ('combined_attr', 1),
+    ('combined_attr', 'id_too_long'),
+    ('combined_attr', 'name'),
+    ('alternative_attr', 0),
+]
+
+
+@pytest.mark.parametrize('name, value', VALID_RULES)
+def test_valid_rules(name, value):
+    assert value == getattr(RuleProperties(**{name: value}), name)
+
+
+@pytest.mark.parametrize('name, value', INVALID_RULES)
+def test_invalid_rules(name, value):
+    with raises(InvalidPropertyException):
+        getattr(RuleProperties(**{name: value}), name)
+
+
+def test_compiled_rules_are_called():
+    # Instrumented resolvers call the compiled rule instead of inlining it.
+    with instrumentation.instrumented():
+        for name, value in VALID_RULES:
+            assert value == getattr(RuleProperties(**{name: value}), name)
+        for name, value in INVALID_RULES:
+            with raises(InvalidPropertyException):
+                getattr(RuleProperties(**{name: value}), name)
+
+
+def test_regex_is_compiled_once():
+    with mock.patch('re.match', side_effect=AssertionError), \
+         mock.patch('re.compile', side_effect=AssertionError):
+        assert 1 == ValidateProperties(validate_regex_attr=1).validate_regex_attr
+        assert 'abc' == RuleProperties(regex_attr='abc').regex_attr
+
+
+def test_rules_are_instrumented():
+    with instrumentation.instrumented():
+        instrumentation.reset()
+        with raises(InvalidPropertyException):
+            RuleProperties(range_attr=11).range_attr
+        RuleProperties(range_attr=1).range_attr
+
+        stats = instrumentation.snapshot()[f'{RuleProperties.__module__}.RuleProperties']['range_attr']
+
+    assert 2 == stats['calls']['validate']
+
+
+def test_invalid_message():
+    with raises(InvalidPropertyException) as error:
+        RuleProperties(range_attr=11).range_attr
+    assert 'Range(minimum=0, maximum=10)' in str(error.value)
+
+    with raises(InvalidPropertyException) as error:
+        ValidateProperties(validate_lambda_attr=0).validate_lambda_attr
+    assert 'lambda x: 0 < x < 2' in str(error.value)
@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from sdproperty.views import OverlayDict
+
+
+class TestOverlayDict(TestCase):
+
+    def setUp(self):
+        self.default = {'key1': 'val1', 'key2': 'val2'}
+        self.kwarg = {'new_key': 'new_val', 'key2': 'updated_val'}
+        self.overlay = OverlayDict(self.kwarg, self.default)
+
+    def test_values_are_taken_from_highest_layer(self):
+        assert 'updated_val' == self.overlay['key2']
+        assert 'val1' == self.overlay['key1']
+        assert 'new_val' == self.overlay.get('new_key')
+        assert self.overlay.get('missing') is None
+
+    def test_keys_are_in_combined_order(self):
+        expected = ['key1', 'key2', 'new_key']
+        actual = list(self.overlay)
+
+        assert expected == actual
+        assert 3 == len(self.overlay)
+
+    def test_overlay_equals_combined_dict(self):
+        expected = {'key1': 'val1', 'new_key': 'new_val', 'key2': 'updated_val'}
+
+        assert expected == self.overlay
+        assert expected == self.overlay.to_dict()
+        assert isinstance(self.overlay.to_dict(), dict)
+
+    def test_setting_value_does_not_modify_layers(self):
+        self.overlay['key1'] = 'changed_val'
+        del self.overlay['new_key']
+
+        assert {'key1': 'changed_val', 'key2': 'updated_val'} == self.overlay
+        assert {'key1': 'val1', 'key2': 'val2'} == self.default
+        assert {'new_key': 'new_val', 'key2': 'updated_val'} == self.kwarg
+
+    def test_missing_key_raises_exception(self):
+        with self.assertRaises(KeyError):
+            self.overlay['missing']